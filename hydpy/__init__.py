@@ -27,94 +27,285 @@ if TYPE_CHECKING:
     from hydpy.cythons import configutils
 else:
     from hydpy.cythons.autogen import configutils
-from hydpy.core.auxfiletools import Auxfiler
-from hydpy.core.devicetools import Element, Elements, FusedVariable, Node, Nodes
-from hydpy.core.exceptiontools import AttributeNotReady, attrready, getattr_, hasattr_
-from hydpy.core.exceptiontools import HydPyDeprecationWarning
-from hydpy.core.filetools import check_projectstructure, create_projectstructure
-from hydpy.core.hydpytools import HydPy
-from hydpy.core.importtools import prepare_model, reverse_model_wildcard_import
-from hydpy.core.itemtools import AddItem, GetItem, MultiplyItem, SetItem
-from hydpy.core.netcdftools import chars2str, str2chars, summarise_ncfile, write_ncfile
-from hydpy.core.objecttools import classname, print_matrix, print_vector, round_, repr_
-from hydpy.core.parametertools import KeywordArguments
-from hydpy.core.selectiontools import Selection, Selections
-from hydpy.core.seriestools import aggregate_series
-from hydpy.core.timetools import Date, Period, Timegrid, Timegrids, TOY
-from hydpy.core.testtools import (
-    make_abc_testable,
-    NumericalDifferentiator,
-    IntegrationTest,
-    Open,
-    TestIO,
-    UnitTest,
-    update_integrationtests,
-)
-from hydpy.core.variabletools import INT_NAN, sort_variables
-from hydpy.auxs.armatools import ARMA, MA
-from hydpy.auxs.anntools import ANN
-from hydpy.auxs.calibtools import (
-    Add,
-    Adaptor,
-    CalibrationInterface,
-    CalibSpec,
-    CalibSpecs,
-    FactorAdaptor,
-    LogReplace,
-    make_rules,
-    Multiply,
-    MultiplyIUH,
-    Replace,
-    ReplaceIUH,
-    Rule,
-    SumAdaptor,
-    TargetFunction,
-)
-from hydpy.auxs.interptools import SeasonalInterpolator
-from hydpy.auxs.iuhtools import LinearStorageCascade, TranslationDiffusionEquation
-from hydpy.auxs.networktools import (
-    RiverBasinNumber,
-    RiverBasinNumbers,
-    RiverBasinNumbers2Selection,
-)
-from hydpy.auxs.ppolytools import Poly, PPoly
-from hydpy.auxs.statstools import (
-    bias_abs,
-    bias_rel,
-    calc_mean_time,
-    calc_mean_time_deviation,
-    calc_weights,
-    corr,
-    corr2,
-    fdc_nse,
-    fdc_nse_log,
-    filter_series,
-    hsepd,
-    hsepd_manual,
-    hsepd_pdf,
-    kge,
-    nse,
-    nse_log,
-    prepare_arrays,
-    print_evaluationtable,
-    rmse,
-    std_ratio,
-    SummaryRowSimple,
-    SummaryRowWeighted,
-    var_ratio,
-)
-from hydpy.exe.commandtools import (
-    exec_commands,
-    exec_script,
-    execute_scriptfunction,
-    run_doctests,
-    run_subprocess,
-    start_shell,
-    print_latest_logfile,
-)
-from hydpy.exe.replacetools import xml_replace
-from hydpy.exe.servertools import await_server, start_server
-from hydpy.exe.xmltools import XMLInterface, run_simulation, xml_validate
+
+# We import the following public members only when they are first requested (see
+# functions `__getattr__` and `__dir__` below) to keep importing `hydpy` fast.  At
+# runtime, `_module2names` is the only source of truth.  The imports of the following
+# `TYPE_CHECKING` block only serve static type checkers (script
+# `hydpy/tests/check_importtime.py` checks that both agree):
+if TYPE_CHECKING:
+    # pylint: disable=useless-import-alias
+    # the aliases mark explicit re-exports (see option `no_implicit_reexport`)
+    from hydpy.core.auxfiletools import Auxfiler as Auxfiler
+    from hydpy.core.devicetools import (
+        Element as Element,
+        Elements as Elements,
+        FusedVariable as FusedVariable,
+        Node as Node,
+        Nodes as Nodes,
+    )
+    from hydpy.core.exceptiontools import (
+        AttributeNotReady as AttributeNotReady,
+        attrready as attrready,
+        getattr_ as getattr_,
+        hasattr_ as hasattr_,
+        HydPyDeprecationWarning as HydPyDeprecationWarning,
+    )
+    from hydpy.core.filetools import (
+        check_projectstructure as check_projectstructure,
+        create_projectstructure as create_projectstructure,
+    )
+    from hydpy.core.hydpytools import HydPy as HydPy
+    from hydpy.core.importtools import (
+        prepare_model as prepare_model,
+        reverse_model_wildcard_import as reverse_model_wildcard_import,
+    )
+    from hydpy.core.itemtools import (
+        AddItem as AddItem,
+        GetItem as GetItem,
+        MultiplyItem as MultiplyItem,
+        SetItem as SetItem,
+    )
+    from hydpy.core.netcdftools import (
+        chars2str as chars2str,
+        str2chars as str2chars,
+        summarise_ncfile as summarise_ncfile,
+        write_ncfile as write_ncfile,
+    )
+    from hydpy.core.objecttools import (
+        classname as classname,
+        print_matrix as print_matrix,
+        print_vector as print_vector,
+        round_ as round_,
+        repr_ as repr_,
+    )
+    from hydpy.core.parametertools import KeywordArguments as KeywordArguments
+    from hydpy.core.selectiontools import (
+        Selection as Selection,
+        Selections as Selections,
+    )
+    from hydpy.core.seriestools import aggregate_series as aggregate_series
+    from hydpy.core.timetools import (
+        Date as Date,
+        Period as Period,
+        Timegrid as Timegrid,
+        Timegrids as Timegrids,
+        TOY as TOY,
+    )
+    from hydpy.core.testtools import (
+        make_abc_testable as make_abc_testable,
+        NumericalDifferentiator as NumericalDifferentiator,
+        IntegrationTest as IntegrationTest,
+        Open as Open,
+        TestIO as TestIO,
+        UnitTest as UnitTest,
+        update_integrationtests as update_integrationtests,
+    )
+    from hydpy.core.variabletools import (
+        INT_NAN as INT_NAN,
+        sort_variables as sort_variables,
+    )
+    from hydpy.auxs.armatools import ARMA as ARMA, MA as MA
+    from hydpy.auxs.anntools import ANN as ANN
+    from hydpy.auxs.calibtools import (
+        Add as Add,
+        Adaptor as Adaptor,
+        CalibrationInterface as CalibrationInterface,
+        CalibSpec as CalibSpec,
+        CalibSpecs as CalibSpecs,
+        FactorAdaptor as FactorAdaptor,
+        LogReplace as LogReplace,
+        make_rules as make_rules,
+        Multiply as Multiply,
+        MultiplyIUH as MultiplyIUH,
+        Replace as Replace,
+        ReplaceIUH as ReplaceIUH,
+        Rule as Rule,
+        SumAdaptor as SumAdaptor,
+        TargetFunction as TargetFunction,
+    )
+    from hydpy.auxs.interptools import SeasonalInterpolator as SeasonalInterpolator
+    from hydpy.auxs.iuhtools import (
+        LinearStorageCascade as LinearStorageCascade,
+        TranslationDiffusionEquation as TranslationDiffusionEquation,
+    )
+    from hydpy.auxs.networktools import (
+        RiverBasinNumber as RiverBasinNumber,
+        RiverBasinNumbers as RiverBasinNumbers,
+        RiverBasinNumbers2Selection as RiverBasinNumbers2Selection,
+    )
+    from hydpy.auxs.ppolytools import Poly as Poly, PPoly as PPoly
+    from hydpy.auxs.statstools import (
+        bias_abs as bias_abs,
+        bias_rel as bias_rel,
+        calc_mean_time as calc_mean_time,
+        calc_mean_time_deviation as calc_mean_time_deviation,
+        calc_weights as calc_weights,
+        corr as corr,
+        corr2 as corr2,
+        fdc_nse as fdc_nse,
+        fdc_nse_log as fdc_nse_log,
+        filter_series as filter_series,
+        hsepd as hsepd,
+        hsepd_manual as hsepd_manual,
+        hsepd_pdf as hsepd_pdf,
+        kge as kge,
+        nse as nse,
+        nse_log as nse_log,
+        prepare_arrays as prepare_arrays,
+        print_evaluationtable as print_evaluationtable,
+        rmse as rmse,
+        std_ratio as std_ratio,
+        SummaryRowSimple as SummaryRowSimple,
+        SummaryRowWeighted as SummaryRowWeighted,
+        var_ratio as var_ratio,
+    )
+    from hydpy.exe.commandtools import (
+        exec_commands as exec_commands,
+        exec_script as exec_script,
+        execute_scriptfunction as execute_scriptfunction,
+        run_doctests as run_doctests,
+        run_subprocess as run_subprocess,
+        start_shell as start_shell,
+        print_latest_logfile as print_latest_logfile,
+    )
+    from hydpy.exe.replacetools import xml_replace as xml_replace
+    from hydpy.exe.servertools import (
+        await_server as await_server,
+        start_server as start_server,
+    )
+    from hydpy.exe.xmltools import (
+        XMLInterface as XMLInterface,
+        run_simulation as run_simulation,
+        xml_validate as xml_validate,
+    )
+    from hydpy.cythons.modelutils import cythonize_models as cythonize_models
+
+_module2names: dict[str, tuple[str, ...]] = {
+    "hydpy.core.auxfiletools": ("Auxfiler",),
+    "hydpy.core.devicetools": ("Element", "Elements", "FusedVariable", "Node", "Nodes"),
+    "hydpy.core.exceptiontools": (
+        "AttributeNotReady",
+        "attrready",
+        "getattr_",
+        "hasattr_",
+        "HydPyDeprecationWarning",
+    ),
+    "hydpy.core.filetools": ("check_projectstructure", "create_projectstructure"),
+    "hydpy.core.hydpytools": ("HydPy",),
+    "hydpy.core.importtools": ("prepare_model", "reverse_model_wildcard_import"),
+    "hydpy.core.itemtools": ("AddItem", "GetItem", "MultiplyItem", "SetItem"),
+    "hydpy.core.netcdftools": (
+        "chars2str",
+        "str2chars",
+        "summarise_ncfile",
+        "write_ncfile",
+    ),
+    "hydpy.core.objecttools": (
+        "classname",
+        "print_matrix",
+        "print_vector",
+        "round_",
+        "repr_",
+    ),
+    "hydpy.core.parametertools": ("KeywordArguments",),
+    "hydpy.core.selectiontools": ("Selection", "Selections"),
+    "hydpy.core.seriestools": ("aggregate_series",),
+    "hydpy.core.timetools": ("Date", "Period", "Timegrid", "Timegrids", "TOY"),
+    "hydpy.core.testtools": (
+        "make_abc_testable",
+        "NumericalDifferentiator",
+        "IntegrationTest",
+        "Open",
+        "TestIO",
+        "UnitTest",
+        "update_integrationtests",
+    ),
+    "hydpy.core.variabletools": ("INT_NAN", "sort_variables"),
+    "hydpy.auxs.armatools": ("ARMA", "MA"),
+    "hydpy.auxs.anntools": ("ANN",),
+    "hydpy.auxs.calibtools": (
+        "Add",
+        "Adaptor",
+        "CalibrationInterface",
+        "CalibSpec",
+        "CalibSpecs",
+        "FactorAdaptor",
+        "LogReplace",
+        "make_rules",
+        "Multiply",
+        "MultiplyIUH",
+        "Replace",
+        "ReplaceIUH",
+        "Rule",
+        "SumAdaptor",
+        "TargetFunction",
+    ),
+    "hydpy.auxs.interptools": ("SeasonalInterpolator",),
+    "hydpy.auxs.iuhtools": ("LinearStorageCascade", "TranslationDiffusionEquation"),
+    "hydpy.auxs.networktools": (
+        "RiverBasinNumber",
+        "RiverBasinNumbers",
+        "RiverBasinNumbers2Selection",
+    ),
+    "hydpy.auxs.ppolytools": ("Poly", "PPoly"),
+    "hydpy.auxs.statstools": (
+        "bias_abs",
+        "bias_rel",
+        "calc_mean_time",
+        "calc_mean_time_deviation",
+        "calc_weights",
+        "corr",
+        "corr2",
+        "fdc_nse",
+        "fdc_nse_log",
+        "filter_series",
+        "hsepd",
+        "hsepd_manual",
+        "hsepd_pdf",
+        "kge",
+        "nse",
+        "nse_log",
+        "prepare_arrays",
+        "print_evaluationtable",
+        "rmse",
+        "std_ratio",
+        "SummaryRowSimple",
+        "SummaryRowWeighted",
+        "var_ratio",
+    ),
+    "hydpy.exe.commandtools": (
+        "exec_commands",
+        "exec_script",
+        "execute_scriptfunction",
+        "run_doctests",
+        "run_subprocess",
+        "start_shell",
+        "print_latest_logfile",
+    ),
+    "hydpy.exe.replacetools": ("xml_replace",),
+    "hydpy.exe.servertools": ("await_server", "start_server"),
+    "hydpy.exe.xmltools": ("XMLInterface", "run_simulation", "xml_validate"),
+    "hydpy.cythons.modelutils": ("cythonize_models",),
+}
+_name2module = {
+    name: module for module, names in _module2names.items() for name in names
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        modulename = _name2module[name]
+    except KeyError:
+        raise AttributeError(f"module `hydpy` has no attribute `{name}`") from None
+    value = getattr(importlib.import_module(modulename), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()).union(_name2module))
+
 
 __version__ = "6.5dev0"
 
@@ -122,130 +313,18 @@ pub.options = optiontools.Options()
 pub.indexer = indextools.Indexer()
 pub.config = configutils.Config()
 
-pub.scriptfunctions["await_server"] = await_server
-pub.scriptfunctions["exec_commands"] = exec_commands
-pub.scriptfunctions["exec_script"] = exec_script
-pub.scriptfunctions["run_doctests"] = run_doctests
-pub.scriptfunctions["run_simulation"] = run_simulation
-pub.scriptfunctions["start_shell"] = start_shell
-pub.scriptfunctions["start_server"] = start_server
-pub.scriptfunctions["xml_replace"] = xml_replace
-pub.scriptfunctions["xml_validate"] = xml_validate
+pub.scriptfunctions["await_server"] = _name2module["await_server"]
+pub.scriptfunctions["cythonize_models"] = _name2module["cythonize_models"]
+pub.scriptfunctions["exec_commands"] = _name2module["exec_commands"]
+pub.scriptfunctions["exec_script"] = _name2module["exec_script"]
+pub.scriptfunctions["run_doctests"] = _name2module["run_doctests"]
+pub.scriptfunctions["run_simulation"] = _name2module["run_simulation"]
+pub.scriptfunctions["start_shell"] = _name2module["start_shell"]
+pub.scriptfunctions["start_server"] = _name2module["start_server"]
+pub.scriptfunctions["xml_replace"] = _name2module["xml_replace"]
+pub.scriptfunctions["xml_validate"] = _name2module["xml_validate"]
 
-__all__ = [
-    "config",
-    "pub",
-    "Auxfiler",
-    "Element",
-    "Elements",
-    "FusedVariable",
-    "Node",
-    "Nodes",
-    "AttributeNotReady",
-    "attrready",
-    "getattr_",
-    "hasattr_",
-    "HydPyDeprecationWarning",
-    "check_projectstructure",
-    "create_projectstructure",
-    "HydPy",
-    "prepare_model",
-    "reverse_model_wildcard_import",
-    "AddItem",
-    "GetItem",
-    "MultiplyItem",
-    "SetItem",
-    "chars2str",
-    "str2chars",
-    "summarise_ncfile",
-    "write_ncfile",
-    "classname",
-    "print_matrix",
-    "print_vector",
-    "repr_",
-    "round_",
-    "KeywordArguments",
-    "Selection",
-    "Selections",
-    "aggregate_series",
-    "Date",
-    "Period",
-    "Timegrid",
-    "Timegrids",
-    "TOY",
-    "make_abc_testable",
-    "NumericalDifferentiator",
-    "IntegrationTest",
-    "Open",
-    "TestIO",
-    "INT_NAN",
-    "sort_variables",
-    "UnitTest",
-    "update_integrationtests",
-    "ARMA",
-    "MA",
-    "ANN",
-    "Adaptor",
-    "Add",
-    "CalibrationInterface",
-    "CalibSpec",
-    "CalibSpecs",
-    "FactorAdaptor",
-    "make_rules",
-    "Multiply",
-    "MultiplyIUH",
-    "Replace",
-    "ReplaceIUH",
-    "Rule",
-    "SumAdaptor",
-    "TargetFunction",
-    "SeasonalInterpolator",
-    "LinearStorageCascade",
-    "LogReplace",
-    "TranslationDiffusionEquation",
-    "RiverBasinNumber",
-    "RiverBasinNumbers",
-    "RiverBasinNumbers2Selection",
-    "Poly",
-    "PPoly",
-    "nan",
-    "bias_abs",
-    "bias_rel",
-    "calc_mean_time",
-    "calc_mean_time_deviation",
-    "calc_weights",
-    "corr",
-    "corr2",
-    "fdc_nse",
-    "fdc_nse_log",
-    "filter_series",
-    "hsepd",
-    "hsepd_manual",
-    "hsepd_pdf",
-    "kge",
-    "nse",
-    "nse_log",
-    "prepare_arrays",
-    "print_evaluationtable",
-    "rmse",
-    "std_ratio",
-    "SummaryRowSimple",
-    "SummaryRowWeighted",
-    "var_ratio",
-    "XMLInterface",
-    "run_simulation",
-    "xml_validate",
-    "exec_commands",
-    "exec_script",
-    "execute_scriptfunction",
-    "start_shell",
-    "run_doctests",
-    "run_subprocess",
-    "print_latest_logfile",
-    "xml_replace",
-    "await_server",
-    "start_server",
-]
+__all__ = ["config", "pub", "nan", *_name2module]
 
 sequence2alias: dict[sequencetools.InOutSequenceTypes, str] = {}
 
@@ -1189,6 +1189,65 @@ broadcast input array from shape (3,3) into shape (2,3)
         """
         self._calgorithm.calculate_values()
 
+    def calculate_values_batch(
+        self, xs: VectorInputFloat | MatrixInputFloat
+    ) -> MatrixFloat:
+        """Calculate the output values for multiple input vectors at once.
+
+        Method |ANN.calculate_values_batch| works like method
+        |InterpAlgorithm.calculate_values_batch| but evaluates all input vectors
+        within a single call to the Cython extension class |annutils.ANN|:
+
+        >>> from hydpy import ANN, nan, print_matrix
+        >>> ann = ANN(nmb_inputs=2, nmb_neurons=(2, 1), nmb_outputs=1,
+        ...           weights_input=[[1000.0, 500.0],
+        ...                          [1000.0, 500.0]],
+        ...           weights_hidden=[[[1000.0],
+        ...                            [-1000.0]]],
+        ...           weights_output=[[1.0]],
+        ...           intercepts_hidden=[[-750.0, -750.0],
+        ...                              [-750.0, nan]],
+        ...           intercepts_output=[0.0])
+        >>> print_matrix(ann.calculate_values_batch(
+        ...     [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]))
+        | 0.0 |
+        | 1.0 |
+        | 1.0 |
+        | 0.0 |
+        >>> ann.inputs, ann.outputs
+        (array([1., 1.]), array([0.]))
+
+        The input matrix must provide one column for each input value:
+
+        >>> ann.calculate_values_batch([0.0, 1.0])
+        Traceback (most recent call last):
+        ...
+        ValueError: The batch input for ANN objects must be a matrix with 2 \
+column(s), but the given data has the shape (2, 1).
+        """
+        xs = self._prepare_batch(xs)
+        ys = numpy.empty((len(xs), self.nmb_outputs), dtype=config.NP_FLOAT)
+        self._calgorithm.calculate_values_batch(xs, ys)
+        return ys
+
+    def calculate_derivatives_batch(
+        self, xs: VectorInputFloat | MatrixInputFloat
+    ) -> TensorFloat:
+        """Calculate the derivatives of all output values with respect to all input
+        values for multiple input vectors at once.
+
+        Method |ANN.calculate_derivatives_batch| works like method
+        |InterpAlgorithm.calculate_derivatives_batch| but evaluates all input vectors
+        within a single call to the Cython extension class |annutils.ANN|.  See the
+        documentation on method |InterpAlgorithm.print_table|, which relies on it.
+        """
+        xs = self._prepare_batch(xs)
+        dys = numpy.empty(
+            (len(xs), self.nmb_inputs, self.nmb_outputs), dtype=config.NP_FLOAT
+        )
+        self._calgorithm.calculate_derivatives_batch(xs, dys)
+        return dys
+
     def calculate_derivatives(self, idx: int, /) -> None:
         """Calculate the derivatives of the network output values with respect to the
         input value of the given index.
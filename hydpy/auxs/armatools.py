@@ -19,11 +19,13 @@ if TYPE_CHECKING:
     from matplotlib import figure
     from matplotlib import pyplot
     from scipy import integrate
+    from scipy import signal
 else:
     pyplot = exceptiontools.OptionalImport("pyplot", ["matplotlib.pyplot"], locals())
     integrate = exceptiontools.OptionalImport(
         "integrate", ["scipy.integrate"], locals()
     )
+    signal = exceptiontools.OptionalImport("signal", ["scipy.signal"], locals())
 
 
 class MA:
@@ -1046,3 +1048,91 @@ far.
             f"{objecttools.assignrepr_tuple(self.ar_coefs, 'ARMA(ar_coefs=', 70)},\n"
             f"{objecttools.assignrepr_tuple(self.ma_coefs, '     ma_coefs=', 70)})"
         )
+
+
+def convolve(values: VectorInputFloat, coefs: VectorInputFloat) -> VectorFloat:
+    """Return the first `len(values)` entries of the discrete convolution of the given
+    values and coefficients.
+
+    For short coefficient vectors, |convolve| relies on the direct summation of
+    function |numpy.convolve|.  For long ones, it switches to the fast Fourier
+    transform, which reduces the computation time from quadratic to log-linear:
+
+    >>> from hydpy.auxs.armatools import convolve
+    >>> from hydpy import print_vector
+    >>> print_vector(convolve([1.0, 2.0, 3.0, 0.0, 0.0], [0.5, 0.3, 0.2]))
+    0.5, 1.3, 2.3, 1.3, 0.6
+    >>> import numpy
+    >>> values = numpy.random.random(10000)
+    >>> coefs = numpy.random.random(1000)
+    >>> numpy.allclose(convolve(values, coefs), numpy.convolve(values, coefs)[:10000])
+    True
+    """
+    values = numpy.asarray(values, dtype=config.NP_FLOAT)
+    coefs = numpy.asarray(coefs, dtype=config.NP_FLOAT)
+    nmb_values = len(values)
+    if min(nmb_values, len(coefs)) < 64:
+        return numpy.convolve(values, coefs)[:nmb_values]
+    nmb_fft = 2 ** int(numpy.ceil(numpy.log2(nmb_values + len(coefs) - 1)))
+    spectrum = numpy.fft.rfft(values, nmb_fft) * numpy.fft.rfft(coefs, nmb_fft)
+    return numpy.fft.irfft(spectrum, nmb_fft)[:nmb_values]
+
+
+def route_series(
+    inputs: VectorInputFloat,
+    *,
+    ma_coefs: VectorInputFloat,
+    ar_coefs: VectorInputFloat = (),
+    ma_memory: VectorInputFloat | None = None,
+    ar_memory: VectorInputFloat | None = None,
+) -> VectorFloat:
+    """Route a complete input series through an ARMA process at once.
+
+    Linear routing models like |arma_rimorido| apply their MA and AR coefficients
+    step by step, which requires `len(inputs) * order` scalar operations.  If the
+    complete input series is known in advance, function |route_series| computes the
+    same output series in one go.  It determines the MA part via function
+    |convolve| and the AR part via function `lfilter` of module `scipy.signal`.
+
+    The optional arguments `ma_memory` and `ar_memory` define the initial
+    conditions, ordered like the rows of the log sequences |arma_logs.LogIn| and
+    |arma_logs.LogOut| (the most recent value first).  Without memory, function
+    |route_series| starts from zero values:
+
+    >>> from hydpy.auxs.armatools import route_series
+    >>> from hydpy import print_vector
+    >>> print_vector(route_series([1.0, 0.0, 0.0, 0.0], ma_coefs=[0.6, 0.4]))
+    0.6, 0.4, 0.0, 0.0
+    >>> print_vector(route_series([1.0, 0.0, 0.0, 0.0], ma_coefs=[0.6, 0.4],
+    ...                           ma_memory=[2.0, 2.0]))
+    1.4, 0.4, 0.0, 0.0
+    >>> print_vector(route_series([1.0, 0.0, 0.0, 0.0], ma_coefs=[0.5],
+    ...                           ar_coefs=[0.5], ar_memory=[2.0]))
+    1.5, 0.75, 0.375, 0.1875
+
+    See the documentation on method |arma_rimorido.Model.route_series| of
+    application model |arma_rimorido| for a practical example.
+    """
+    inputs = numpy.asarray(inputs, dtype=config.NP_FLOAT)
+    ma_coefs = numpy.asarray(ma_coefs, dtype=config.NP_FLOAT)
+    ar_coefs = numpy.asarray(ar_coefs, dtype=config.NP_FLOAT)
+    ma_order, ar_order = len(ma_coefs), len(ar_coefs)
+    if ma_order == 0:
+        outputs = numpy.zeros(len(inputs), dtype=config.NP_FLOAT)
+    else:
+        if ma_memory is None:
+            ma_memory = numpy.zeros(ma_order - 1, dtype=config.NP_FLOAT)
+        else:
+            ma_memory = numpy.asarray(ma_memory, dtype=config.NP_FLOAT)
+            ma_memory = ma_memory[: ma_order - 1]
+        extended = numpy.concatenate((ma_memory[::-1], inputs))
+        outputs = convolve(extended, ma_coefs)[ma_order - 1 :]
+    if ar_order > 0:
+        denominator = numpy.concatenate(([1.0], -ar_coefs))
+        if ar_memory is None:
+            outputs = signal.lfilter([1.0], denominator, outputs)
+        else:
+            ar_memory = numpy.asarray(ar_memory, dtype=config.NP_FLOAT)[:ar_order]
+            zi = signal.lfiltic([1.0], denominator, ar_memory)
+            outputs = signal.lfilter([1.0], denominator, outputs, zi=zi)[0]
+    return outputs
@@ -8,6 +8,7 @@ import abc
 import collections
 import itertools
 import math
+import os
 import time
 import types
 import warnings
@@ -32,6 +33,10 @@ from hydpy.core.typingtools import *
 if TYPE_CHECKING:
     from hydpy.models.arma import arma_control
 
+_BINARYLOGMAGIC = b"HydPy-Calibration-Log\n"
+_BINARYLOGALIGNMENT = 8
+_BINARYLOGSIZEDIGITS = 15
+
 TypeParameter = TypeVar("TypeParameter", bound=parametertools.Parameter)
 TypeRule1 = TypeVar(
     "TypeRule1", bound=Union["Replace", "Add", "Multiply", "ReplaceIUH", "MultiplyIUH"]
@@ -279,6 +284,7 @@ class FactorAdaptor(Adaptor):
         if self._mask:
             mask = ref.get_submask(self._mask)
             values = ref.values[mask] if ref.NDIM else ref.value
+            target.unshare()
             target.values[mask] = self._rule.value * values
         else:
             target.value = self._rule.value * ref.value
@@ -1178,6 +1184,158 @@ hp.elements.stream_lahn_marb_lahn_leun.model.parameters.control.nmbsegments
                 self._update_parameter(parameter, self.value * orig)
 
 
+def write_binarylogheader(
+    logfilepath: str, lines: Iterable[str], magic: bytes = _BINARYLOGMAGIC
+) -> int:
+    """Create a new binary log file that only contains a header and return the
+    header's size in bytes.
+
+    The header starts with the given identifier (`magic`), followed by its own size
+    and the given text lines.  Blanks pad it to a multiple of eight bytes, so that all
+    subsequent records of 64-bit floating point numbers are properly aligned:
+
+    >>> from hydpy.auxs.calibtools import (
+    ...     append_binarylogrecords, read_binarylogheader, read_binarylogrecords,
+    ...     write_binarylogheader)
+    >>> from hydpy import print_matrix, TestIO
+    >>> with TestIO():
+    ...     write_binarylogheader("test.bin", ["a", "b"], magic=b"Test\\n")
+    ...     with open("test.bin", "rb") as file_:
+    ...         print(file_.read())
+    32
+    b'Test\\n000000000000032\\na\\nb\\n       '
+
+    Function |append_binarylogrecords| appends new records after cutting off
+    incomplete records left by previously interrupted write attempts:
+
+    >>> import numpy
+    >>> with TestIO():
+    ...     records = numpy.arange(6.0).reshape(3, 2)
+    ...     append_binarylogrecords("test.bin", 32, 2, records.tobytes())
+    ...     with open("test.bin", "ab") as file_:
+    ...         _ = file_.write(b"incomplete")
+    ...     append_binarylogrecords("test.bin", 32, 2, records[:1].tobytes())
+
+    Function |read_binarylogheader| returns the header's size and all non-empty
+    lines, and function |read_binarylogrecords| returns all complete records:
+
+    >>> with TestIO():
+    ...     read_binarylogheader("test.bin", magic=b"Test\\n")
+    ...     print_matrix(read_binarylogrecords("test.bin", 32, 2))
+    (32, ('a', 'b'))
+    | 0.0, 1.0 |
+    | 2.0, 3.0 |
+    | 4.0, 5.0 |
+    | 0.0, 1.0 |
+
+    |read_binarylogheader| checks the identifier:
+
+    >>> with TestIO():
+    ...     read_binarylogheader("test.bin")
+    Traceback (most recent call last):
+    ...
+    RuntimeError: File `test.bin` is not a binary log file of the expected type.
+    """
+    text = ("\n".join(lines) + "\n").encode(config.ENCODING)
+    headersize = len(magic) + _BINARYLOGSIZEDIGITS + 1 + len(text)
+    headersize += -headersize % _BINARYLOGALIGNMENT
+    header = magic + f"{headersize:0{_BINARYLOGSIZEDIGITS}d}\n".encode(config.ENCODING)
+    header += text
+    header += b" " * (headersize - len(header))
+    with open(logfilepath, "wb") as logfile:
+        logfile.write(header)
+    return headersize
+
+
+def is_binarylogfile(logfilepath: str, magic: bytes = _BINARYLOGMAGIC) -> bool:
+    """Return |True| if the given file starts with the given binary log file
+    identifier.
+
+    See the documentation on function |write_binarylogheader| for further
+    information.
+    """
+    with open(logfilepath, "rb") as logfile:
+        return logfile.read(len(magic)) == magic
+
+
+def read_binarylogheader(
+    logfilepath: str, magic: bytes = _BINARYLOGMAGIC
+) -> tuple[int, tuple[str, ...]]:
+    """Read the header of a binary log file and return its size and non-empty lines.
+
+    See the documentation on function |write_binarylogheader| for further
+    information.
+    """
+    with open(logfilepath, "rb") as logfile:
+        prefix = logfile.read(len(magic) + _BINARYLOGSIZEDIGITS + 1)
+        if not prefix.startswith(magic):
+            raise RuntimeError(
+                f"File `{logfilepath}` is not a binary log file of the expected type."
+            )
+        try:
+            headersize = int(prefix[len(magic) :])
+        except ValueError:
+            raise RuntimeError(
+                f"The header of the binary log file `{logfilepath}` does not define "
+                f"its size."
+            ) from None
+        text = logfile.read(headersize - len(prefix))
+    if len(prefix) + len(text) < headersize:
+        raise RuntimeError(
+            f"The header of the binary log file `{logfilepath}` is incomplete."
+        )
+    lines = text.decode(config.ENCODING).split("\n")
+    return headersize, tuple(line for line in lines if line.strip())
+
+
+def read_binarylogrecords(
+    logfilepath: str, headersize: int, recordsize: int
+) -> MatrixFloat:
+    """Return all complete records of a binary log file, each one consisting of
+    `recordsize` 64-bit floating point numbers.
+
+    See the documentation on function |write_binarylogheader| for further
+    information.
+    """
+    nmbrecords = (os.path.getsize(logfilepath) - headersize) // (8 * recordsize)
+    if not nmbrecords:
+        return numpy.empty((0, recordsize), dtype=numpy.float64)
+    return numpy.memmap(
+        logfilepath,
+        dtype=numpy.float64,
+        mode="r",
+        offset=headersize,
+        shape=(nmbrecords, recordsize),
+    )
+
+
+def append_binarylogrecords(
+    logfilepath: str,
+    headersize: int,
+    recordsize: int,
+    records: bytes,
+    fsync: bool = False,
+) -> None:
+    """Append the given records to a binary log file.
+
+    |append_binarylogrecords| first cuts off incomplete records left by previously
+    interrupted write attempts.  Set `fsync` to |True| to force the operating system
+    to write the new records to disk immediately.
+
+    See the documentation on function |write_binarylogheader| for further
+    information.
+    """
+    with open(logfilepath, "r+b") as logfile:
+        datasize = logfile.seek(0, os.SEEK_END) - headersize
+        if datasize % (8 * recordsize):
+            logfile.seek(headersize + datasize // (8 * recordsize) * (8 * recordsize))
+            logfile.truncate()
+        logfile.write(records)
+        if fsync:
+            logfile.flush()
+            os.fsync(logfile.fileno())
+
+
 class CalibrationInterface(Generic[TypeRule1]):
     """Interface for coupling HydPy to optimisation libraries like `NLopt`_.
 
@@ -1684,6 +1842,63 @@ does not agree with the one documentated in log file `example_calibration.log` (
     0.5
     >>> ci.k4.value
     0.05
+
+    Writing and parsing text lines becomes a bottleneck for long calibration runs
+    with many evaluations.  Then, you can pass |True| to the `binary` argument of
+    method |CalibrationInterface.prepare_logfile|.  The binary log file starts with a
+    short text header, which documents its own size in bytes, the rule names, their
+    parameter steps, and their boundaries:
+
+    >>> with TestIO():   # doctest: +NORMALIZE_WHITESPACE
+    ...     ci.prepare_logfile(logfilepath="example_calibration.bin",
+    ...                        objectivefunction="NSE",
+    ...                        binary=True)
+    ...     with open("example_calibration.bin", "rb") as file_:
+    ...         print(file_.read().decode().strip())
+    HydPy-Calibration-Log
+    000000000000144
+    NSE	fc	damp	k4	beta
+    parameterstep	None	None	1d	None
+    lower	50.0	0.0	0.005	1.0
+    upper	200.0	0.5	0.05	4.0
+
+    Each calibration step then appends a record of 64-bit floating point numbers
+    containing the result and the current rule values:
+
+    >>> with TestIO():
+    ...     find_max(function=ci.perform_calibrationstep,
+    ...              lowers=ci.lowers_transformed,
+    ...              uppers=ci.uppers_transformed,
+    ...              inits=ci.values_transformed)
+
+    |CalibrationInterface.read_logfile| recognises binary log files automatically
+    and memory-maps their records, so that selecting the best result does not require
+    parsing the file:
+
+    >>> with TestIO():
+    ...     ci.read_logfile(logfilepath="example_calibration.bin", maximisation=True)
+    >>> ci.beta.value, ci.damp.value, ci.fc.value, ci.k4.value
+    (2.0, 0.5, 200.0, 0.05)
+    >>> round_(ci.result)
+    -5.840606
+
+    A process crash might leave an incomplete record at the end of a binary log file.
+    |CalibrationInterface.read_logfile| ignores it, and the next call to
+    |CalibrationInterface.update_logfile| overwrites it:
+
+    >>> with TestIO():
+    ...     with open("example_calibration.bin", "ab") as file_:
+    ...         _ = file_.write(b"incomplete")
+    ...     ci.read_logfile(logfilepath="example_calibration.bin", maximisation=False)
+    ...     round_(ci.result)
+    ...     size = os.path.getsize("example_calibration.bin")
+    ...     ci.update_logfile()
+    ...     os.path.getsize("example_calibration.bin") - size
+    ...     ci.read_logfile(logfilepath="example_calibration.bin", maximisation=False)
+    ...     round_(ci.result)
+    -197.900667
+    30
+    -197.900667
     """
 
     result: float | None
@@ -1694,12 +1909,22 @@ does not agree with the one documentated in log file `example_calibration.log` (
     |CalibrationInterface| queries the conditions during its initialisation and uses 
     them later to reset all relevant conditions before each new simulation run.
     """
+    spinupcache: hydpytools.SpinupCache | None
+    """The optional |SpinupCache| object for skipping redundant warm-up periods.
+
+    See method |CalibrationInterface.prepare_spinupcache| for further information.
+    """
     _logfilepath: str | None
     _logfilelines: collections.deque[str]
+    _logfilerecords: collections.deque[bytes]
+    _logfilebinary: bool
+    _logfileheadersize: int
+    _logfilefsync: bool
     _hp: hydpytools.HydPy
     _targetfunction: TargetFunction
     _rules: dict[str, TypeRule1]
     _elements: devicetools.Elements
+    _spinuprules: tuple[TypeRule1, ...] | None
 
     def __init__(self, hp: hydpytools.HydPy, targetfunction: TargetFunction) -> None:
         self._hp = hp
@@ -1709,7 +1934,13 @@ does not agree with the one documentated in log file `example_calibration.log` (
         self._elements = devicetools.Elements()
         self._logfilepath = None
         self._logfilelines = collections.deque()
+        self._logfilerecords = collections.deque()
+        self._logfilebinary = False
+        self._logfileheadersize = 0
+        self._logfilefsync = False
         self.result = None
+        self.spinupcache = None
+        self._spinuprules = None
 
     def add_rules(self, *rules: TypeRule1) -> None:
         """Add some |Rule| objects to the actual |CalibrationInterface| object.
@@ -1871,35 +2102,185 @@ object named `fc`.
                 ) from None
         self._update_elements_when_deleting_a_rule()
 
+    def prepare_spinupcache(
+        self, rules: Iterable[str | TypeRule1] | None = None, maxsize: int = 100
+    ) -> None:
+        """Prepare a |SpinupCache| object for skipping the simulation of the warm-up
+        period whenever possible.
+
+        We prepare the `Lahn` example project for a period of ten days, of which we
+        consider the first five days as the warm-up period:
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> hp, pub, TestIO = prepare_full_example_2(lastdate="1996-01-11")
+        >>> pub.timegrids.eval_.firstdate = "1996-01-06"
+
+        Our target function calculates the |nse| values of the evaluation period
+        only, and we calibrate the parameters |hland_control.FC| and
+        |musk_control.Coefficients|:
+
+        >>> from hydpy import CalibrationInterface, nse, Replace, round_
+        >>> ci = CalibrationInterface(
+        ...     hp=hp,
+        ...     targetfunction=lambda: sum(nse(node=node) for node in hp.nodes))
+        >>> ci.add_rules(
+        ...     Replace(name="fc", parameter="fc", value=100.0, model="hland_96"),
+        ...     Replace(name="damp", parameter="coefficients", value=0.2,
+        ...             keyword="damp", model="musk_classic"))
+        >>> hp.simulate()
+        >>> for node in hp.nodes:
+        ...     node.sequences.obs.series = node.sequences.sim.series
+        >>> round_(ci.apply_values())
+        -14.212554
+
+        Without further information, |CalibrationInterface| passes |None| as the key
+        to method |SpinupCache.simulate|, which then calculates hash values based on
+        all parameter values and conditions.  This approach is safe but requires
+        some computational effort.  For our example, it is more efficient to restrict
+        the key to the values of all rules that affect the warm-up period.  If we,
+        for example, decide to accept an imperfect warm-up of the routing storages,
+        we can limit the key to the value of the `fc` rule:
+
+        >>> ci.prepare_spinupcache(rules=["fc"])
+        >>> round_(ci.apply_values())
+        -14.212554
+        >>> ci.damp.value = 0.0
+        >>> round_(ci.apply_values())
+        -14.251486
+        >>> len(ci.spinupcache), ci.spinupcache.nmbhits
+        (1, 1)
+
+        Changing the value of rule `fc` results in a complete simulation run:
+
+        >>> ci.fc.value = 200.0
+        >>> round_(ci.apply_values())
+        -6.107205
+        >>> len(ci.spinupcache), ci.spinupcache.nmbhits
+        (2, 1)
+
+        Pass an empty list to fix the warm-up period.  Then,
+        |CalibrationInterface| performs only one complete simulation run:
+
+        >>> ci.prepare_spinupcache(rules=[])
+        >>> round_(ci.apply_values())
+        -6.107205
+        >>> ci.fc.value = 100.0
+        >>> round_(ci.apply_values())
+        -10.887909
+        >>> len(ci.spinupcache), ci.spinupcache.nmbhits
+        (1, 1)
+
+        Regardless of the selected rules, |SpinupCache| considers the warm-up period
+        and its input data (see method |SpinupCache.calc_inputkey|).  Hence, shifting
+        the evaluation period results in another complete simulation run:
+
+        >>> pub.timegrids.eval_.firstdate = "1996-01-05"
+        >>> round_(ci.apply_values())
+        -4.720167
+        >>> len(ci.spinupcache), ci.spinupcache.nmbhits
+        (2, 1)
+        """
+        self.spinupcache = hydpytools.SpinupCache(hp=self._hp, maxsize=maxsize)
+        if rules is None:
+            self._spinuprules = None
+        else:
+            self._spinuprules = tuple(
+                self.get_rule(rule) if isinstance(rule, str) else rule for rule in rules
+            )
+
+    def _simulate(self) -> None:
+        if self.spinupcache is None:
+            self._hp.simulate()
+        elif self._spinuprules is None:
+            self.spinupcache.simulate()
+        else:
+            self.spinupcache.simulate(
+                key=tuple(rule.value for rule in self._spinuprules)
+            )
+
     def prepare_logfile(
         self,
         logfilepath: str,
         objectivefunction: str = "result",
         documentation: str | None = None,
+        binary: bool = False,
+        fsync: bool = False,
     ) -> None:
         """Prepare a log file.
 
         Use argument `objectivefunction` to describe the |TargetFunction| used for
         calculating the efficiency and argument `documentation` to add some information
-        to the header of the logfile.
+        to the header of the logfile.  Set argument `binary` to |True| to prepare a
+        binary log file, which is much faster to write and read for long calibration
+        runs.  Set argument `fsync` to |True| to force the operating system to write
+        each new record of a binary log file to disk immediately, which increases
+        safety against system crashes but costs time.
+
+        The header of a binary log file starts with a fixed identifier, followed by
+        its own size in bytes and (optionally) the documentation lines:
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> hp, pub, TestIO = prepare_full_example_2()
+        >>> from hydpy import CalibrationInterface, Replace, nse
+        >>> ci = CalibrationInterface(
+        ...     hp=hp, targetfunction=lambda: nse(node=hp.nodes.lahn_kalk))
+        >>> ci.add_rules(Replace(name="fc", parameter="fc", value=100.0,
+        ...                      lower=50.0, upper=200.0, model="hland_96"))
+        >>> with TestIO():   # doctest: +NORMALIZE_WHITESPACE
+        ...     ci.prepare_logfile(logfilepath="documented.bin",
+        ...                        documentation="first line\\n\\nthird line",
+        ...                        binary=True)
+        ...     with open("documented.bin", "rb") as file_:
+        ...         print(file_.read().decode().strip())
+        HydPy-Calibration-Log
+        000000000000120
+        # first line
+        #
+        # third line
+        result	fc
+        parameterstep	None
+        lower	50.0
+        upper	200.0
+
+        Neither the documentation lines nor the appended records affect reading the
+        header:
+
+        >>> ci.fc.value = 200.0
+        >>> _ = ci.apply_values()
+        >>> for node in hp.nodes:
+        ...     node.sequences.obs.series = node.sequences.sim.series
+        >>> with TestIO():
+        ...     for value in (100.0, 200.0, 150.0):
+        ...         ci.fc.value = value
+        ...         _ = ci.perform_calibrationstep(ci.values)
+        ...     ci.read_logfile(logfilepath="documented.bin", maximisation=True)
+        >>> ci.fc.value
+        200.0
 
         See the main documentation on class |CalibrationInterface| for further
         information.
         """
         self._logfilepath = logfilepath
         self._logfilelines = collections.deque()
-        with open(logfilepath, "w", encoding=config.ENCODING) as logfile:
-            if documentation:
-                lines = (f"# {line}" for line in documentation.split("\n"))
+        self._logfilerecords = collections.deque()
+        self._logfilebinary = binary
+        self._logfilefsync = fsync
+        lines: list[str] = []
+        if documentation:
+            lines.extend(f"# {line}" for line in documentation.split("\n"))
+            if not binary:
+                lines.append("")
+        lines.append("\t".join([objectivefunction] + list(self.names)))
+        steps = [str(rule.parameterstep) for rule in self]
+        lines.append("\t".join(["parameterstep"] + steps))
+        if binary:
+            lines.append("\t".join(["lower"] + [repr(v) for v in self.lowers]))
+            lines.append("\t".join(["upper"] + [repr(v) for v in self.uppers]))
+            self._logfileheadersize = write_binarylogheader(logfilepath, lines)
+        else:
+            with open(logfilepath, "w", encoding=config.ENCODING) as logfile:
                 logfile.write("\n".join(lines))
-                logfile.write("\n\n")
-            logfile.write(f"{objectivefunction}\t")
-            names = (rule.name for rule in self)
-            logfile.write("\t".join(names))
-            logfile.write("\n")
-            steps = [str(rule.parameterstep) for rule in self]
-            logfile.write("\t".join(["parameterstep"] + steps))
-            logfile.write("\n")
+                logfile.write("\n")
 
     def update_logfile(self) -> None:
         """Update the current log file, if available.
@@ -1908,9 +2289,17 @@ object named `fc`.
         information.
         """
         if self._logfilepath:
-            result = objecttools.repr_(self.result)
-            values = "\t".join(objecttools.repr_(value) for value in self.values)
-            self._logfilelines.append(f"{result}\t{values}\n")
+            if self._logfilebinary:
+                record = numpy.array(
+                    [numpy.nan if self.result is None else self.result]
+                    + list(self.values),
+                    dtype=numpy.float64,
+                )
+                self._logfilerecords.append(record.tobytes())
+            else:
+                result = objecttools.repr_(self.result)
+                values = "\t".join(objecttools.repr_(value) for value in self.values)
+                self._logfilelines.append(f"{result}\t{values}\n")
             try:
                 self._write_data_into_logfile()
             except BaseException as exc:
@@ -1928,7 +2317,7 @@ object named `fc`.
         """
         if self._logfilepath:
             counter = 0
-            while self._logfilelines:
+            while self._logfilelines or self._logfilerecords:
                 try:
                     self._write_data_into_logfile()
                 except BaseException:
@@ -1941,24 +2330,42 @@ object named `fc`.
 
     def _write_data_into_logfile(self) -> None:
         assert self._logfilepath
-        with open(self._logfilepath, "a", encoding=config.ENCODING) as logfile:
-            while self._logfilelines:
-                logfile.write(self._logfilelines.popleft())
+        if self._logfilebinary:
+            append_binarylogrecords(
+                logfilepath=self._logfilepath,
+                headersize=self._logfileheadersize,
+                recordsize=len(self) + 1,
+                records=b"".join(self._logfilerecords),
+                fsync=self._logfilefsync,
+            )
+            self._logfilerecords.clear()
+        else:
+            with open(self._logfilepath, "a", encoding=config.ENCODING) as logfile:
+                while self._logfilelines:
+                    logfile.write(self._logfilelines.popleft())
 
     def read_logfile(
         self, logfilepath: str, maximisation: bool, check: bool = True
     ) -> None:
         """Read the log file with the given file path.
 
+        |CalibrationInterface.read_logfile| automatically detects whether the log file
+        is a text or a binary file.
+
         See the main documentation on class |CalibrationInterface| for further
         information.
         """
-        with open(logfilepath, encoding=config.ENCODING) as logfile:
-            lines = tuple(
-                line
-                for line in logfile  # pylint: disable=not-an-iterable
-                if (line.strip() and (not line.startswith("#")))
-            )
+        headersize = 0
+        if binary := is_binarylogfile(logfilepath):
+            headersize, headerlines = read_binarylogheader(logfilepath)
+            lines = tuple(line for line in headerlines if not line.startswith("#"))
+        else:
+            with open(logfilepath, encoding=config.ENCODING) as logfile:
+                lines = tuple(
+                    line
+                    for line in logfile
+                    if (line.strip() and (not line.startswith("#")))
+                )
         idx2name, idx2rule = {}, {}
         parameterstep: str | timetools.Period | None
         for idx, (name, parameterstep) in enumerate(
@@ -1974,7 +2381,7 @@ object named `fc`.
                     raise RuntimeError(
                         f"The current parameterstep of the `{type(rule).__name__}` "
                         f"rule `{rule.name}` (`{rule.parameterstep}`) does not agree "
-                        f"with the one documentated in log file `{self._logfilepath}` "
+                        f"with the one documentated in log file `{logfilepath}` "
                         f"(`{parameterstep}`)."
                     )
                 idx2rule[idx] = rule
@@ -1987,23 +2394,32 @@ object named `fc`.
                 raise RuntimeError(
                     f"The names of the rules handled by the actual calibration "
                     f"interface ({enumeration(sorted(names_int))}) do not agree with "
-                    f"the names in the header of logfile `{self._logfilepath}` "
+                    f"the names in the header of logfile `{logfilepath}` "
                     f"({enumeration(sorted(names_ext))})."
                 )
-        jdx_best = 0
-        result_best = -numpy.inf if maximisation else numpy.inf
-        for jdx, line in enumerate(lines[2:]):
-            result = float(line.split()[0])
-            if (maximisation and (result > result_best)) or (
-                (not maximisation) and (result < result_best)
-            ):
-                jdx_best = jdx
-                result_best = result
-
-        for idx, value in enumerate(lines[jdx_best + 2].split()[1:]):
+
+        if binary:
+            records = read_binarylogrecords(logfilepath, headersize, len(idx2name) + 1)
+            results = records[:, 0]
+        else:
+            records = None
+            results = numpy.array([float(line.split()[0]) for line in lines[2:]])
+        if maximisation:
+            jdx_best = int(
+                numpy.argmax(numpy.where(numpy.isnan(results), -numpy.inf, results))
+            )
+        else:
+            jdx_best = int(
+                numpy.argmin(numpy.where(numpy.isnan(results), numpy.inf, results))
+            )
+        if records is None:
+            values = [float(v) for v in lines[jdx_best + 2].split()[1:]]
+        else:
+            values = list(records[jdx_best, 1:])
+        for idx, value in enumerate(values):
             if idx in idx2rule:
                 idx2rule[idx].value = float(value)
-        self.result = result_best
+        self.result = float(results[jdx_best])
 
     def _update_elements_when_adding_a_rule(self, rule: TypeRule1) -> None:
         self._elements += rule.elements
@@ -2145,7 +2561,7 @@ object named `fc`.
             rule.apply_value()
         self._refresh_hp()
         if perform_simulation:
-            self._hp.simulate()
+            self._simulate()
             return self.calculate_likelihood()
         return None
 
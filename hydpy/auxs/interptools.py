@@ -32,6 +32,7 @@ from hydpy.cythons import interputils
 if TYPE_CHECKING:
     from matplotlib import figure
     from matplotlib import pyplot
+    from hydpy.auxs import ppolytools
 else:
     pyplot = exceptiontools.OptionalImport("pyplot", ["matplotlib.pyplot"], locals())
 
@@ -70,6 +71,81 @@ class InterpAlgorithm(_Labeled):
         """Calculate the derivatives of the output values with respect to the input
         value of the given index."""
 
+    def calculate_values_batch(
+        self, xs: VectorInputFloat | MatrixInputFloat
+    ) -> MatrixFloat:
+        """Calculate the output values for multiple input vectors at once.
+
+        Each row of the returned matrix contains the output values for the
+        corresponding row of the given input matrix.  For single-input algorithms,
+        you can pass a vector instead of a matrix.  After the calculation,
+        |InterpAlgorithm.inputs| and |InterpAlgorithm.outputs| contain the values of
+        the last row.
+
+        The base implementation loops over the given input vectors in Python.
+        Subclasses like |ANN| override it with faster implementations:
+
+        >>> from hydpy import ANN, print_matrix
+        >>> ann = ANN(nmb_inputs=1, nmb_neurons=(1,), nmb_outputs=1,
+        ...           weights_input=4.0, weights_output=3.0,
+        ...           intercepts_hidden=-16.0, intercepts_output=-1.0)
+        >>> print_matrix(ann.calculate_values_batch([3.0, 4.0, 5.0]))
+        | -0.946041 |
+        | 0.5 |
+        | 1.946041 |
+        """
+        xs = self._prepare_batch(xs)
+        ys = numpy.empty((len(xs), self.nmb_outputs), dtype=config.NP_FLOAT)
+        for idx, xs_ in enumerate(xs):
+            self.inputs[:] = xs_
+            self.calculate_values()
+            ys[idx, :] = self.outputs
+        return ys
+
+    def calculate_derivatives_batch(
+        self, xs: VectorInputFloat | MatrixInputFloat
+    ) -> TensorFloat:
+        """Calculate the derivatives of all output values with respect to all input
+        values for multiple input vectors at once.
+
+        The first axis of the returned tensor corresponds to the rows of the given
+        input matrix, the second one to the inputs, and the third one to the
+        outputs:
+
+        >>> from hydpy import ANN, print_matrix
+        >>> ann = ANN(nmb_inputs=1, nmb_neurons=(1,), nmb_outputs=1,
+        ...           weights_input=4.0, weights_output=3.0,
+        ...           intercepts_hidden=-16.0, intercepts_output=-1.0)
+        >>> print_matrix(ann.calculate_derivatives_batch([3.0, 4.0, 5.0])[:, :, 0])
+        | 0.211952 |
+        | 3.0 |
+        | 0.211952 |
+        """
+        xs = self._prepare_batch(xs)
+        ni, no = self.nmb_inputs, self.nmb_outputs
+        dys = numpy.empty((len(xs), ni, no), dtype=config.NP_FLOAT)
+        for idx, xs_ in enumerate(xs):
+            self.inputs[:] = xs_
+            self.calculate_values()
+            for xi in range(ni):
+                self.calculate_derivatives(xi)
+                dys[idx, xi, :] = self.output_derivatives
+        return dys
+
+    def _prepare_batch(self, xs: VectorInputFloat | MatrixInputFloat) -> MatrixFloat:
+        array = numpy.asarray(xs, dtype=config.NP_FLOAT)
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        shape: tuple[int, ...] = array.shape
+        if (len(shape) != 2) or (shape[1] != self.nmb_inputs):
+            raise ValueError(
+                f"The batch input for {type(self).__name__} objects must be a matrix "
+                f"with {self.nmb_inputs} column(s), but the given data has the shape "
+                f"{shape}."
+            )
+        matrix: MatrixFloat = numpy.ascontiguousarray(array)
+        return matrix
+
     @abc.abstractmethod
     def verify(self) -> None:
         """Raise a |RuntimeError| if the actual |InterpAlgorithm| object is
@@ -158,21 +234,14 @@ dy1/dx3   dy2/dx3
         table[0, ni:nt] = yns
         table[0, nt:] = [f"d{yn}/d{xn}" for xn, yn in itertools.product(xns, yns)]
 
-        xs_: float | VectorInputFloat
-        for ri, xs_ in enumerate(xs):
+        xs = self._prepare_batch(xs)
+        ys = self.calculate_values_batch(xs)
+        dys = self.calculate_derivatives_batch(xs)
+        for ri, (xs_, ys_, dys_) in enumerate(zip(xs, ys, dys)):
             ri += 1
-            if isinstance(xs_, float):
-                xs_ = (xs_,)
-            for xi, x in enumerate(xs_):
-                table[ri, xi] = r(x)
-                self.inputs[xi] = x
-            self.calculate_values()
-            for yi, y in enumerate(self.outputs):
-                table[ri, ni + yi] = r(y)
-            for xi in range(ni):
-                self.calculate_derivatives(xi)
-                for yi in range(no):
-                    table[ri, nt + no * xi + yi] = r(self.output_derivatives[yi])
+            table[ri, :ni] = [r(x) for x in xs_]
+            table[ri, ni:nt] = [r(y) for y in ys_]
+            table[ri, nt:] = [r(dy) for dy in dys_.flatten()]
 
         for j in range(table.shape[1] - 1):
             length = max(len(v) for v in table[:, j])
@@ -202,18 +271,99 @@ dy1/dx3   dy2/dx3
         See the documentation on classes |ANN| and |PPoly| for some examples.
         """
         xs_ = numpy.linspace(xmin, xmax, points)
-        ys_ = numpy.zeros(xs_.shape)
-        for idx, x__ in enumerate(xs_):
-            self.inputs[idx_input] = x__
-            self.calculate_values()
-            ys_[idx] = self.outputs[idx_output]
+        inputs = numpy.repeat(numpy.array(self.inputs, ndmin=2), points, axis=0)
+        inputs[:, idx_input] = xs_
+        ys_ = self.calculate_values_batch(inputs)[:, idx_output]
         pyplot.plot(xs_, ys_, **kwargs)
         self._update_labels()
         return pyplot.gcf()
 
 
+class _TableSpec(NamedTuple):
+    xmin: float
+    xmax: float
+    nmb_points: int
+    tolerance: float
+
+
+def _get_fingerprint(algorithm: InterpAlgorithm) -> str:
+    with hydpy.pub.options.reprdigits(-1):
+        return algorithm.assignrepr(prefix="")
+
+
+def _tabulate(algorithm: InterpAlgorithm, spec: _TableSpec) -> ppolytools.PPoly:
+    # pylint: disable=import-outside-toplevel
+    # due to circular imports
+    from hydpy.auxs import ppolytools
+
+    nmb_inputs, nmb_outputs = algorithm.nmb_inputs, algorithm.nmb_outputs
+    if (nmb_inputs != 1) or (nmb_outputs != 1):
+        raise ValueError(
+            f"Tabulation requires an algorithm with one input and one output value, "
+            f"but the given algorithm has {nmb_inputs} input and {nmb_outputs} output "
+            f"values."
+        )
+    xmin, xmax, nmb_points, tolerance = spec
+    xs = numpy.linspace(xmin, xmax, nmb_points)
+    hs = numpy.diff(xs)
+    ys = algorithm.calculate_values_batch(xs)[:, 0]
+    ds = algorithm.calculate_derivatives_batch(xs)[:, 0, 0]
+    slopes = numpy.diff(ys) / hs
+    # monotonicity-preserving limitation of the derivatives (Fritsch and Carlson):
+    for idx, slope in enumerate(slopes):
+        if slope == 0.0:
+            ds[idx] = ds[idx + 1] = 0.0
+        else:
+            alpha = max(ds[idx] / slope, 0.0)
+            beta = max(ds[idx + 1] / slope, 0.0)
+            radius = (alpha**2 + beta**2) ** 0.5
+            if radius > 3.0:
+                alpha, beta = 3.0 * alpha / radius, 3.0 * beta / radius
+            ds[idx], ds[idx + 1] = alpha * slope, beta * slope
+    c2 = (3.0 * slopes - 2.0 * ds[:-1] - ds[1:]) / hs
+    c3 = (ds[:-1] + ds[1:] - 2.0 * slopes) / hs**2
+    dxs = numpy.outer(hs, numpy.linspace(0.0, 1.0, 9)[1:-1])
+    ys_check = algorithm.calculate_values_batch((xs[:-1, None] + dxs).flatten())
+    ys_table = (
+        ys[:-1, None]
+        + ds[:-1, None] * dxs
+        + c2[:, None] * dxs**2
+        + c3[:, None] * dxs**3
+    )
+    error = numpy.max(numpy.abs(ys_table.flatten() - ys_check[:, 0]))
+    if not error <= tolerance:
+        raise ValueError(
+            f"The maximum deviation between the table and the original algorithm "
+            f"({objecttools.repr_(error)}) exceeds the given tolerance "
+            f"({objecttools.repr_(tolerance)}).  Consider increasing the number of "
+            f"sampling points."
+        )
+    nmb_ps = nmb_points + 1
+    x0s = numpy.empty(nmb_ps, dtype=config.NP_FLOAT)
+    cs = numpy.zeros((nmb_ps, 4), dtype=config.NP_FLOAT)
+    nmb_cs = numpy.full(nmb_ps, 4, dtype=config.NP_INT)
+    x0s[0] = xmin - hs[0]
+    cs[0, :2] = ys[0] - ds[0] * hs[0], ds[0]
+    x0s[1:-1] = xs[:-1]
+    cs[1:-1, 0] = ys[:-1]
+    cs[1:-1, 1] = ds[:-1]
+    cs[1:-1, 2] = c2
+    cs[1:-1, 3] = c3
+    x0s[-1] = xmax
+    cs[-1, :2] = ys[-1], ds[-1]
+    nmb_cs[[0, -1]] = 2
+    table = ppolytools.PPoly()
+    table.nmb_ps, table.nmb_cs, table.x0s, table.cs = nmb_ps, nmb_cs, x0s, cs
+    return table
+
+
 class BaseInterpolator(_Labeled):
-    """Base class for |SimpleInterpolator| and |SeasonalInterpolator|."""
+    """Base class for |SimpleInterpolator| and |SeasonalInterpolator|.
+
+    For interpolators with a single input and a single output value, method
+    |BaseInterpolator.tabulate| offers an optional fast path that replaces the handled
+    algorithms during simulation runs with dense lookup tables.
+    """
 
     NDIM: Final[Literal[0]] = 0
     TIME = None
@@ -231,6 +381,10 @@ class BaseInterpolator(_Labeled):
 
     __hydpy__subclasscounter__: ClassVar[int]
 
+    _tablespec: _TableSpec | None
+    _tables: tuple[ppolytools.PPoly, ...]
+    _tablefingerprints: tuple[str, ...]
+
     def __init_subclass__(cls) -> None:
         cls.name = cls.__name__.lower()
         subclasscounter = variabletools.Variable.__hydpy__subclasscounter__ + 1
@@ -240,6 +394,249 @@ class BaseInterpolator(_Labeled):
     def __hydpy__let_par_set_shape__(self, p: parametertools.NmbParameter, /) -> None:
         pass
 
+    @abc.abstractmethod
+    def _get_algorithms(self) -> tuple[InterpAlgorithm, ...]:
+        """Return all handled |InterpAlgorithm| objects."""
+
+    @abc.abstractmethod
+    def _connect(self) -> None:
+        """Pass the tables or, if unavailable, the algorithms to the Cython
+        extension object."""
+
+    def tabulate(
+        self, xmin: float, xmax: float, *, tolerance: float, nmb_points: int = 1001
+    ) -> None:
+        """Replace the handled algorithms during simulation runs with lookup tables
+        of piecewise cubic Hermite polynomials.
+
+        Complex algorithms like large |ANN| networks or |PPoly| objects with many
+        polynomials can be computationally expensive.  If such an algorithm has only
+        one input and one output value, method |BaseInterpolator.tabulate| samples its
+        values and first-order derivatives on the given number of equidistant points
+        between `xmin` and `xmax` and prepares a |PPoly| object consisting of cubic
+        Hermite polynomials, which is cheap to evaluate by the Cython code of
+        |interputils| (its index search works in logarithmic time).  Where the
+        sampled values increase or decrease monotonically, the table does so too, as
+        |BaseInterpolator.tabulate| limits the derivatives as suggested by Fritsch and
+        Carlson (1980).  We demonstrate this for a simple |ANN| object:
+
+        >>> from hydpy.auxs.interptools import SimpleInterpolator
+        >>> from hydpy import ANN, round_
+        >>> simpleinterpolator = SimpleInterpolator(None)
+        >>> simpleinterpolator(ANN(weights_input=4.0, weights_output=3.0,
+        ...                        intercepts_hidden=-16.0, intercepts_output=-1.0))
+        >>> simpleinterpolator.tables
+        ()
+
+        >>> simpleinterpolator.tabulate(0.0, 10.0, tolerance=1e-6, nmb_points=401)
+        >>> simpleinterpolator.tables[0].nmb_ps
+        402
+
+        The table extends the sampled range to the left and the right by straight
+        lines with the slopes of the algorithm at `xmin` and `xmax`.  So, select a
+        range that covers all input values relevant to your simulation.  Within this
+        range, the tabulated values agree with the original ones within the given
+        tolerance:
+
+        >>> def compare(x):
+        ...     fastinterpolator = simpleinterpolator.fastaccess.simpleinterpolator
+        ...     fastinterpolator.inputs[0] = x
+        ...     fastinterpolator.calculate_values()
+        ...     fastinterpolator.calculate_derivatives(0)
+        ...     simpleinterpolator.inputs[0] = x
+        ...     simpleinterpolator.calculate_values()
+        ...     simpleinterpolator.calculate_derivatives(0)
+        ...     round_((fastinterpolator.outputs[0],
+        ...             simpleinterpolator.outputs[0],
+        ...             fastinterpolator.output_derivatives[0],
+        ...             simpleinterpolator.output_derivatives[0]))
+        >>> for x in (-1.0, 0.0, 3.9, 4.0, 4.1, 10.0, 11.0):
+        ...     compare(x)
+        -1.000001, -1.0, 0.000001, 0.0
+        -1.0, -1.0, 0.000001, 0.000001
+        0.203937, 0.203937, 2.883129, 2.883129
+        0.5, 0.5, 3.0, 3.0
+        0.796063, 0.796063, 2.883129, 2.883129
+        2.0, 2.0, 0.0, 0.0
+        2.0, 2.0, 0.0, 0.0
+
+        Method |BaseInterpolator.tabulate| compares the table with the algorithm at
+        seven equidistant points within each interval between two sampling points and
+        raises a |ValueError| if the largest deviation exceeds the given tolerance:
+
+        >>> simpleinterpolator.tabulate(0.0, 10.0, tolerance=1e-6, nmb_points=21)
+        Traceback (most recent call last):
+        ...
+        ValueError: While trying to tabulate the interpolation algorithm(s) of \
+parameter `simpleinterpolator` of element `?`, the following error occurred: The \
+maximum deviation between the table and the original algorithm (0.013225) exceeds \
+the given tolerance (0.000001).  Consider increasing the number of sampling points.
+        >>> simpleinterpolator.tables
+        ()
+
+        Tabulation is only possible for algorithms with a single input and a single
+        output value:
+
+        >>> simpleinterpolator(ANN(nmb_inputs=2))
+        >>> simpleinterpolator.tabulate(0.0, 10.0, tolerance=1e-6)
+        Traceback (most recent call last):
+        ...
+        ValueError: While trying to tabulate the interpolation algorithm(s) of \
+parameter `simpleinterpolator` of element `?`, the following error occurred: \
+Tabulation requires an algorithm with one input and one output value, but the given \
+algorithm has 2 input and 1 output values.
+
+        Passing a new algorithm to a tabulated interpolator automatically rebuilds
+        the table:
+
+        >>> simpleinterpolator(ANN(weights_input=4.0, weights_output=3.0,
+        ...                        intercepts_hidden=-16.0, intercepts_output=-1.0))
+        >>> simpleinterpolator.tabulate(0.0, 10.0, tolerance=1e-6, nmb_points=401)
+        >>> simpleinterpolator(ANN(weights_input=4.0, weights_output=3.0,
+        ...                        intercepts_hidden=-16.0, intercepts_output=0.0))
+        >>> compare(4.0)
+        1.5, 1.5, 3.0, 3.0
+
+        Changing an algorithm in place outdates its table.  Method
+        |SimpleInterpolator.verify| (and so method |Parameters.verify|) reports such
+        inconsistencies, and method |SimpleInterpolator.refresh| (or
+        |SimpleInterpolator.update|) rebuilds the table:
+
+        >>> simpleinterpolator.algorithm.intercepts_output = 1.0
+        >>> simpleinterpolator.verify()
+        Traceback (most recent call last):
+        ...
+        RuntimeError: The lookup tables of parameter `simpleinterpolator` of element \
+`?` do not agree with its current interpolation algorithm(s).  Call method `refresh` \
+to rebuild or method `untabulate` to remove them.
+        >>> simpleinterpolator.refresh()
+        >>> simpleinterpolator.verify()
+        >>> compare(4.0)
+        2.5, 2.5, 3.0, 3.0
+
+        Method |BaseInterpolator.untabulate| switches back to the original algorithm:
+
+        >>> simpleinterpolator.untabulate()
+        >>> simpleinterpolator.tables
+        ()
+        >>> compare(4.0)
+        2.5, 2.5, 3.0, 3.0
+
+        The string representation of tabulated interpolators (and so the written
+        control files) always refer to the original algorithms.
+
+        |SeasonalInterpolator| objects prepare one table for each handled algorithm
+        and rebuild them whenever the seasonal algorithms change:
+
+        >>> from hydpy import pub, SeasonalInterpolator
+        >>> pub.timegrids = "2000-01-01", "2001-01-01", "1d"
+        >>> seasonalinterpolator = SeasonalInterpolator(None)
+        >>> seasonalinterpolator(
+        ...     _1_1_12=ANN(weights_input=4.0, weights_output=3.0,
+        ...                 intercepts_hidden=-16.0, intercepts_output=-1.0),
+        ...     _7_1_12=ANN(weights_input=4.0, weights_output=3.0,
+        ...                 intercepts_hidden=-16.0, intercepts_output=1.0))
+        >>> seasonalinterpolator.tabulate(0.0, 10.0, tolerance=1e-6, nmb_points=401)
+        >>> len(seasonalinterpolator.tables)
+        2
+        >>> fastinterpolator = seasonalinterpolator.fastaccess.seasonalinterpolator
+        >>> fastinterpolator.inputs[0] = 4.0
+        >>> fastinterpolator.calculate_values(0)
+        >>> round_(fastinterpolator.outputs[0])
+        0.5
+        >>> seasonalinterpolator.toy_1_1_12.intercepts_output = 0.0
+        >>> seasonalinterpolator.verify()
+        Traceback (most recent call last):
+        ...
+        RuntimeError: The lookup tables of parameter `seasonalinterpolator` of \
+element `?` do not agree with its current interpolation algorithm(s).  Call method \
+`refresh` to rebuild or method `untabulate` to remove them.
+        >>> seasonalinterpolator.refresh()
+        >>> fastinterpolator = seasonalinterpolator.fastaccess.seasonalinterpolator
+        >>> fastinterpolator.inputs[0] = 4.0
+        >>> fastinterpolator.calculate_values(0)
+        >>> round_(fastinterpolator.outputs[0])
+        1.5
+        >>> seasonalinterpolator.tabulate(0.0, 10.0, tolerance=1e-6, nmb_points=21)
+        Traceback (most recent call last):
+        ...
+        ValueError: While trying to tabulate the interpolation algorithm(s) of \
+parameter `seasonalinterpolator` of element `?`, the following error occurred: The \
+maximum deviation between the table and the original algorithm (0.013225) exceeds \
+the given tolerance (0.000001).  Consider increasing the number of sampling points.
+        >>> seasonalinterpolator.tables
+        ()
+        """
+        try:
+            if not xmin < xmax:
+                raise ValueError(
+                    f"The lower boundary of the tabulated range "
+                    f"({objecttools.repr_(xmin)}) must be smaller than the upper one "
+                    f"({objecttools.repr_(xmax)})."
+                )
+            if nmb_points < 2:
+                raise ValueError(
+                    f"At least two sampling points are required, but {nmb_points} "
+                    f"are given."
+                )
+            self._tablespec = _TableSpec(
+                xmin=float(xmin),
+                xmax=float(xmax),
+                nmb_points=int(nmb_points),
+                tolerance=float(tolerance),
+            )
+            self._build_tables()
+        except BaseException:
+            self._clear_tables()
+            self._augment_tableerror()
+        finally:
+            self._connect()
+
+    def untabulate(self) -> None:
+        """Remove the lookup tables prepared by method |BaseInterpolator.tabulate|
+        so that simulation runs rely on the original algorithms again."""
+        self._clear_tables()
+        self._connect()
+
+    @property
+    def tables(self) -> tuple[ppolytools.PPoly, ...]:
+        """The |PPoly| objects prepared by method |BaseInterpolator.tabulate|, if
+        available."""
+        return self._tables
+
+    def _build_tables(self) -> None:
+        if (spec := self._tablespec) is None:
+            return
+        algorithms = self._get_algorithms()
+        self._tables = ()
+        self._tables = tuple(_tabulate(algorithm, spec) for algorithm in algorithms)
+        self._tablefingerprints = tuple(_get_fingerprint(a) for a in algorithms)
+
+    def _clear_tables(self) -> None:
+        self._tablespec = None
+        self._tables = ()
+        self._tablefingerprints = ()
+
+    def _augment_tableerror(self) -> NoReturn:
+        objecttools.augment_excmessage(
+            f"While trying to tabulate the interpolation algorithm(s) of parameter "
+            f"{objecttools.elementphrase(self)}"
+        )
+
+    def _are_tables_outdated(self) -> bool:
+        if self._tablespec is None:
+            return False
+        fingerprints = tuple(_get_fingerprint(a) for a in self._get_algorithms())
+        return fingerprints != self._tablefingerprints
+
+    def _verify_tables(self) -> None:
+        if self._are_tables_outdated():
+            raise RuntimeError(
+                f"The lookup tables of parameter {objecttools.elementphrase(self)} do "
+                f"not agree with its current interpolation algorithm(s).  Call method "
+                f"`refresh` to rebuild or method `untabulate` to remove them."
+            )
+
 
 class SimpleInterpolator(BaseInterpolator):
     """Parameter base class for handling interpolation problems.
@@ -305,6 +702,11 @@ class SimpleInterpolator(BaseInterpolator):
     ...     mock.return_value = "figure"
     ...     assert simpleinterpolator.plot(**kwargs) == "figure"
     >>> mock.assert_called_with(**kwargs)
+
+    For interpolators with a single input and a single output value, method
+    |BaseInterpolator.tabulate| offers an optional fast path that replaces the
+    handled algorithm during simulation runs with a dense lookup table.  See its
+    documentation for further information.
     """
 
     TYPE: Final = "interputils.SimpleInterpolator"
@@ -318,6 +720,7 @@ class SimpleInterpolator(BaseInterpolator):
         self.subpars = subvars
         self.fastaccess = parametertools.FastAccessParameter()
         self._algorithm = None
+        self._clear_tables()
         self.__simpleinterpolator = None
         self._do_refresh = True
 
@@ -329,7 +732,23 @@ class SimpleInterpolator(BaseInterpolator):
 
     def __call__(self, algorithm: InterpAlgorithm) -> None:
         self._algorithm = algorithm
-        self.__simpleinterpolator = interputils.SimpleInterpolator(algorithm)
+        try:
+            self._build_tables()
+        except BaseException:
+            self._clear_tables()
+            raise
+        finally:
+            self._connect()
+
+    def _get_algorithms(self) -> tuple[InterpAlgorithm, ...]:
+        return () if self._algorithm is None else (self._algorithm,)
+
+    def _connect(self) -> None:
+        algorithm = self._tables[0] if self._tables else self._algorithm
+        if algorithm is None:
+            self.__simpleinterpolator = None
+        else:
+            self.__simpleinterpolator = interputils.SimpleInterpolator(algorithm)
         setattr(self.fastaccess, self.name, self.__simpleinterpolator)
 
     @property
@@ -388,13 +807,27 @@ interpolator has been defined so far.
         """The current input values."""
         return self.algorithm.output_derivatives
 
+    def refresh(self) -> None:
+        """Rebuild the lookup table prepared by method |BaseInterpolator.tabulate|
+        if the handled algorithm has changed since then.
+
+        See the documentation on method |BaseInterpolator.tabulate| for further
+        information.
+        """
+        if self._are_tables_outdated():
+            self(self.algorithm)
+
     def update(self) -> None:
-        """Do nothing (this method only ensures compatibility with |Parameter|)."""
+        """Call method |SimpleInterpolator.refresh| (this method mainly ensures
+        compatibility with |Parameter|)."""
+        self.refresh()
 
     def verify(self) -> None:
         """Raise a |RuntimeError| if the current |InterpAlgorithm| object shows
-        inconsistencies."""
+        inconsistencies or deviates from the lookup table prepared by method
+        |BaseInterpolator.tabulate|."""
         self.algorithm.verify()
+        self._verify_tables()
 
     def calculate_values(self) -> None:
         """Calculate the output values based on the input values defined previously."""
@@ -715,6 +1148,7 @@ error occurred: Value `1` of type `int` has been given, but an object of type \
         self.subpars = subvars
         self.fastaccess = parametertools.FastAccessParameter()
         self._toy2algorithm = []
+        self._clear_tables()
         self.__seasonalinterpolator = None
         self._do_refresh = True
 
@@ -818,19 +1252,32 @@ error occurred: Value `1` of type `int` has been given, but an object of type \
         (2, 3)
         """
         if self._do_refresh:
-            if self.algorithms:
-                self.__seasonalinterpolator = interputils.SeasonalInterpolator(
-                    self.algorithms
-                )
-                setattr(self.fastaccess, self.name, self._seasonalinterpolator)
-                self._prepare_shape()
-                if self._seasonalinterpolator.nmb_algorithms > 1:
-                    self._interp()
-                else:
-                    self._seasonalinterpolator.ratios[:, 0] = 1.0
-                self.verify()
+            try:
+                if self._are_tables_outdated():
+                    self._build_tables()
+            except BaseException:
+                self._clear_tables()
+                self._augment_tableerror()
+            finally:
+                self._connect()
+
+    def _get_algorithms(self) -> tuple[InterpAlgorithm, ...]:
+        return self.algorithms
+
+    def _connect(self) -> None:
+        if self.algorithms:
+            self.__seasonalinterpolator = interputils.SeasonalInterpolator(
+                self._tables or self.algorithms
+            )
+            setattr(self.fastaccess, self.name, self._seasonalinterpolator)
+            self._prepare_shape()
+            if self._seasonalinterpolator.nmb_algorithms > 1:
+                self._interp()
             else:
-                self.__seasonalinterpolator = None
+                self._seasonalinterpolator.ratios[:, 0] = 1.0
+            self.verify()
+        else:
+            self.__seasonalinterpolator = None
 
     def update(self) -> None:
         """Do nothing (this method only ensures compatibility with |Parameter|)."""
@@ -899,6 +1346,7 @@ interpolation algorithm object, but for parameter `seasonalinterpolator` of elem
                     f"defined in advance and be the same, which is not the case for "
                     f"at least two given interpolators."
                 )
+        self._verify_tables()
 
     def _interp(self) -> None:
         ratios = self.ratios
@@ -0,0 +1,574 @@
+"""This module implements features for global sensitivity analyses based on the
+|Rule| objects handled by a |CalibrationInterface| object.
+
+Module |sensitivitytools| supports the elementary effects method after
+:cite:t:`ref-Morris1991` and the variance-based estimation of first-order and total
+Sobol indices after :cite:t:`ref-Saltelli2010`.  Both methods sample in the
+eventually transformed parameter space spanned by the |Rule.lower_transformed| and
+|Rule.upper_transformed| boundaries of the individual rules.
+"""
+
+from __future__ import annotations
+import os
+
+import numpy
+
+from hydpy import config
+from hydpy.core import devicetools
+from hydpy.core import objecttools
+from hydpy.auxs import calibtools
+from hydpy.auxs import statstools
+from hydpy.core.typingtools import *
+
+_MAGIC = b"HydPy-SA-Log\n"
+
+
+class ElementaryEffects(NamedTuple):
+    """The elementary effect statistics of all rules (columns) for all target nodes
+    (rows)."""
+
+    mu: MatrixFloat
+    """Mean of the elementary effects."""
+    mustar: MatrixFloat
+    """Mean of the absolute elementary effects."""
+    sigma: MatrixFloat
+    """Standard deviation of the elementary effects."""
+
+
+class SobolIndices(NamedTuple):
+    """The Sobol indices of all rules (columns) for all target nodes (rows)."""
+
+    first: MatrixFloat
+    """First-order indices."""
+    total: MatrixFloat
+    """Total indices."""
+
+
+def sample_morris(
+    nmbparameters: int, nmbtrajectories: int, nmblevels: int = 4, seed: int = 0
+) -> MatrixFloat:
+    """Sample one-at-a-time trajectories within the unit hypercube after
+    :cite:t:`ref-Morris1991`.
+
+    Each trajectory consists of `nmbparameters` + 1 points.  Consecutive points of the
+    same trajectory differ in exactly one parameter by the step size
+    :math:`\\Delta = p / (2 \\cdot (p - 1))`, with :math:`p` being the number of
+    levels:
+
+    >>> from hydpy.auxs.sensitivitytools import sample_morris
+    >>> from hydpy import print_matrix
+    >>> design = sample_morris(nmbparameters=2, nmbtrajectories=2, seed=1)
+    >>> print_matrix(design)
+    | 0.333333, 0.666667 |
+    | 0.333333, 0.0 |
+    | 1.0, 0.0 |
+    | 1.0, 0.0 |
+    | 1.0, 0.666667 |
+    | 0.333333, 0.666667 |
+
+    The same seed always results in the same design:
+
+    >>> from numpy import array_equal
+    >>> array_equal(sample_morris(2, 2, seed=1), design)
+    True
+
+    |sample_morris| checks for the number of levels being even and at least two:
+
+    >>> sample_morris(nmbparameters=2, nmbtrajectories=2, nmblevels=3)
+    Traceback (most recent call last):
+    ...
+    ValueError: The Morris method requires an even number of levels of at least two, \
+but `3` is given.
+    """
+    if (nmblevels < 2) or (nmblevels % 2):
+        raise ValueError(
+            f"The Morris method requires an even number of levels of at least two, "
+            f"but `{nmblevels}` is given."
+        )
+    rng = numpy.random.default_rng(seed)
+    delta = nmblevels / (2.0 * (nmblevels - 1.0))
+    levels = numpy.linspace(0.0, 1.0, nmblevels)
+    design = numpy.empty((nmbtrajectories * (nmbparameters + 1), nmbparameters))
+    for idx_trajectory in range(nmbtrajectories):
+        idx_row = idx_trajectory * (nmbparameters + 1)
+        point = rng.choice(levels, size=nmbparameters)
+        design[idx_row] = point
+        for jdx, idx_parameter in enumerate(rng.permutation(nmbparameters)):
+            if point[idx_parameter] + delta <= 1.0 + 1e-10:
+                point[idx_parameter] += delta
+            else:
+                point[idx_parameter] -= delta
+            design[idx_row + jdx + 1] = point
+    return design
+
+
+def sample_saltelli(nmbparameters: int, nmbsamples: int, seed: int = 0) -> MatrixFloat:
+    """Sample radial blocks within the unit hypercube after
+    :cite:t:`ref-Saltelli2010`.
+
+    Each block consists of `nmbparameters` + 2 points.  The first one stems from
+    matrix :math:`A`, the second one from matrix :math:`B`, and the remaining ones
+    are copies of the first one, of which one parameter is taken from the second one:
+
+    >>> from hydpy.auxs.sensitivitytools import sample_saltelli
+    >>> from hydpy import print_matrix
+    >>> print_matrix(sample_saltelli(nmbparameters=2, nmbsamples=1, seed=1))
+    | 0.511822, 0.950464 |
+    | 0.14416, 0.948649 |
+    | 0.14416, 0.950464 |
+    | 0.511822, 0.948649 |
+    """
+    rng = numpy.random.default_rng(seed)
+    a = rng.random((nmbsamples, nmbparameters))
+    b = rng.random((nmbsamples, nmbparameters))
+    design = numpy.empty((nmbsamples, nmbparameters + 2, nmbparameters))
+    design[:, 0] = a
+    design[:, 1] = b
+    for idx in range(nmbparameters):
+        design[:, idx + 2] = a
+        design[:, idx + 2, idx] = b[:, idx]
+    return design.reshape((nmbsamples * (nmbparameters + 2), nmbparameters))
+
+
+def calc_elementaryeffects(
+    design: MatrixInputFloat, results: MatrixInputFloat
+) -> ElementaryEffects:
+    """Calculate the elementary effect statistics for a design prepared by
+    |sample_morris| and the corresponding results.
+
+    The columns of `results` correspond to different target variables.  The
+    elementary effects refer to the unit hypercube so that their values are comparable
+    among parameters with different ranges:
+
+    >>> from hydpy.auxs.sensitivitytools import calc_elementaryeffects, sample_morris
+    >>> design = sample_morris(nmbparameters=2, nmbtrajectories=3, seed=1)
+    >>> results = numpy.empty((len(design), 2))
+    >>> results[:, 0] = 2.0 * design[:, 0] - 1.0 * design[:, 1]
+    >>> results[:, 1] = design[:, 0] ** 2
+    >>> from hydpy import print_matrix
+    >>> ee = calc_elementaryeffects(design, results)
+    >>> print_matrix(ee.mu)
+    | 2.0, -1.0 |
+    | 1.333333, 0.0 |
+    >>> print_matrix(ee.mustar)
+    | 2.0, 1.0 |
+    | 1.333333, 0.0 |
+    >>> print_matrix(ee.sigma.round(6))
+    | 0.0, 0.0 |
+    | 0.0, 0.0 |
+    """
+    design = numpy.asarray(design, dtype=config.NP_FLOAT)
+    results = numpy.asarray(results, dtype=config.NP_FLOAT)
+    nmbparameters = design.shape[1]
+    nmbtrajectories = design.shape[0] // (nmbparameters + 1)
+    shape = (nmbtrajectories, nmbparameters + 1)
+    points = design.reshape(shape + (nmbparameters,))
+    values = results.reshape(shape + (results.shape[1],))
+    dx = numpy.diff(points, axis=1)
+    dy = numpy.diff(values, axis=1)
+    effects = numpy.empty((nmbtrajectories, results.shape[1], nmbparameters))
+    idxs_parameter = numpy.argmax(numpy.abs(dx), axis=2)
+    for idx_trajectory in range(nmbtrajectories):
+        for jdx, idx_parameter in enumerate(idxs_parameter[idx_trajectory]):
+            effects[idx_trajectory, :, idx_parameter] = (
+                dy[idx_trajectory, jdx] / dx[idx_trajectory, jdx, idx_parameter]
+            )
+    return ElementaryEffects(
+        mu=numpy.mean(effects, axis=0),
+        mustar=numpy.mean(numpy.abs(effects), axis=0),
+        sigma=numpy.std(effects, axis=0, ddof=1 if nmbtrajectories > 1 else 0),
+    )
+
+
+def calc_sobolindices(nmbparameters: int, results: MatrixInputFloat) -> SobolIndices:
+    """Estimate the first-order and total Sobol indices for a design prepared by
+    |sample_saltelli| and the corresponding results.
+
+    |calc_sobolindices| applies the first-order estimator of
+    :cite:t:`ref-Saltelli2010` and the total-effect estimator of Jansen.  For the
+    additive function :math:`y = x_1 + 2 \\cdot x_2`, the exact first-order and total
+    indices are identical (0.2 and 0.8):
+
+    >>> from hydpy.auxs.sensitivitytools import calc_sobolindices, sample_saltelli
+    >>> design = sample_saltelli(nmbparameters=2, nmbsamples=10000, seed=1)
+    >>> results = (design[:, 0] + 2.0 * design[:, 1]).reshape(-1, 1)
+    >>> from hydpy import print_matrix
+    >>> indices = calc_sobolindices(2, results)
+    >>> print_matrix(indices.first.round(1))
+    | 0.2, 0.8 |
+    >>> print_matrix(indices.total.round(1))
+    | 0.2, 0.8 |
+    """
+    results = numpy.asarray(results, dtype=config.NP_FLOAT)
+    blocks = results.reshape((-1, nmbparameters + 2, results.shape[1]))
+    fa, fb, fab = blocks[:, 0], blocks[:, 1], blocks[:, 2:]
+    variance = numpy.var(numpy.concatenate((fa, fb)), axis=0)
+    first = numpy.mean(fb[:, None, :] * (fab - fa[:, None, :]), axis=0)
+    total = 0.5 * numpy.mean((fa[:, None, :] - fab) ** 2, axis=0)
+    return SobolIndices(first=(first / variance).T, total=(total / variance).T)
+
+
+class SensitivityAnalysis:
+    """Sensitivity analysis for the |Rule| objects of a |CalibrationInterface|
+    object with respect to the simulation results of individual nodes.
+
+    We prepare the `Lahn` example project and a |CalibrationInterface| object
+    handling two |Replace| rules and one |LogReplace| rule (the target function is
+    irrelevant for sensitivity analyses):
+
+    >>> from hydpy.core.testtools import prepare_full_example_2
+    >>> hp, pub, TestIO = prepare_full_example_2()
+    >>> from hydpy import CalibrationInterface, LogReplace, Replace
+    >>> ci = CalibrationInterface(hp=hp, targetfunction=lambda: 0.0)
+    >>> ci.add_rules(
+    ...     Replace(name="fc", parameter="fc", value=200.0, lower=50.0, upper=300.0,
+    ...             model="hland_96"),
+    ...     Replace(name="beta", parameter="beta", value=2.0, lower=1.0, upper=4.0,
+    ...             model="hland_96"),
+    ...     LogReplace(name="k4", parameter="k4", value=0.01, lower=0.005, upper=0.05,
+    ...                model="hland_96"))
+
+    For brevity, we focus on the nodes `lahn_marb` and `lahn_kalk`.  Instead of an
+    efficiency criterion like |nse| (the default), we use the total simulated
+    discharge volume as the target variable:
+
+    >>> from hydpy.auxs.sensitivitytools import SensitivityAnalysis
+    >>> sa = SensitivityAnalysis(
+    ...     ci,
+    ...     method="morris",
+    ...     nmbsamples=4,
+    ...     nodes=[hp.nodes.lahn_marb, hp.nodes.lahn_kalk],
+    ...     criterion=lambda node: sum(node.sequences.sim.series))
+    >>> sa
+    SensitivityAnalysis(method="morris", nmbsamples=4, seed=0)
+
+    Four Morris trajectories for three parameters require 16 simulation runs.  The
+    design covers the transformed parameter space (note the log-transformed values of
+    the `k4` rule):
+
+    >>> sa.nmbruns
+    16
+    >>> from hydpy import print_matrix
+    >>> print_matrix(sa.design[:4])
+    | 300.0, 3.0, -3.763261 |
+    | 300.0, 1.0, -3.763261 |
+    | 300.0, 1.0, -5.298317 |
+    | 133.333333, 1.0, -5.298317 |
+
+    Method |SensitivityAnalysis.run| performs all simulation runs and streams the
+    results to a binary log file batch by batch:
+
+    >>> with TestIO():
+    ...     sa.run(logfilepath="sa.log", batchsize=5)
+
+    Afterwards, |SensitivityAnalysis| resets all parameter values:
+
+    >>> hp.elements.land_lahn_marb.model.parameters.control.fc
+    fc(206.0)
+
+    Property |SensitivityAnalysis.results| provides the target values of all runs and
+    nodes:
+
+    >>> print_matrix(sa.results[:4])
+    | 258.036861, 57.930449 |
+    | 107.945776, 22.942052 |
+    | 68.924731, 10.615086 |
+    | 40.128219, 4.683455 |
+
+    Method |SensitivityAnalysis.calc_elementaryeffects| computes the elementary
+    effect statistics for each node (rows) and rule (columns).  All rules seem relevant,
+    `fc` most of all:
+
+    >>> ee = sa.calc_elementaryeffects()
+    >>> print_matrix(ee.mustar)
+    | 111.947854, 89.038773, 61.235035 |
+    | 27.252526, 22.865366, 19.015775 |
+
+    Long campaigns might be interrupted.  Method |SensitivityAnalysis.run| then
+    continues with the missing runs of the given log file.  We simulate an
+    interruption by truncating the log file, which even cuts off the last record
+    partly:
+
+    >>> import os
+    >>> with TestIO():
+    ...     os.truncate("sa.log", os.path.getsize("sa.log") - 100)
+    ...     sa.read_logfiles("sa.log")
+    >>> sa.nmbcompleted
+    13
+
+    >>> with TestIO():
+    ...     sa.run(logfilepath="sa.log")
+    ...     sa.read_logfiles("sa.log")
+    >>> sa.nmbcompleted
+    16
+    >>> print_matrix(sa.calc_elementaryeffects().mustar)
+    | 111.947854, 89.038773, 61.235035 |
+    | 27.252526, 22.865366, 19.015775 |
+
+    For parallel execution, start multiple processes, each one handling a separate
+    |CalibrationInterface| object.  Pass the same arguments to |SensitivityAnalysis|
+    and distribute the batches via the arguments `nmbworkers` and `worker`.  Then,
+    merge the results of all workers' log files:
+
+    >>> with TestIO():
+    ...     sa.run(logfilepath="sa_0.log", batchsize=3, nmbworkers=2, worker=0)
+    ...     sa.read_logfiles("sa_0.log")
+    ...     print(sa.nmbcompleted)
+    ...     sa.run(logfilepath="sa_1.log", batchsize=3, nmbworkers=2, worker=1)
+    ...     sa.read_logfiles("sa_0.log", "sa_1.log")
+    ...     print(sa.nmbcompleted)
+    9
+    16
+
+    Method |SensitivityAnalysis.read_logfiles| refuses to read log files written for
+    a different setting:
+
+    >>> sobol = SensitivityAnalysis(ci, method="sobol", nmbsamples=2, nodes=hp.nodes)
+    >>> with TestIO():
+    ...     sobol.read_logfiles("sa.log")
+    Traceback (most recent call last):
+    ...
+    RuntimeError: The header of log file `sa.log` does not agree with the current \
+sensitivity analysis setting.
+
+    For variance-based sensitivity analyses, select the method `sobol` and call
+    method |SensitivityAnalysis.calc_sobolindices|.  Note that reliable estimates
+    usually require thousands of simulation runs:
+
+    >>> sobol.nmbruns
+    10
+    >>> with TestIO():
+    ...     sobol.run(logfilepath="sobol.log")
+    >>> indices = sobol.calc_sobolindices()
+    >>> indices.first.shape
+    (4, 3)
+
+    Calculating indices of the wrong type results in the following errors:
+
+    >>> sobol.calc_elementaryeffects()
+    Traceback (most recent call last):
+    ...
+    RuntimeError: Elementary effects require the sampling method `morris`, but the \
+sampling method of the given sensitivity analysis is `sobol`.
+    >>> sa.calc_sobolindices()
+    Traceback (most recent call last):
+    ...
+    RuntimeError: Sobol indices require the sampling method `sobol`, but the \
+sampling method of the given sensitivity analysis is `morris`.
+
+    Both methods also require complete results:
+
+    >>> sobol.results[0, 0] = numpy.nan
+    >>> sobol.calc_sobolindices()
+    Traceback (most recent call last):
+    ...
+    RuntimeError: The results of 1 out of 10 runs are missing.
+    """
+
+    ci: calibtools.CalibrationInterface[Any]
+    """The |CalibrationInterface| object that handles the relevant |Rule| objects."""
+    method: Literal["morris", "sobol"]
+    """The sampling method."""
+    nmbsamples: int
+    """The number of Morris trajectories or Saltelli blocks."""
+    seed: int
+    """The seed of the random number generator."""
+    nodes: devicetools.Nodes
+    """The target nodes."""
+    criterion: Callable[[devicetools.Node], float]
+    """The function for calculating the target value of a single node."""
+    design_unit: MatrixFloat
+    """The sample design within the unit hypercube."""
+    results: MatrixFloat
+    """The target values of all simulation runs (rows) and nodes (columns).
+
+    Missing results are |numpy.nan|.
+    """
+
+    def __init__(
+        self,
+        ci: calibtools.CalibrationInterface[Any],
+        *,
+        method: Literal["morris", "sobol"],
+        nmbsamples: int,
+        seed: int = 0,
+        nodes: devicetools.NodesConstrArg | None = None,
+        criterion: Callable[[devicetools.Node], float] | None = None,
+        nmblevels: int = 4,
+    ) -> None:
+        self.ci = ci
+        self.method = method
+        self.nmbsamples = nmbsamples
+        self.seed = seed
+        self.nodes = devicetools.Nodes(ci._hp.nodes if nodes is None else nodes)
+        if criterion is None:
+            self.criterion = lambda node: statstools.nse(node=node)
+        else:
+            self.criterion = criterion
+        if method == "morris":
+            self.design_unit = sample_morris(
+                nmbparameters=len(ci),
+                nmbtrajectories=nmbsamples,
+                nmblevels=nmblevels,
+                seed=seed,
+            )
+        elif method == "sobol":
+            self.design_unit = sample_saltelli(
+                nmbparameters=len(ci), nmbsamples=nmbsamples, seed=seed
+            )
+        else:
+            raise ValueError(
+                f"The sampling method must be `morris` or `sobol`, but `{method}` is "
+                f"given."
+            )
+        self.results = numpy.full((self.nmbruns, len(self.nodes)), numpy.nan)
+
+    @property
+    def nmbruns(self) -> int:
+        """The total number of required simulation runs."""
+        return len(self.design_unit)
+
+    @property
+    def nmbcompleted(self) -> int:
+        """The number of simulation runs with available results."""
+        return int(numpy.sum(~numpy.any(numpy.isnan(self.results), axis=1)))
+
+    @property
+    def design(self) -> MatrixFloat:
+        """The sample design within the (eventually transformed) parameter space."""
+        lowers = numpy.array(self.ci.lowers_transformed)
+        uppers = numpy.array(self.ci.uppers_transformed)
+        return lowers + self.design_unit * (uppers - lowers)
+
+    def _get_headerlines(self) -> tuple[str, ...]:
+        return (
+            f"method\t{self.method}",
+            f"nmbsamples\t{self.nmbsamples}",
+            f"seed\t{self.seed}",
+            "\t".join(["rules"] + list(self.ci.names)),
+            "\t".join(["lowers"] + [repr(v) for v in self.ci.lowers_transformed]),
+            "\t".join(["uppers"] + [repr(v) for v in self.ci.uppers_transformed]),
+            "\t".join(["nodes"] + list(self.nodes.names)),
+        )
+
+    @property
+    def _recordsize(self) -> int:
+        return 1 + len(self.ci) + len(self.nodes)
+
+    def _read_logfile(self, logfilepath: str) -> tuple[int, MatrixFloat]:
+        headersize, lines = calibtools.read_binarylogheader(logfilepath, _MAGIC)
+        if lines != self._get_headerlines():
+            raise RuntimeError(
+                f"The header of log file `{logfilepath}` does not agree with the "
+                f"current sensitivity analysis setting."
+            )
+        records = calibtools.read_binarylogrecords(
+            logfilepath, headersize, self._recordsize
+        )
+        return headersize, records
+
+    def read_logfiles(self, *logfilepaths: str) -> None:
+        """Read the results of one or more log files and merge them.
+
+        Incomplete records at the end of a log file (due to crashes) are ignored.
+
+        See the main documentation on class |SensitivityAnalysis| for further
+        information.
+        """
+        self.results[:] = numpy.nan
+        for logfilepath in logfilepaths:
+            _, records = self._read_logfile(logfilepath)
+            idxs = records[:, 0].astype(config.NP_INT)
+            self.results[idxs] = records[:, 1 + len(self.ci) :]
+
+    def run(
+        self,
+        logfilepath: str,
+        *,
+        batchsize: int = 100,
+        nmbworkers: int = 1,
+        worker: int = 0,
+    ) -> None:
+        """Perform all missing simulation runs and write their results into the
+        given log file.
+
+        |SensitivityAnalysis.run| appends the results of each batch of `batchsize`
+        simulation runs to the log file.  If the log file already exists, it skips
+        all runs with already logged results.  Use `nmbworkers` and `worker` for
+        distributing the batches to multiple processes.
+
+        See the main documentation on class |SensitivityAnalysis| for further
+        information.
+        """
+        if os.path.exists(logfilepath):
+            self.read_logfiles(logfilepath)
+            headersize, _ = self._read_logfile(logfilepath)
+        else:
+            self.results[:] = numpy.nan
+            headersize = calibtools.write_binarylogheader(
+                logfilepath, self._get_headerlines(), _MAGIC
+            )
+        completed = ~numpy.any(numpy.isnan(self.results), axis=1)
+        design = self.design
+        try:
+            for idx0 in range(worker * batchsize, self.nmbruns, nmbworkers * batchsize):
+                idxs = [
+                    idx
+                    for idx in range(idx0, min(idx0 + batchsize, self.nmbruns))
+                    if not completed[idx]
+                ]
+                records = numpy.empty((len(idxs), self._recordsize))
+                for jdx, idx in enumerate(idxs):
+                    self.ci.perform_calibrationstep(design[idx])
+                    self.results[idx] = [self.criterion(node) for node in self.nodes]
+                    records[jdx, 0] = idx
+                    records[jdx, 1 : 1 + len(self.ci)] = design[idx]
+                    records[jdx, 1 + len(self.ci) :] = self.results[idx]
+                calibtools.append_binarylogrecords(
+                    logfilepath=logfilepath,
+                    headersize=headersize,
+                    recordsize=self._recordsize,
+                    records=records.tobytes(),
+                    fsync=True,
+                )
+        finally:
+            self.ci.reset_parameters()
+
+    def _check_results(self, method: str, indices: str) -> None:
+        if self.method != method:
+            raise RuntimeError(
+                f"{indices} require the sampling method `{method}`, but the sampling "
+                f"method of the given sensitivity analysis is `{self.method}`."
+            )
+        if (nmbmissing := self.nmbruns - self.nmbcompleted) > 0:
+            raise RuntimeError(
+                f"The results of {nmbmissing} out of {self.nmbruns} runs are missing."
+            )
+
+    def calc_elementaryeffects(self) -> ElementaryEffects:
+        """Calculate the elementary effect statistics based on the available results
+        via function |calc_elementaryeffects|.
+
+        See the main documentation on class |SensitivityAnalysis| for further
+        information.
+        """
+        self._check_results("morris", "Elementary effects")
+        return calc_elementaryeffects(self.design_unit, self.results)
+
+    def calc_sobolindices(self) -> SobolIndices:
+        """Calculate the first-order and total Sobol indices based on the available
+        results via function |calc_sobolindices|.
+
+        See the main documentation on class |SensitivityAnalysis| for further
+        information.
+        """
+        self._check_results("sobol", "Sobol indices")
+        return calc_sobolindices(len(self.ci), self.results)
+
+    def __repr__(self) -> str:
+        return objecttools.apply_black(
+            type(self).__name__,
+            method=self.method,
+            nmbsamples=self.nmbsamples,
+            seed=self.seed,
+        )
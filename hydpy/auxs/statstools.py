@@ -4,6 +4,7 @@ modelling."""
 import abc
 import collections
 import copy
+import functools
 import warnings
 
 import numpy
@@ -1236,6 +1237,341 @@ def corr(
     return cast(float, numpy.corrcoef(sim_, obs_)[0, 1])
 
 
+class SimObsMatrices(NamedTuple):
+    """A named tuple containing one matrix of simulated values, one matrix of observed
+    values (time × series), and one matrix that marks the valid value pairs."""
+
+    sim: MatrixFloat
+    obs: MatrixFloat
+    mask: MatrixBool
+
+
+def prepare_matrices(
+    *,
+    sim: MatrixInputFloat | None = None,
+    obs: MatrixInputFloat | None = None,
+    nodes: Iterable[devicetools.Node] | None = None,
+    skip_nan: bool = False,
+    skip_notpositive: bool = False,
+    subperiod: bool | None = None,
+) -> SimObsMatrices:
+    """Prepare and return two |numpy| matrices (time × series) and a mask of valid
+    value pairs based on the given arguments.
+
+    |prepare_matrices| is the multi-series counterpart of |prepare_arrays|.  Instead
+    of removing invalid values, it marks them by the returned mask, so that all series
+    keep the same length:
+
+    >>> from hydpy import pub, Node, print_matrix, nan
+    >>> pub.timegrids = "01.01.2000", "05.01.2000", "1d"
+    >>> node1, node2 = Node("test1"), Node("test2")
+    >>> for node in (node1, node2):
+    ...     node.prepare_allseries()
+    >>> with pub.options.checkseries(False):
+    ...     node1.sequences.sim.series = 1.0, 2.0, 3.0, 4.0
+    ...     node1.sequences.obs.series = 1.0, nan, 3.0, 5.0
+    ...     node2.sequences.sim.series = 2.0, 3.0, nan, 5.0
+    ...     node2.sequences.obs.series = 2.0, 3.0, 4.0, 6.0
+
+    >>> from hydpy.auxs.statstools import prepare_matrices
+    >>> matrices = prepare_matrices(nodes=[node1, node2], skip_nan=True)
+    >>> print_matrix(matrices.sim)
+    | 1.0, 2.0 |
+    | 2.0, 3.0 |
+    | 3.0, nan |
+    | 4.0, 5.0 |
+    >>> print_matrix(matrices.mask)
+    | True, True |
+    | False, True |
+    | True, False |
+    | True, True |
+
+    Without activating `skip_nan`, all pairs are considered valid:
+
+    >>> print_matrix(prepare_matrices(nodes=[node1, node2]).mask)
+    | True, True |
+    | True, True |
+    | True, True |
+    | True, True |
+
+    The `skip_notpositive` option additionally marks all pairs containing zero or
+    negative values as invalid:
+
+    >>> with pub.options.checkseries(False):
+    ...     node2.sequences.obs.series[0] = 0.0
+    >>> print_matrix(
+    ...     prepare_matrices(nodes=[node1, node2], skip_nan=True, skip_notpositive=True
+    ... ).mask)
+    | True, False |
+    | False, True |
+    | True, False |
+    | True, True |
+    >>> with pub.options.checkseries(False):
+    ...     node2.sequences.obs.series[0] = 2.0
+
+    Like |prepare_arrays|, |prepare_matrices| considers the evaluation period by
+    default only when receiving |Node| objects:
+
+    >>> pub.timegrids.eval_.dates = "02.01.2000", "04.01.2000"
+    >>> print_matrix(prepare_matrices(nodes=[node1, node2]).obs)
+    | nan, 3.0 |
+    | 3.0, 4.0 |
+    >>> sim, obs = matrices.sim, matrices.obs
+    >>> print_matrix(prepare_matrices(sim=sim, obs=obs).obs)
+    | 1.0, 2.0 |
+    | nan, 3.0 |
+    | 3.0, 4.0 |
+    | 5.0, 6.0 |
+    >>> print_matrix(prepare_matrices(sim=sim, obs=obs, subperiod=True).obs)
+    | nan, 3.0 |
+    | 3.0, 4.0 |
+
+    Incomplete or conflicting arguments result in the following errors:
+
+    >>> prepare_matrices(sim=sim)
+    Traceback (most recent call last):
+    ...
+    ValueError: Function `prepare_matrices` requires either a collection of `Node` \
+objects or two matrices of simulated and observed values.
+    >>> prepare_matrices(sim=sim, obs=obs, nodes=[node1, node2])
+    Traceback (most recent call last):
+    ...
+    ValueError: Function `prepare_matrices` requires either a collection of `Node` \
+objects or two matrices of simulated and observed values.
+    >>> prepare_matrices(sim=sim, obs=obs[:, :1])
+    Traceback (most recent call last):
+    ...
+    ValueError: The shapes of the simulated (4, 2) and the observed values (4, 1) \
+differ.
+    """
+    if (nodes is not None) and (sim is None) and (obs is None):
+        nodes = tuple(nodes)
+        sim_ = numpy.stack([n.sequences.sim.series for n in nodes], axis=1)
+        obs_ = numpy.stack([n.sequences.obs.series for n in nodes], axis=1)
+    elif (nodes is None) and (sim is not None) and (obs is not None):
+        sim_ = numpy.asarray(sim, dtype=config.NP_FLOAT)
+        obs_ = numpy.asarray(obs, dtype=config.NP_FLOAT)
+        if sim_.shape != obs_.shape:
+            raise ValueError(
+                f"The shapes of the simulated {sim_.shape} and the observed values "
+                f"{obs_.shape} differ."
+            )
+    else:
+        raise ValueError(
+            "Function `prepare_matrices` requires either a collection of `Node` "
+            "objects or two matrices of simulated and observed values."
+        )
+    if subperiod or ((subperiod is None) and (nodes is not None)):
+        idx0, idx1 = hydpy.pub.timegrids.evalindices
+        sim_ = sim_[idx0:idx1]
+        obs_ = obs_[idx0:idx1]
+    mask: MatrixBool = numpy.ones_like(sim_, dtype=bool)
+    if skip_nan:
+        mask &= ~(numpy.isnan(sim_) | numpy.isnan(obs_))
+    if skip_notpositive:
+        with numpy.errstate(invalid="ignore"):
+            mask &= (sim_ > 0.0) & (obs_ > 0.0)
+    return SimObsMatrices(sim=sim_, obs=obs_, mask=mask)
+
+
+class _MultiStats:
+    """Lazily calculated statistics of masked multi-series data shared between
+    different criteria."""
+
+    def __init__(self, sim: MatrixFloat, obs: MatrixFloat, mask: MatrixBool) -> None:
+        self.sim = numpy.where(mask, sim, 0.0)
+        self.obs = numpy.where(mask, obs, 0.0)
+        self.mask = mask
+
+    @functools.cached_property
+    def n(self) -> VectorFloat:
+        """Number of valid value pairs."""
+        return numpy.sum(self.mask, axis=0, dtype=config.NP_FLOAT)
+
+    @functools.cached_property
+    def mean_sim(self) -> VectorFloat:
+        """Mean of the simulated values."""
+        return numpy.sum(self.sim, axis=0) / self.n
+
+    @functools.cached_property
+    def mean_obs(self) -> VectorFloat:
+        """Mean of the observed values."""
+        return numpy.sum(self.obs, axis=0) / self.n
+
+    @functools.cached_property
+    def dev_sim(self) -> MatrixFloat:
+        """Deviations of the simulated values from their mean."""
+        return numpy.where(self.mask, self.sim - self.mean_sim, 0.0)
+
+    @functools.cached_property
+    def dev_obs(self) -> MatrixFloat:
+        """Deviations of the observed values from their mean."""
+        return numpy.where(self.mask, self.obs - self.mean_obs, 0.0)
+
+    @functools.cached_property
+    def std_sim(self) -> VectorFloat:
+        """Standard deviation of the simulated values."""
+        return numpy.sqrt(numpy.sum(self.dev_sim**2, axis=0) / self.n)
+
+    @functools.cached_property
+    def std_obs(self) -> VectorFloat:
+        """Standard deviation of the observed values."""
+        return numpy.sqrt(numpy.sum(self.dev_obs**2, axis=0) / self.n)
+
+    @functools.cached_property
+    def corr(self) -> VectorFloat:
+        """Pearson correlation coefficient."""
+        cov = numpy.sum(self.dev_sim * self.dev_obs, axis=0) / self.n
+        return cov / (self.std_sim * self.std_obs)
+
+    @functools.cached_property
+    def sse(self) -> VectorFloat:
+        """Sum of the squared errors."""
+        return numpy.sum(numpy.where(self.mask, self.sim - self.obs, 0.0) ** 2, axis=0)
+
+    @functools.cached_property
+    def sorted(self) -> "_MultiStats":
+        """Statistics of the independently sorted simulated and observed values."""
+        sim = numpy.sort(numpy.where(self.mask, self.sim, numpy.nan), axis=0)
+        obs = numpy.sort(numpy.where(self.mask, self.obs, numpy.nan), axis=0)
+        idxs = numpy.arange(self.mask.shape[0])[:, numpy.newaxis]
+        mask = idxs < numpy.sum(self.mask, axis=0)[numpy.newaxis, :]
+        mask |= numpy.all(self.mask, axis=0)[numpy.newaxis, :]
+        return _MultiStats(sim=sim, obs=obs, mask=mask)
+
+    @functools.cached_property
+    def log(self) -> "_MultiStats":
+        """Statistics of the logarithmic simulated and observed values."""
+        sim = numpy.log(numpy.where(self.mask, self.sim, 1.0))
+        obs = numpy.log(numpy.where(self.mask, self.obs, 1.0))
+        return _MultiStats(sim=sim, obs=obs, mask=self.mask)
+
+    def calc_nse(self) -> VectorFloat:
+        """Nash-Sutcliffe efficiency."""
+        return 1.0 - self.sse / numpy.sum(self.dev_obs**2, axis=0)
+
+    def calc_kge(self) -> VectorFloat:
+        """Kling-Gupta efficiency."""
+        b = self.mean_sim / self.mean_obs
+        g = (self.std_sim / self.mean_sim) / (self.std_obs / self.mean_obs)
+        return 1.0 - ((self.corr - 1.0) ** 2 + (b - 1.0) ** 2 + (g - 1.0) ** 2) ** 0.5
+
+    def calc_corr(self) -> VectorFloat:
+        """Pearson correlation coefficient (|numpy.nan| for constant series)."""
+        invalid = (self.std_sim == 0.0) | (self.std_obs == 0.0)
+        return numpy.where(invalid, numpy.nan, self.corr)
+
+
+def calc_multicriteria(
+    *,
+    criteria: Iterable[Criterion],
+    sim: MatrixInputFloat | None = None,
+    obs: MatrixInputFloat | None = None,
+    nodes: Iterable[devicetools.Node] | None = None,
+    skip_nan: bool = False,
+    skip_notpositive: bool = False,
+    subperiod: bool | None = None,
+) -> MatrixFloat:
+    """Calculate multiple efficiency criteria for multiple pairs of simulated and
+    observed series in a single vectorised pass.
+
+    Calling functions like |nse| or |kge| in a loop over many series is
+    inefficient.  |calc_multicriteria| instead prepares all data via
+    |prepare_matrices|, applies the NaN and sub-period masks once, and calculates
+    intermediate results like means and standard deviations or the sorted values
+    required by flow duration curve criteria only once for all criteria.  It returns a
+    matrix with one row for each series and one column for each criterion:
+
+    >>> from hydpy.auxs.statstools import calc_multicriteria
+    >>> from hydpy import bias_abs, corr2, fdc_nse, kge, nse, print_matrix
+    >>> sim = [[1.0, 3.0], [2.0, 2.0], [3.0, 1.0], [5.0, 2.0]]
+    >>> obs = [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [4.0, 3.0]]
+    >>> criteria = (nse, kge, fdc_nse, corr2, bias_abs)
+    >>> print_matrix(calc_multicriteria(criteria=criteria, sim=sim, obs=obs))
+    | 0.8, 0.773391, 0.8, 0.965714, 0.25 |
+    | -2.272727, -0.856575, 0.636364, 0.727273, -0.25 |
+
+    The results agree with those of the single-series functions:
+
+    >>> from hydpy import round_
+    >>> for criterion in criteria:
+    ...     round_(criterion(sim=[3.0, 2.0, 1.0, 2.0], obs=[1.0, 2.0, 3.0, 3.0]))
+    -2.272727
+    -0.856575
+    0.636364
+    0.727273
+    -0.25
+
+    When activating `skip_nan`, |calc_multicriteria| ignores all value pairs
+    containing at least one |numpy.nan| value, individually for each series:
+
+    >>> from hydpy import nan
+    >>> sim = [[1.0, 3.0], [nan, 2.0], [3.0, 1.0], [5.0, 2.0]]
+    >>> print_matrix(calc_multicriteria(criteria=criteria, sim=sim, obs=obs))
+    | nan, nan, nan, nan, nan |
+    | -2.272727, -0.856575, 0.636364, 0.727273, -0.25 |
+    >>> print_matrix(
+    ...     calc_multicriteria(criteria=criteria, sim=sim, obs=obs, skip_nan=True))
+    | 0.785714, 0.793144, 0.785714, 0.964286, 0.333333 |
+    | -2.272727, -0.856575, 0.636364, 0.727273, -0.25 |
+    >>> for criterion in criteria:
+    ...     round_(criterion(sim=[1.0, 3.0, 5.0], obs=[1.0, 3.0, 4.0]))
+    0.785714
+    0.793144
+    0.785714
+    0.964286
+    0.333333
+
+    Alternatively, pass a collection of |Node| objects (see |prepare_matrices| for
+    the handling of the evaluation period).  |calc_multicriteria| supports the
+    criteria |rmse|, |nse|, |nse_log|, |fdc_nse|, |fdc_nse_log|, |corr|, |corr2|,
+    |kge|, |bias_abs|, |bias_rel|, |std_ratio|, and |var_ratio|:
+
+    >>> from hydpy import hsepd
+    >>> calc_multicriteria(criteria=[nse, hsepd], sim=sim, obs=obs)
+    Traceback (most recent call last):
+    ...
+    TypeError: Function `calc_multicriteria` does not support criterion `hsepd`.
+    """
+    criteria = tuple(criteria)
+    for criterion in criteria:
+        if criterion not in _CRITERION2MULTICRITERION:
+            name = getattr(criterion, "__name__", str(criterion))
+            raise TypeError(
+                f"Function `calc_multicriteria` does not support criterion `{name}`."
+            )
+    matrices = prepare_matrices(
+        sim=sim,
+        obs=obs,
+        nodes=nodes,
+        skip_nan=skip_nan,
+        skip_notpositive=skip_notpositive,
+        subperiod=subperiod,
+    )
+    stats = _MultiStats(*matrices)
+    results = numpy.empty((matrices.sim.shape[1], len(criteria)), dtype=config.NP_FLOAT)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        for idx, criterion in enumerate(criteria):
+            results[:, idx] = _CRITERION2MULTICRITERION[criterion](stats)
+    return results
+
+
+_CRITERION2MULTICRITERION: dict[Criterion, Callable[[_MultiStats], VectorFloat]] = {
+    rmse: lambda s: numpy.sqrt(s.sse / s.n),
+    nse: lambda s: s.calc_nse(),
+    nse_log: lambda s: s.log.calc_nse(),
+    fdc_nse: lambda s: s.sorted.calc_nse(),
+    fdc_nse_log: lambda s: s.sorted.log.calc_nse(),
+    corr: lambda s: s.calc_corr(),
+    corr2: lambda s: s.calc_corr() ** 2,
+    kge: lambda s: s.calc_kge(),
+    bias_abs: lambda s: s.mean_sim - s.mean_obs,
+    bias_rel: lambda s: s.mean_sim / s.mean_obs - 1.0,
+    std_ratio: lambda s: s.std_sim / s.std_obs - 1.0,
+    var_ratio: lambda s: ((s.std_sim / s.mean_sim) / (s.std_obs / s.mean_obs) - 1.0),
+}
+
+
 def _pars_sepd(xi: float, beta: float) -> tuple[float, float, float, float]:
     gamma1 = special.gamma(3.0 * (1.0 + beta) / 2.0)
     gamma2 = special.gamma((1.0 + beta) / 2.0)
@@ -2120,6 +2456,11 @@ def print_evaluationtable(
     test2  -1.00       0.00
     mean    0.00      -1.50
 
+    If all given criteria support it, |print_evaluationtable| calculates the
+    statistics of all nodes in a single vectorised pass via |calc_multicriteria|.
+    Otherwise, it falls back to calling the individual criteria functions for each
+    node.
+
     One can pass alternative names for the first cell, the node objects, the criteria
     functions, and the row containing the average values, as well as alternative column
     and decimal separators..  Also, one can use the `filter_` argument to suppress
@@ -2284,6 +2625,12 @@ number of given alternative names being 1.
     node2values: collections.defaultdict[devicetools.Node, list[float]]
     node2values = collections.defaultdict(list)
     data = numpy.empty((len(nodes), len(criteria)), dtype=config.NP_FLOAT)
+    multivalues: MatrixFloat | None = None
+    if (stepsize is None) and all(c in _CRITERION2MULTICRITERION for c in criteria):
+        multivalues = calc_multicriteria(
+            criteria=criteria, nodes=nodes, skip_nan=True, subperiod=subperiod
+        )
+        multivalues *= numpy.asarray(critfactors, dtype=config.NP_FLOAT)
     for idx, node in enumerate(nodes):
         if stepsize is not None:
             sim = seriestools.aggregate_series(
@@ -2301,7 +2648,9 @@ number of given alternative names being 1.
         else:
             sim, obs = prepare_arrays(node=node, skip_nan=False, subperiod=subperiod)
         availability = 0.0 if len(obs) == 0 else 1.0 - sum(numpy.isnan(obs)) / len(obs)
-        if availability > 0.0:
+        if (availability > 0.0) and (multivalues is not None):
+            node2values[node] = list(multivalues[idx])
+        elif availability > 0.0:
             for criterion, critfactor in zip(criteria, critfactors):
                 value = critfactor * criterion(sim=sim, obs=obs, skip_nan=True)
                 node2values[node].append(value)
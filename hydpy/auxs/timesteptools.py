@@ -0,0 +1,110 @@
+"""This module provides diagnostic features for analysing the computation time steps
+of models that adjust their internal time step to numerical stability criteria.
+
+So far, module |timesteptools| supports the routing submodels of |sw1d_channel| and
+|sw1d_network|.  By default, these models apply a single, globally stable time step to
+all their routing models.  Setting their solver parameter |NmbTimeStepClasses| to a
+value larger than one activates a multi-rate scheme that groups the routing models
+into power-of-two time step classes (see |Calc_TimeStep_V1|).  |timesteptools| helps to
+estimate how much computation time this scheme can save and how many classes are
+worth allowing.  It does not affect any simulation results.
+"""
+
+from __future__ import annotations
+import math
+
+from hydpy.core import modeltools
+from hydpy.core.typingtools import *
+from hydpy.interfaces import routinginterfaces
+
+
+class TimeStepClass(NamedTuple):
+    """A group of routing models that share the same power-of-two multiple of the
+    smallest stable computation time step."""
+
+    timestep: float
+    """The stable computation time step of the class [s]."""
+    nmbsubsteps: int
+    """The number of computation steps the class requires per simulation step [-]."""
+    routingmodels: tuple[int, ...]
+    """The positions of the class's routing models."""
+
+
+def calc_timestepclasses(model: modeltools.SubstepModel) -> tuple[TimeStepClass, ...]:
+    r"""Group all routing models of the given |sw1d_channel| or |sw1d_network| model
+    into power-of-two time step classes.
+
+    By default, |Calc_TimeStep_V1| applies the smallest |MaxTimeStep| estimate of all
+    routing models to the complete channel or network.  Hence, a single short or deep
+    segment can slow down the whole simulation.  |calc_timestepclasses| helps to find
+    such bottlenecks.  It assigns each routing model to the class :math:`k` that
+    satisfies :math:`2^k \cdot min(MaxTimeStep) \leq MaxTimeStep < 2^{k+1} \cdot
+    min(MaxTimeStep)` and reports the number of computation steps each class requires
+    per simulation step when applying its own time step:
+
+    >>> from hydpy.models.sw1d_channel import *
+    >>> parameterstep()
+    >>> derived.seconds(60.0)
+    >>> nmbsegments(4)
+    >>> for position, maxtimestep in enumerate([5.0, 60.0, 7.0, 25.0]):
+    ...     with model.add_routingmodel_v2(
+    ...         "sw1d_lias", position=position, update=False
+    ...     ):
+    ...         factors.maxtimestep = maxtimestep
+    >>> from hydpy.auxs.timesteptools import calc_timestepclasses
+    >>> for tsc in calc_timestepclasses(model):
+    ...     print(tsc)
+    TimeStepClass(timestep=5.0, nmbsubsteps=12, routingmodels=(0, 2))
+    TimeStepClass(timestep=20.0, nmbsubsteps=3, routingmodels=(3,))
+    TimeStepClass(timestep=40.0, nmbsubsteps=2, routingmodels=(1,))
+
+    Here, the routing models would require 12 + 12 + 3 + 2 = 29 instead of
+    4 * 12 = 48 calls per simulation step.  The time step of the last class is
+    :math:`2^3` times the smallest one, so setting |NmbTimeStepClasses| to four would
+    allow the multi-rate scheme to take all classes into account.  Note that
+    |calc_timestepclasses| relies on the |MaxTimeStep| values calculated during the
+    latest computation step.
+
+    Routing models without a finite time step estimate (or not following the
+    |RoutingModel_V1|, |RoutingModel_V2|, or |RoutingModel_V3| interface) are not
+    included:
+
+    >>> model.routingmodels[1].sequences.factors.maxtimestep = inf
+    >>> for tsc in calc_timestepclasses(model):
+    ...     print(tsc)
+    TimeStepClass(timestep=5.0, nmbsubsteps=12, routingmodels=(0, 2))
+    TimeStepClass(timestep=20.0, nmbsubsteps=3, routingmodels=(3,))
+    """
+    positions, maxtimesteps = [], []
+    for position, routingmodel in enumerate(model.routingmodels):
+        if isinstance(
+            routingmodel,
+            (
+                routinginterfaces.RoutingModel_V1,
+                routinginterfaces.RoutingModel_V2,
+                routinginterfaces.RoutingModel_V3,
+            ),
+        ):
+            maxtimestep = routingmodel.get_maxtimestep()
+            if math.isfinite(maxtimestep):
+                positions.append(position)
+                maxtimesteps.append(maxtimestep)
+    if not maxtimesteps:
+        return ()
+    seconds = model.parameters.derived.seconds.value
+    mintimestep = min(maxtimesteps)
+    class2positions: dict[int, list[int]] = {}
+    for position, maxtimestep in zip(positions, maxtimesteps):
+        class_ = int(math.floor(math.log2(maxtimestep / mintimestep)))
+        class2positions.setdefault(class_, []).append(position)
+    classes = []
+    for class_, positions_ in sorted(class2positions.items()):
+        timestep = min(mintimestep * 2.0**class_, seconds)
+        classes.append(
+            TimeStepClass(
+                timestep=timestep,
+                nmbsubsteps=int(math.ceil(seconds / timestep)),
+                routingmodels=tuple(positions_),
+            )
+        )
+    return tuple(classes)
@@ -74,16 +74,20 @@ import abc
 import collections
 import contextlib
 import copy
+import csv
+import importlib
 import itertools
+import multiprocessing
+from multiprocessing import queues
 import operator
 import typing
 import warnings
 import weakref
 
-import inflect
 import numpy
 
 import hydpy
+from hydpy import config
 from hydpy.core import exceptiontools
 from hydpy.core import masktools
 from hydpy.core import netcdftools
@@ -126,6 +130,27 @@ NodeVariableType: TypeAlias = Union[
 
 _default_variable: NodeVariableType = "Q"
 
+ConnectionGroup: TypeAlias = Literal[
+    "inlets", "outlets", "observers", "receivers", "senders", "inputs", "outputs"
+]
+
+# incompatibility due to circularity:
+#     inlets / observers / inputs <-> outlets / senders / outputs
+# incompatibility due to different updating:
+#     outlets / senders <-> outputs
+# other combinations are unlikely but technically possible
+_CONNECTIONGROUPS: Final[
+    dict[ConnectionGroup, tuple[str, tuple[ConnectionGroup, ...]]]
+] = {
+    "inlets": ("_exits", ("outlets", "senders", "outputs")),
+    "outlets": ("_entries", ("inlets", "observers", "inputs", "outputs")),
+    "observers": ("_exits", ("outlets", "inputs", "outputs", "senders")),
+    "receivers": ("_exits", ()),
+    "senders": ("_entries", ("inlets", "observers", "inputs", "outputs")),
+    "inputs": ("_exits", ("outlets", "senders", "outputs")),
+    "outputs": ("_entries", ("inlets", "observers", "inputs", "outlets", "senders")),
+}
+
 
 class Keywords(set[str]):
     """Set of keyword arguments used to describe and search for |Element| and |Node|
@@ -699,6 +724,12 @@ classes: Node and str.
     _mutable: bool
     _name2device: dict[str, TypeDevice]
     _shadowed_keywords: set[str]
+    _ref: weakref.ReferenceType[Devices[Any]]
+
+    __hydpy__connectionversion__: ClassVar[int] = 0
+    """Class variable that counts all modifications of the immutable |Nodes| and
+    |Elements| objects that define the connections between nodes and elements and so
+    eventually the network's structure."""
 
     def __new__(
         cls, *values: MayNonerable2[TypeDevice, str], mutable: bool = True
@@ -710,12 +741,22 @@ classes: Node and str.
         setattr_(self, "_mutable", mutable)
         setattr_(self, "_name2device", {})
         setattr_(self, "_shadowed_keywords", set())
+        self._register()
         contentclass = self.get_contentclass()
         try:
-            for value in objecttools.extract(
-                values, types_=(contentclass, str), skip=True
-            ):
-                self.add_device(value, force=True)
+            devices: list[TypeDevice] = []
+            for value in values:
+                if isinstance(value, cls):
+                    devices.extend(value._name2device.values())
+                    continue
+                for subvalue in objecttools.extract(
+                    value, types_=(contentclass, str), skip=True
+                ):
+                    if isinstance(subvalue, str):
+                        self.add_device(subvalue, force=True)
+                    else:
+                        devices.append(subvalue)
+            self._add_devices(devices)
         except BaseException:
             objecttools.augment_excmessage(
                 f"While trying to initialise a `{type(self).__name__}` object"
@@ -727,6 +768,58 @@ classes: Node and str.
     def get_contentclass() -> type[TypeDevice]:
         """To be overridden."""
 
+    def _register(self) -> None:
+        # Each device references the handlers containing it by their IDs to keep them
+        # informed about name changes.  All devices share the same weak reference to
+        # the same handler, which removes all references when the handler dies.
+        id_ = id(self)
+        name2device = self._name2device
+        super().__setattr__(
+            "_ref", weakref.ref(self, lambda ref: _unregister(id_, name2device, ref))
+        )
+
+    def _add_devices(self, devices: Iterable[TypeDevice]) -> None:
+        # Bulk version of `add_device` for device objects, which does neither check
+        # mutability nor validate the devices' names, as they are already known.
+        # Devices not registered anymore (see `clear_all`) are replaced as in
+        # `add_device`.
+        contentclass = self.get_contentclass()
+        registry, selection = _registry[contentclass], _selection[contentclass]
+        name2device, id_, ref = self._name2device, id(self), self._ref
+        added = False
+        for device in devices:
+            name = device.name
+            if registry.get(name) is device:
+                selection[name] = device
+            else:
+                device = contentclass(device)
+            name2device[name] = device
+            _id2devices[device][id_] = ref
+            added = True
+        if added and not self._mutable:
+            Devices.__hydpy__connectionversion__ += 1
+
+    def _remove_devices(self, names: Iterable[str]) -> None:
+        # Bulk version of `remove_device` for device names, which neither checks
+        # mutability nor complains about missing devices.
+        name2device, id_ = self._name2device, id(self)
+        removed = False
+        for name in names:
+            if (device := name2device.pop(name, None)) is not None:
+                _id2devices[device].pop(id_, None)
+                removed = True
+        if removed and not self._mutable:
+            Devices.__hydpy__connectionversion__ += 1
+
+    def _get_name2device(
+        self, values: Mayberable2[TypeDevice, str]
+    ) -> Mapping[str, TypeDevice]:
+        # pylint: disable=protected-access
+        # (accessing other instances of the same class)
+        if isinstance(values, Devices):
+            return values._name2device
+        return type(self)(values)._name2device
+
     def add_device(self, device: TypeDevice | str, force: bool = False) -> None:
         """Add the given |Node| or |Element| object to the actual |Nodes| or |Elements|
         object.
@@ -762,7 +855,9 @@ the following error occurred: Adding devices to immutable Nodes objects is not a
             if force or self._mutable:
                 _device = self.get_contentclass()(device)
                 self._name2device[_device.name] = _device
-                _id2devices[_device][id(self)] = cast(Devices[Device], self)  # ToDo
+                _id2devices[_device][id(self)] = self._ref
+                if not self._mutable:
+                    Devices.__hydpy__connectionversion__ += 1
             else:
                 raise RuntimeError(
                     f"Adding devices to immutable {type(self).__name__} objects is "
@@ -826,6 +921,8 @@ allowed.
                         f"such a device."
                     ) from None
                 del _id2devices[_device][id(self)]
+                if not self._mutable:
+                    Devices.__hydpy__connectionversion__ += 1
             else:
                 raise RuntimeError(
                     f"Removing devices from immutable {type(self).__name__} objects "
@@ -912,12 +1009,10 @@ allowed.
         >>> sorted(newgroup.keywords)
         ['group_1', 'group_a', 'group_b']
         """
-        return {
-            keyword
-            for device in self
-            for keyword in device.keywords
-            if keyword not in self._shadowed_keywords
-        }
+        keywords: set[str] = set()
+        for device in self._name2device.values():
+            keywords.update(device.keywords)
+        return keywords - self._shadowed_keywords
 
     def search_keywords(self: TypeDevices, *keywords: str) -> TypeDevices:
         """Search for all devices handling at least one of the given keywords and
@@ -941,9 +1036,15 @@ allowed.
             >>> Node.clear_all()
         """
         keywords_ = set(keywords)
-        return type(self)(
-            *(device for device in self if keywords_.intersection(device.keywords))
+        devices = type(self)()
+        # pylint: disable=protected-access
+        # (accessing another instance of the same class)
+        devices._add_devices(
+            device
+            for device in self._name2device.values()
+            if not keywords_.isdisjoint(device.keywords)
         )
+        return devices
 
     def copy(self: TypeDevices) -> TypeDevices:
         """Return a shallow copy of the actual |Nodes| or |Elements| object.
@@ -984,11 +1085,11 @@ conflict with using their names as identifiers.
         """
         # pylint: disable=protected-access
         new = type(self)()
-        vars(new).update(vars(self))
-        new._name2device = copy.copy(self._name2device)
-        new._shadowed_keywords.clear()
-        for device in self:
-            _id2devices[device][id(new)] = new
+        new._mutable = self._mutable
+        new._name2device.update(self._name2device)
+        id_, ref = id(new), new._ref
+        for device in new._name2device.values():
+            _id2devices[device][id_] = ref
         return new
 
     def intersection(self: TypeDevices, *other: TypeDevices) -> TypeDevices:
@@ -1004,7 +1105,13 @@ conflict with using their names as identifiers.
 
             >>> Node.clear_all()
         """
-        return type(self)(*set(self).intersection(set(other)))
+        names = set(self._name2device)
+        names.intersection_update(device.name for device in other)
+        devices = type(self)()
+        # pylint: disable=protected-access
+        # (accessing another instance of the same class)
+        devices._add_devices(self._name2device[name] for name in names)
+        return devices
 
     __copy__ = copy
 
@@ -1018,7 +1125,10 @@ conflict with using their names as identifiers.
 
     def __select_devices_by_keyword(self: TypeDevices, name: str) -> TypeDevices:
         # pylint: disable=protected-access
-        devices = type(self)(*(device for device in self if name in device.keywords))
+        devices = type(self)()
+        devices._add_devices(
+            device for device in self._name2device.values() if name in device.keywords
+        )
         devices._shadowed_keywords = self._shadowed_keywords.copy()
         devices._shadowed_keywords.add(name)
         return devices
@@ -1110,36 +1220,43 @@ conflict with using their names as identifiers.
     def __add__(self: TypeDevices, other: Mayberable2[TypeDevice, str]) -> TypeDevices:
         new = copy.copy(self)
         new._mutable = True
-        for device in type(self)(other):
-            new.add_device(device)
+        new._add_devices(self._get_name2device(other).values())
         return new
 
     def __iadd__(self: TypeDevices, other: Mayberable2[TypeDevice, str]) -> TypeDevices:
-        for device in type(self)(other):
-            self.add_device(device)
+        name2device = self._get_name2device(other)
+        if self._mutable:
+            self._add_devices(name2device.values())
+        else:
+            for device in tuple(name2device.values()):
+                self.add_device(device)
         return self
 
     def __sub__(self: TypeDevices, other: Mayberable2[TypeDevice, str]) -> TypeDevices:
         new = copy.copy(self)
         new._mutable = True
-        for device in type(self)(other):
-            try:
-                new.remove_device(device)
-            except ValueError:
-                pass
+        new._remove_devices(self._get_name2device(other))
         return new
 
     def __isub__(self: TypeDevices, other: Mayberable2[TypeDevice, str]) -> TypeDevices:
-        for device in type(self)(other):
-            try:
-                self.remove_device(device)
-            except ValueError:
-                pass
+        name2device = self._get_name2device(other)
+        if self._mutable:
+            self._remove_devices(tuple(name2device))
+        else:
+            for device in tuple(name2device.values()):
+                try:
+                    self.remove_device(device)
+                except ValueError:
+                    pass
         return self
 
     def __compare(self, other: object, func: Callable[[Any, Any], bool]) -> bool:
+        # pylint: disable=protected-access
+        # (accessing other instances of the same class)
         if isinstance(other, type(self)):
-            return func(set(self), set(other))
+            return func(
+                set(self._name2device.values()), set(other._name2device.values())
+            )
         return NotImplemented
 
     def __lt__(self: TypeDevices, other: TypeDevices) -> bool:
@@ -1649,17 +1766,36 @@ class `Elements` is deprecated.  Use method `prepare_models` instead.
         parameterstep: timetools.PeriodConstrArg | None = None,
         simulationstep: timetools.PeriodConstrArg | None = None,
         auxfiler: auxfiletools.Auxfiler | None = None,
+        processes: int = 1,
     ) -> None:
         """Save the control parameters of the |Model| object handled by each |Element|
-        object and eventually the ones handled by the given |Auxfiler| object."""
+        object and eventually the ones handled by the given |Auxfiler| object.
+
+        For a `processes` value larger than one, method |Elements.save_controls|
+        formats and writes the control files in parallel (see method
+        |HydPy.save_controls|).
+        """
         if auxfiler:
             auxfiler.write(parameterstep=parameterstep, simulationstep=simulationstep)
-        for element in printtools.progressbar(self):
-            element.model.save_controls(
+        if (
+            (processes > 1)
+            and (len(self) > 1)
+            and ("fork" in multiprocessing.get_all_start_methods())
+        ):
+            _save_controls_in_parallel(
+                elements=tuple(self),
                 parameterstep=parameterstep,
                 simulationstep=simulationstep,
                 auxfiler=auxfiler,
+                processes=processes,
             )
+        else:
+            for element in printtools.progressbar(self):
+                element.model.save_controls(
+                    parameterstep=parameterstep,
+                    simulationstep=simulationstep,
+                    auxfiler=auxfiler,
+                )
 
     @printtools.print_progress
     def update_parameters(self) -> None:
@@ -1866,7 +2002,7 @@ class Device:
             setattr(self, "new_instance", True)
             self._keywords = Keywords()
             self._keywords.device = self
-            _id2devices[self] = weakref.WeakValueDictionary()
+            _id2devices[self] = {}
             _registry[cls][name] = self
         _selection[cls][name] = _registry[cls][name]
         return self
@@ -1902,6 +2038,7 @@ class Device:
         """
         _selection[cls].clear()
         _registry[cls].clear()
+        _clear_devicegraphs()
 
     @property
     def name(self) -> str:
@@ -1952,13 +2089,18 @@ a valid variable identifier.  ...
     @name.setter
     def name(self, name: str) -> None:
         self.__check_name(name)
-        for devices in tuple(_id2devices[self].values()):
+        handlers = tuple(
+            devices
+            for ref in tuple(_id2devices[self].values())
+            if (devices := ref()) is not None
+        )
+        for devices in handlers:
             if hasattr(devices, self.name):
                 del devices._name2device[self.name]  # pylint: disable=protected-access
         del _registry[type(self)][self.name]
         self._name = name
         _registry[type(self)][self.name] = self
-        for devices in tuple(_id2devices[self].values()):
+        for devices in handlers:
             devices._name2device[self.name] = self  # pylint: disable=protected-access
 
     @classmethod
@@ -2909,6 +3051,8 @@ the following error occurred: '.' is not a valid value for ls. Did you mean: '-.
             periodstring = f" for the period `{tg.firstdate}` to `{tg.lastdate}`"
         else:
             periodstring = ""
+        import inflect  # pylint: disable=import-outside-toplevel
+
         p = inflect.engine()
         n = len(sequences)
         objecttools.augment_excmessage(
@@ -3225,29 +3369,19 @@ already a collective `NileRiver` member.
         # due to internal type conversion
         # see issue https://github.com/python/mypy/issues/3004
 
-    def __update_group(
-        self,
-        values: NodesConstrArg,
-        targetnodes: str,
-        targetelements: str,
-        incompatiblenodes: tuple[str, ...],
-    ) -> None:
-
-        # incompatibility due to circularity:
-        #     inlets / observers / inputs <-> outlets / senders / outputs
-        # incompatibility due to different updating:
-        #     outlets / senders <-> outputs
-        # other combinations are unlikely but technically possible
-
-        elementgroup: Nodes = getattr(self, targetnodes)
+    def __update_group(self, values: NodesConstrArg, group: ConnectionGroup) -> None:
+        targetelements, incompatiblegroups = _CONNECTIONGROUPS[group]
+        elementgroup: Nodes = getattr(self, f"_{group}")
         for node in Nodes(values):
-            for incomp in incompatiblenodes:
-                if node in getattr(self, incomp):
+            for incomp in incompatiblegroups:
+                if node in getattr(self, f"_{incomp}"):
+                    import inflect  # pylint: disable=import-outside-toplevel
+
                     engine = inflect.engine()
                     raise ValueError(
-                        f"For element `{self}`, the given {targetnodes[1:-1]} node "
-                        f"`{node}` is already defined as {engine.a(incomp[1:-1])} "
-                        f"node, which is not allowed."
+                        f"For element `{self}`, the given {group[:-1]} node `{node}` "
+                        f"is already defined as {engine.a(incomp[:-1])} node, which "
+                        f"is not allowed."
                     )
             elementgroup.add_device(node, force=True)
             nodegroup: Elements = getattr(node, targetelements)
@@ -3259,12 +3393,7 @@ already a collective `NileRiver` member.
         return self._inlets
 
     def _set_inlets(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_inlets",
-            targetelements="_exits",
-            incompatiblenodes=("_outlets", "_senders", "_outputs"),
-        )
+        self.__update_group(values, "inlets")
 
     inlets = propertytools.Property(fget=_get_inlets, fset=_set_inlets)
 
@@ -3274,12 +3403,7 @@ already a collective `NileRiver` member.
         return self._outlets
 
     def _set_outlets(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_outlets",
-            targetelements="_entries",
-            incompatiblenodes=("_inlets", "_observers", "_inputs", "_outputs"),
-        )
+        self.__update_group(values, "outlets")
 
     outlets = propertytools.Property(fget=_get_outlets, fset=_set_outlets)
 
@@ -3290,12 +3414,7 @@ already a collective `NileRiver` member.
         return self._observers
 
     def _set_observers(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_observers",
-            targetelements="_exits",
-            incompatiblenodes=("_outlets", "_inputs", "_outputs", "_senders"),
-        )
+        self.__update_group(values, "observers")
 
     observers = propertytools.Property(fget=_get_observers, fset=_set_observers)
 
@@ -3306,12 +3425,7 @@ already a collective `NileRiver` member.
         return self._receivers
 
     def _set_receivers(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_receivers",
-            targetelements="_exits",
-            incompatiblenodes=(),
-        )
+        self.__update_group(values, "receivers")
 
     receivers = propertytools.Property(fget=_get_receivers, fset=_set_receivers)
 
@@ -3321,12 +3435,7 @@ already a collective `NileRiver` member.
         return self._senders
 
     def _set_senders(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_senders",
-            targetelements="_entries",
-            incompatiblenodes=("_inlets", "_observers", "_inputs", "_outputs"),
-        )
+        self.__update_group(values, "senders")
 
     senders = propertytools.Property(fget=_get_senders, fset=_set_senders)
 
@@ -3337,12 +3446,7 @@ already a collective `NileRiver` member.
         return self._inputs
 
     def _set_inputs(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_inputs",
-            targetelements="_exits",
-            incompatiblenodes=("_outlets", "_senders", "_outputs"),
-        )
+        self.__update_group(values, "inputs")
 
     inputs = propertytools.Property(fget=_get_inputs, fset=_set_inputs)
 
@@ -3353,18 +3457,7 @@ already a collective `NileRiver` member.
         return self._outputs
 
     def _set_outputs(self, values: NodesConstrArg) -> None:
-        self.__update_group(
-            values,
-            targetnodes="_outputs",
-            targetelements="_entries",
-            incompatiblenodes=(
-                "_inlets",
-                "_observers",
-                "_inputs",
-                "_outlets",
-                "_senders",
-            ),
-        )
+        self.__update_group(values, "outputs")
 
     outputs = propertytools.Property(fget=_get_outputs, fset=_set_outputs)
 
@@ -4017,11 +4110,26 @@ sequence named `xy`.
         return self.assignrepr("")
 
 
-_id2devices: dict[Device, weakref.WeakValueDictionary[int, Devices[Device]]] = {}
+_id2devices: dict[Device, dict[int, weakref.ReferenceType[Devices[Any]]]] = {}
 _registry: Mapping[type[Device], dict[str, Device]] = {Node: {}, Element: {}}
 _selection: Mapping[type[Device], dict[str, Device]] = {Node: {}, Element: {}}
 
 
+def _unregister(
+    id_: int, name2device: Mapping[str, Device], ref: weakref.ReferenceType[Any]
+) -> None:
+    for device in name2device.values():
+        if (refs := _id2devices.get(device)) is not None and refs.get(id_) is ref:
+            del refs[id_]
+
+
+def _clear_devicegraphs() -> None:
+    # the cached graphs must not keep removed devices alive
+    from hydpy.core import hydpytools  # pylint: disable=import-outside-toplevel
+
+    hydpytools.clear_devicegraphs()
+
+
 @contextlib.contextmanager
 def clear_registries_temporarily() -> Generator[None, None, None]:
     """Context manager for clearing the current |Node|, |Element|, and |FusedVariable|
@@ -4083,8 +4191,10 @@ def clear_registries_temporarily() -> Generator[None, None, None]:
     try:
         for registry in registries:
             registry.clear()
+        _clear_devicegraphs()
         yield
     finally:
+        _clear_devicegraphs()
         for registry, copy_ in zip(registries, copies):
             registry.update(copy_)
 
@@ -4109,3 +4219,254 @@ def _get_pandasindex() -> pandas.Index:
         unit="ns",
     )
     return index
+
+
+def _save_controls_in_parallel(
+    *,
+    elements: tuple[Element, ...],
+    parameterstep: timetools.PeriodConstrArg | None,
+    simulationstep: timetools.PeriodConstrArg | None,
+    auxfiler: auxfiletools.Auxfiler | None,
+    processes: int,
+) -> None:
+    """Let forked worker processes write the control files of the given elements.
+
+    Each worker process formats and writes the control files of a contiguous chunk of
+    elements.  The "fork" start method passes the elements and the other arguments to
+    the workers without pickling them.  The workers report their errors via a queue so
+    that the parent process can re-raise the first one.
+    """
+    hydpy.pub.controlmanager.currentpath  # pylint: disable=pointless-statement
+    context = multiprocessing.get_context("fork")
+    errors: queues.SimpleQueue[BaseException | None] = context.SimpleQueue()
+    nmbelements = len(elements)
+    nmbchunks = min(nmbelements, processes)
+    bounds = [idx * nmbelements // nmbchunks for idx in range(nmbchunks + 1)]
+    workers = tuple(
+        context.Process(
+            target=_save_controls_of_chunk,
+            args=(
+                elements[start:stop],
+                parameterstep,
+                simulationstep,
+                auxfiler,
+                errors,
+            ),
+        )
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    )
+    for worker in workers:
+        worker.start()
+    for worker in printtools.progressbar(workers):
+        worker.join()
+    if any(worker.exitcode for worker in workers):
+        raise RuntimeError(
+            "At least one process for writing control files terminated unexpectedly."
+        )
+    for _ in workers:
+        error = errors.get()
+        if error is not None:
+            raise error
+
+
+def _save_controls_of_chunk(
+    elements: tuple[Element, ...],
+    parameterstep: timetools.PeriodConstrArg | None,
+    simulationstep: timetools.PeriodConstrArg | None,
+    auxfiler: auxfiletools.Auxfiler | None,
+    errors: queues.SimpleQueue[BaseException | None],
+) -> None:
+    try:
+        for element in elements:
+            element.model.save_controls(
+                parameterstep=parameterstep,
+                simulationstep=simulationstep,
+                auxfiler=auxfiler,
+            )
+    except BaseException as exc:
+        errors.put(exc)
+    else:
+        errors.put(None)
+
+
+NETWORKTABLE_COLUMNS: Final = (
+    "device",
+    "name",
+    "variable",
+    "collective",
+    "keywords",
+    "inlets",
+    "outlets",
+    "observers",
+    "receivers",
+    "senders",
+    "inputs",
+    "outputs",
+)
+"""The columns of the tabular network files written by |save_networktable| and read by
+|load_networktable|."""
+
+
+_ALIASMARKER: Final = "alias:"
+
+
+def _encode_variable(variable: NodeVariableType) -> str:
+    if isinstance(variable, str):
+        return variable
+    if isinstance(variable, FusedVariable):
+        aliases = " ".join(hydpy.sequence2alias[sequence] for sequence in variable)
+        return f"{variable}({aliases})"
+    return f"{_ALIASMARKER}{hydpy.sequence2alias[variable]}"
+
+
+def _decode_alias(alias: str) -> sequencetools.InOutSequenceTypes:
+    parts = alias.rsplit("_", 2)
+    sequencetype = None
+    if len(parts) == 3:
+        model, group, classname = parts
+        try:
+            module = importlib.import_module(f"hydpy.models.{model}.{model}_{group}")
+        except ModuleNotFoundError:
+            pass
+        else:
+            sequencetype = getattr(module, classname, None)
+    if sequencetype is None:
+        raise ValueError(
+            f"The alias `{alias}` does not refer to an available input or output "
+            f"sequence."
+        )
+    hydpy.sequence2alias[sequencetype] = alias
+    return cast(sequencetools.InOutSequenceTypes, sequencetype)
+
+
+def _decode_variable(text: str) -> NodeVariableType:
+    if text.startswith(_ALIASMARKER):
+        return _decode_alias(text[len(_ALIASMARKER) :])
+    if text.endswith(")"):
+        name, aliases = text[:-1].split("(")
+        try:
+            return FusedVariable(name, *(_decode_alias(a) for a in aliases.split()))
+        except BaseException:
+            objecttools.augment_excmessage(
+                f"While trying to decode the fused variable `{name}`"
+            )
+    return text
+
+
+def save_networktable(
+    filepath: str, nodes: Iterable[Node], elements: Iterable[Element]
+) -> None:
+    """Write the given nodes and elements into a tabular network file in CSV format.
+
+    Each row describes a single |Node| or |Element| object.  Cells listing multiple
+    keywords or connected nodes separate their entries by single blanks.  Text-based
+    variables are written as they are, input or output sequences by their alias (see
+    module `aliases`) prefixed with "alias:", and |FusedVariable| objects by their name
+    followed by the aliases of their sequences in parentheses.  See the documentation
+    on method |Selection.save_networktable| for an example.
+    """
+    with open(filepath, "w", encoding=config.ENCODING, newline="") as file_:
+        writer = csv.writer(file_)
+        writer.writerow(NETWORKTABLE_COLUMNS)
+        for node in nodes:
+            writer.writerow(
+                ("Node", node.name, _encode_variable(node.variable), "")
+                + (" ".join(sorted(node.keywords)),)
+                + len(_CONNECTIONGROUPS) * ("",)
+            )
+        for element in elements:
+            writer.writerow(
+                ("Element", element.name, "", element.collective or "")
+                + (" ".join(sorted(element.keywords)),)
+                + tuple(
+                    " ".join(node.name for node in getattr(element, group))
+                    for group in _CONNECTIONGROUPS
+                )
+            )
+
+
+def load_networktable(filepath: str) -> None:
+    """Create all |Node| and |Element| objects defined in the given tabular network
+    file.
+
+    Function |load_networktable| is the counterpart of function |save_networktable|.
+    Like executing a Python network file, it registers the new devices so that one can
+    query them via |Device.extract_new| afterwards.  However, it processes the table's
+    rows in bulk.  It validates all keywords at once and checks the compatibility of
+    all connections of an element based on the node names given in the same row
+    before connecting all nodes and elements directly.  See the documentation on
+    method |Selection.save_networktable| for an example.
+    """
+    with open(filepath, encoding=config.ENCODING, newline="") as file_:
+        reader = csv.DictReader(file_)
+        if (fieldnames := reader.fieldnames) is None:
+            fieldnames = []
+        for column in ("device", "name"):
+            if column not in fieldnames:
+                raise RuntimeError(
+                    f"The network table `{filepath}` does not provide the required "
+                    f"column `{column}`."
+                )
+        rows = tuple(reader)
+    keywords: set[str] = set()
+    for row in rows:
+        keywords.update((row.get("keywords") or "").split())
+    Keywords(*keywords)
+    str2variable: dict[str, NodeVariableType] = {}
+    name2node: dict[str, Node] = {}
+    elementrows = []
+    for row in rows:
+        device = row["device"]
+        if device == "Element":
+            elementrows.append(row)
+            continue
+        if device != "Node":
+            raise ValueError(
+                f"The network table `{filepath}` contains the device type `{device}`, "
+                f"but only `Node` and `Element` are supported."
+            )
+        text = row.get("variable") or ""
+        if text:
+            if (variable := str2variable.get(text)) is None:
+                variable = _decode_variable(text)
+                str2variable[text] = variable
+            node = Node(row["name"], variable=variable)
+        else:
+            node = Node(row["name"])
+        set.update(node.keywords, (row.get("keywords") or "").split())
+        name2node[node.name] = node
+    for row in elementrows:
+        element = Element(row["name"], collective=row.get("collective") or None)
+        set.update(element.keywords, (row.get("keywords") or "").split())
+        group2names = {
+            group: (row.get(group) or "").split() for group in _CONNECTIONGROUPS
+        }
+        for group, names in group2names.items():
+            incompatiblegroups = _CONNECTIONGROUPS[group][1]
+            for incomp in incompatiblegroups:
+                others = getattr(element, f"_{incomp}")
+                for name in names:
+                    if (name in group2names[incomp]) or (name in others):
+                        import inflect  # pylint: disable=import-outside-toplevel
+
+                        engine = inflect.engine()
+                        raise ValueError(
+                            f"For element `{element}`, the given {group[:-1]} node "
+                            f"`{name}` is already defined as {engine.a(incomp[:-1])} "
+                            f"node, which is not allowed."
+                        )
+        for group, names in group2names.items():
+            if not names:
+                continue
+            targetelements = _CONNECTIONGROUPS[group][0]
+            connectednodes = []
+            for name in names:
+                if name not in name2node:
+                    name2node[name] = Node(name)
+                connectednodes.append(name2node[name])
+            # pylint: disable=protected-access
+            # `_add_devices` skips the checks already performed above:
+            getattr(element, f"_{group}")._add_devices(connectednodes)
+            for node in connectednodes:
+                getattr(node, targetelements)._add_devices((element,))
+            # pylint: enable=protected-access
@@ -885,6 +885,25 @@ class NetworkManager(FileManager):
     ...     selections == networkmanager.load_files()
     True
 
+    Alternatively, method |NetworkManager.save_files| writes tabular network files,
+    which method |NetworkManager.load_files| reads in bulk (see function
+    |devicetools.load_networktable|).  The resulting selections are identical:
+
+    >>> with TestIO():
+    ...     networkmanager.currentdir = "testtable"
+    ...     networkmanager.save_files(selections, filetype="csv")
+    ...     sorted(os.listdir("HydPy-H-Lahn/network/testtable"))
+    ['headwaters.csv', 'nonheadwaters.csv', 'streams.csv']
+    >>> with TestIO():
+    ...     selections == networkmanager.load_files()
+    True
+    >>> with TestIO():
+    ...     networkmanager.delete_files(selections)
+    ...     sorted(os.listdir("HydPy-H-Lahn/network/testtable"))
+    []
+    >>> with TestIO():
+    ...     networkmanager.currentdir = "testdir"
+
     Method |NetworkManager.delete_files| removes the network files of the given
     |Selection| objects:
 
@@ -945,10 +964,39 @@ nonheadwaters` into network files, the following error occurred: ...
     BASEDIR = "network"
     DEFAULTDIR = "default"
 
+    @property
+    def filenames(self) -> list[str]:
+        """The names of the Python and CSV network files in the current working
+        directory, except those starting with an underscore (_) or a dot (.).
+
+        >>> from hydpy.core.filetools import NetworkManager
+        >>> networkmanager = NetworkManager()
+        >>> networkmanager.projectdir = "projectname"
+        >>> from hydpy import TestIO
+        >>> with TestIO():
+        ...     networkmanager.currentdir = "testdir"
+        ...     open("projectname/network/testdir/file1.txt", "w").close()
+        ...     open("projectname/network/testdir/file2.csv", "w").close()
+        ...     open("projectname/network/testdir/_file1.py", "w").close()
+        ...     open("projectname/network/testdir/.file1.csv", "w").close()
+        ...     open("projectname/network/testdir/file3.py", "w").close()
+        ...     networkmanager.filenames
+        ['file2.csv', 'file3.py']
+        """
+        return sorted(
+            fn
+            for fn in os.listdir(self.currentpath)
+            if not fn.startswith(("_", ".")) and fn.endswith((".py", ".csv"))
+        )
+
     def load_files(self) -> selectiontools.Selections:
         """Read all network files of the current working directory, structure their
         contents in a |selectiontools.Selections| object, and return it.
 
+        Method |NetworkManager.load_files| executes Python network files and passes
+        tabular network files (with the file ending `.csv`) to function
+        |devicetools.load_networktable|.
+
         See the main documentation of class |NetworkManager| for further information.
         """
         selections = selectiontools.Selections()
@@ -961,6 +1009,19 @@ nonheadwaters` into network files, the following error occurred: ...
             # Ensure both `Node` and `Element`start with a `fresh` memory.
             devicetools.Node.extract_new()
             devicetools.Element.extract_new()
+            if filename.endswith(".csv"):
+                try:
+                    devicetools.load_networktable(path)
+                except BaseException:
+                    objecttools.augment_excmessage(
+                        f"While trying to load the network file `{path}`"
+                    )
+                selections += selectiontools.Selection(
+                    filename.split(".")[0],
+                    devicetools.Node.extract_new(),
+                    devicetools.Element.extract_new(),
+                )
+                continue
             try:
                 info = runpy.run_path(path)
             except BaseException:
@@ -980,18 +1041,28 @@ nonheadwaters` into network files, the following error occurred: ...
                 ) from None
         return selections
 
-    def save_files(self, selections: Iterable[selectiontools.Selection]) -> None:
+    def save_files(
+        self,
+        selections: Iterable[selectiontools.Selection],
+        filetype: Literal["py", "csv"] = "py",
+    ) -> None:
         """Save the |Selection| objects contained in the given |Selections| instance to
         separate network files.
 
+        Use the `filetype` argument to select between writing Python files (`py`, the
+        default) and tabular network files (`csv`).
+
         See the main documentation on class |NetworkManager| for further information.
         """
         selections = tuple(selections)
         try:
             currentpath = self.currentpath
             for selection in selections:
-                path = os.path.join(currentpath, selection.name + ".py")
-                selection.save_networkfile(filepath=path)
+                path = os.path.join(currentpath, f"{selection.name}.{filetype}")
+                if filetype == "csv":
+                    selection.save_networktable(filepath=path)
+                else:
+                    selection.save_networkfile(filepath=path)
         except BaseException:
             objecttools.augment_excmessage(
                 f"While trying to save the selection(s) "
@@ -1002,6 +1073,10 @@ nonheadwaters` into network files, the following error occurred: ...
         """Delete the network files corresponding to the given selections (e.g. a
         |list| of |str| objects or a |Selections| object).
 
+        For selection names without file ending, method |NetworkManager.delete_files|
+        removes the respective Python file or, if only a tabular one exists, the CSV
+        file.
+
         See the main documentation on class |NetworkManager| for further information.
         """
         selections = tuple(selections)
@@ -1009,8 +1084,13 @@ nonheadwaters` into network files, the following error occurred: ...
             currentpath = self.currentpath
             for selection in selections:
                 name = str(selection)
-                if not name.endswith(".py"):
-                    name += ".py"
+                if not name.endswith((".py", ".csv")):
+                    csvpath = os.path.join(currentpath, f"{name}.csv")
+                    pypath = os.path.join(currentpath, f"{name}.py")
+                    if os.path.exists(csvpath) and not os.path.exists(pypath):
+                        name += ".csv"
+                    else:
+                        name += ".py"
                 path = os.path.join(currentpath, name)
                 os.remove(path)
         except BaseException:
@@ -1186,10 +1266,43 @@ name or the responsible Element object.
         cls._registry.clear()
 
     def save_file(self, filename: str, text: str) -> None:
-        """Save the given text under the given control filename and the current path."""
+        """Save the given text under the given control filename and the current path.
+
+        Method |ControlManager.save_file| does not rewrite existing files that already
+        contain the given text.  This saves time when writing many control files of
+        which only a few changed and keeps the modification times of the unchanged
+        files:
+
+        >>> import os
+        >>> from hydpy import TestIO
+        >>> from hydpy.core.filetools import ControlManager
+        >>> controlmanager = ControlManager()
+        >>> controlmanager.projectdir = "projectname"
+        >>> TestIO.clear()
+        >>> with TestIO():
+        ...     os.makedirs("projectname/control/default")
+        ...     controlmanager.currentdir = "default"
+        ...     controlmanager.save_file("file", "k(1.0)\\n")
+        ...     path = os.path.join(controlmanager.currentpath, "file.py")
+        ...     os.utime(path, ns=(0, 0))
+        ...     controlmanager.save_file("file.py", "k(1.0)\\n")
+        ...     os.stat(path).st_mtime_ns
+        ...     controlmanager.save_file("file.py", "k(2.0)\\n")
+        ...     os.stat(path).st_mtime_ns > 0
+        ...     with open(path) as file_:
+        ...         print(file_.read())
+        0
+        True
+        k(2.0)
+        <BLANKLINE>
+        """
         if not filename.endswith(".py"):
             filename += ".py"
         path = os.path.join(self.currentpath, filename)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file_:
+                if file_.read() == text:
+                    return
         with open(path, "w", encoding="utf-8") as file_:
             file_.write(text)
 
@@ -1822,6 +1935,28 @@ not allowed to overwrite the existing file `...`.
         information.
         """,
     )
+    jitstepsize = optiontools.OptionPropertyPeriod(
+        timetools.Period(),
+        """Currently active step size for aggregating time series temporally when 
+        writing them to NetCDF files "just in time".
+
+        |SequenceManager.jitstepsize| is an option based on |OptionPropertyPeriod|.  
+        By default, it is empty, meaning that no temporal aggregation takes place.  See 
+        the documentation on method |NetCDFInterfaceJIT.provide_jitaccess| for further 
+        information.
+        """,
+    )
+    jitaggregator = optiontools.OptionPropertySeriesAggregator(
+        "mean",
+        """Currently active aggregator for aggregating time series temporally when 
+        writing them to NetCDF files "just in time".
+
+        |SequenceManager.jitaggregator| is an option based on 
+        |OptionPropertySeriesAggregator|.  See its documentation for further 
+        information.  |SequenceManager.jitaggregator| is only relevant if 
+        |SequenceManager.jitstepsize| is not empty.
+        """,
+    )
     convention = optiontools.OptionPropertySeriesConvention(
         "model-specific",
         """Currently selected naming convention for reading and writing input time 
@@ -1832,6 +1967,16 @@ not allowed to overwrite the existing file `...`.
         information.
         """,
     )
+    singleprecision = optiontools.OptionPropertyBool(
+        False,
+        """A flag that indicates whether model sequences should handle their time series 
+        data in RAM with single instead of double precision.
+
+        |SequenceManager.singleprecision| is an option based on |OptionPropertyBool|.  
+        See the documentation on property |ModelIOSequence.singleprecision| for further 
+        information.
+        """,
+    )
 
     _netcdfreader: netcdftools.NetCDFInterfaceReader | None = None
     _netcdfwriter: netcdftools.NetCDFInterfaceWriter | None = None
@@ -1886,7 +2031,7 @@ not allowed to overwrite the existing file `...`.
     def _load_npy(
         sequence: sequencetools.IOSequence,
     ) -> tuple[timetools.Timegrid, NDArrayFloat]:
-        data = numpy.load(sequence.filepath)
+        data = numpy.load(sequence.filepath, mmap_mode="r")
         timegrid_data = timetools.Timegrid.from_array(data)
         return timegrid_data, data[13:]
 
@@ -6,12 +6,14 @@
 from __future__ import annotations
 import collections
 import contextlib
+import hashlib
 import itertools
 import warnings
 
-import networkx
+import numpy
 
 import hydpy
+from hydpy import config
 from hydpy.core import devicetools
 from hydpy.core import exceptiontools
 from hydpy.core import filetools
@@ -27,6 +29,7 @@ from hydpy.core import timetools
 from hydpy.core.typingtools import *
 
 if TYPE_CHECKING:
+    import networkx
     from hydpy.core import auxfiletools
 
 
@@ -825,11 +828,13 @@ directory: '...land_dill_assl_hland_96p_input_p.asc'
     _nodes: devicetools.Nodes | None
     _elements: devicetools.Elements | None
     _collectives: devicetools.Elements | None
+    _conditionlayout: ConditionLayout | None
 
     def __init__(self, projectname: str | None = None) -> None:
         self._nodes = None
         self._elements = None
         self._collectives = None
+        self._conditionlayout = None
         self._deviceorder = None
         self._parallelisability = None
         self._queue = None
@@ -928,10 +933,12 @@ not handle any elements at the moment.
     @elements.setter
     def _set_elements(self, values: devicetools.ElementsConstrArg) -> None:
         self._elements = devicetools.Elements(values).copy()
+        self._conditionlayout = None
 
     @elements.deleter
     def _del_elements(self) -> None:
         self._elements = None
+        self._conditionlayout = None
 
     @property
     def collectives(self) -> devicetools.Elements:
@@ -1192,6 +1199,7 @@ deprecated.  Use method `prepare_models` instead.
         parameterstep: timetools.PeriodConstrArg | None = None,
         simulationstep: timetools.PeriodConstrArg | None = None,
         auxfiler: auxfiletools.Auxfiler | None = None,
+        processes: int = 1,
     ) -> None:
         """Write the control files of all current |Element| objects.
 
@@ -1445,6 +1453,36 @@ deprecated.  Use method `prepare_models` instead.
         >>> control.airtemperaturefactor
         airtemperaturefactor(field=0.2, forest=0.1)
 
+        Formatting the control files of large projects takes considerable time.  On
+        systems supporting the "fork" start method for new processes (e.g. Linux), you
+        can distribute this work to multiple processes.  Additionally, method
+        |HydPy.save_controls| writes only files with new contents (see method
+        |ControlManager.save_file|).  We show this by modifying parameter
+        |musk_control.NmbSegments| of element `stream_lahn_leun_lahn_kalk`, setting
+        all files' modification times to zero, and writing all control files with two
+        processes.  Only the control file of element `stream_lahn_leun_lahn_kalk`
+        changes:
+
+        >>> model = hp.elements.stream_lahn_leun_lahn_kalk.model
+        >>> model.parameters.control.nmbsegments(lag=0.0)
+        >>> with TestIO():
+        ...     for filename in os.listdir(dir_):
+        ...         os.utime(dir_ + filename, ns=(0, 0))
+        ...     hp.save_controls(
+        ...         auxfiler=auxfiler, parameterstep="2d", simulationstep="1h",
+        ...         processes=2)
+        ...     for filename in sorted(os.listdir(dir_)):
+        ...         if os.stat(dir_ + filename).st_mtime_ns:
+        ...             print(filename)
+        stream_lahn_leun_lahn_kalk.py
+        >>> with TestIO():
+        ...     with open(dir_ + "stream_lahn_leun_lahn_kalk.py") as controlfile:
+        ...         print(controlfile.read())  # doctest: +ELLIPSIS
+        from hydpy.models.musk_classic import *
+        ...
+        nmbsegments(lag=0.0)
+        ...
+
         The :ref:`HydPy-H-Lahn` example project relies only upon "scalar" submodels
         (handled by |SubmodelProperty| instances) and not on "vectorial" submodels
         (handled by |SubmodelsProperty| instances).  Therefore, we now prepare an
@@ -1576,6 +1614,7 @@ deprecated.  Use method `prepare_models` instead.
             parameterstep=parameterstep,
             simulationstep=simulationstep,
             auxfiler=auxfiler,
+            processes=processes,
         )
 
     def update_parameters(self) -> None:
@@ -2085,6 +2124,134 @@ needed to be trimmed.  The old and the new value(s) are `1.0, ..., 1.0` and `0.0
     def conditions(self, conditions: Conditions) -> None:
         self.elements.conditions = conditions
 
+    @property
+    def conditionlayout(self) -> ConditionLayout:
+        """The |ConditionLayout| object that maps the values of all condition
+        sequences of all currently handled models to a flat vector.
+
+        We demonstrate this functionality based on the :ref:`HydPy-H-Lahn` example
+        project:
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> hp, pub, TestIO = prepare_full_example_2()
+
+        |HydPy| prepares the layout on first access and reuses it afterwards.
+        Usually, one does not need to access it directly but calls the methods
+        |HydPy.get_condition_vector| and |HydPy.set_condition_vector|:
+
+        >>> layout = hp.conditionlayout
+        >>> layout.size
+        213
+        >>> vector = hp.get_condition_vector()
+        >>> vector.shape
+        (213,)
+
+        The |ConditionSlot| objects available via attribute |ConditionLayout.slots|
+        tell where to find the values of the individual sequences:
+
+        >>> layout.slots[1]
+        ConditionSlot(element='land_dill_assl', submodel='model', group='states', \
+sequence='sp', shape=(1, 12), start=12, stop=24)
+        >>> for slot in layout.slots[:5]:
+        ...     print(slot.element, slot.sequence, slot.shape, slot.start, slot.stop)
+        land_dill_assl ic (12,) 0 12
+        land_dill_assl sp (1, 12) 12 24
+        land_dill_assl wc (1, 12) 24 36
+        land_dill_assl sm (12,) 36 48
+        land_dill_assl uz () 48 49
+
+        Method |ConditionLayout.select| helps to build observation operators by
+        returning the vector indices of all values matching the given criteria:
+
+        >>> idxs = layout.select(element="land_lahn_marb", sequence="sm")
+        >>> from hydpy import print_vector
+        >>> print_vector(vector[idxs][:3])
+        99.27505, 96.17726, 109.16576
+        >>> sm = hp.elements.land_lahn_marb.model.sequences.states.sm
+        >>> print_vector(sm.values[:3])
+        99.27505, 96.17726, 109.16576
+
+        After performing a simulation run, we can restore the original conditions by
+        passing the memorised vector to |HydPy.set_condition_vector|:
+
+        >>> hp.simulate()
+        >>> print_vector(sm.values[:3])
+        98.919128, 95.832445, 108.774418
+        >>> hp.set_condition_vector(vector)
+        >>> print_vector(sm.values[:3])
+        99.27505, 96.17726, 109.16576
+
+        To modify the conditions of individual sequences, manipulate the relevant
+        vector entries before passing the vector back.  |ConditionLayout.set_vector|
+        trims all new values (if necessary), like the setter of property
+        |HydPy.conditions|:
+
+        >>> vector[idxs] = 1000.0
+        >>> with pub.options.warntrim(False):
+        ...     hp.set_condition_vector(vector)
+        >>> print_vector(sm.values[:3])
+        206.0, 206.0, 206.0
+
+        Pass a vector of the required length to avoid allocating a new vector for
+        each call to |HydPy.get_condition_vector|:
+
+        >>> from numpy import zeros
+        >>> ensemble = zeros((3, layout.size))
+        >>> _ = hp.get_condition_vector(out=ensemble[1])
+        >>> print_vector(ensemble[:, idxs[0]])
+        0.0, 206.0, 0.0
+
+        Wrong vector lengths result in the following errors:
+
+        >>> hp.set_condition_vector(vector[:-1])
+        Traceback (most recent call last):
+        ...
+        ValueError: The given condition vector has 212 entries, but the condition \
+layout requires 213 entries.
+        >>> hp.get_condition_vector(out=vector[:-1])
+        Traceback (most recent call last):
+        ...
+        ValueError: The given condition vector has 212 entries, but the condition \
+layout requires 213 entries.
+
+        |HydPy| creates a new |ConditionLayout| object after changing the handled
+        elements.  Call method |HydPy.prepare_conditionlayout| after other relevant
+        modifications, for example, after changing the shapes of condition
+        sequences:
+
+        >>> hp.elements = hp.elements.land_lahn_marb
+        >>> hp.conditionlayout.size
+        55
+        """
+        if self._conditionlayout is None:
+            self.prepare_conditionlayout()
+            assert self._conditionlayout is not None
+        return self._conditionlayout
+
+    def prepare_conditionlayout(self) -> None:
+        """Prepare a new |ConditionLayout| object for the currently handled
+        elements.
+
+        See the documentation on class |ConditionLayout| for further information.
+        """
+        self._conditionlayout = ConditionLayout(self.elements)
+
+    def get_condition_vector(self, out: VectorFloat | None = None) -> VectorFloat:
+        """Return the values of all condition sequences of all currently handled
+        models as a flat vector.
+
+        See the documentation on class |ConditionLayout| for further information.
+        """
+        return self.conditionlayout.get_vector(out=out)
+
+    def set_condition_vector(self, vector: VectorInputFloat) -> None:
+        """Set the values of all condition sequences of all currently handled models
+        based on the given flat vector.
+
+        See the documentation on class |ConditionLayout| for further information.
+        """
+        self.conditionlayout.set_vector(vector)
+
     @property
     def networkproperties(
         self,
@@ -2620,8 +2787,8 @@ prepared so far.
             if not silent:
                 raise exc
         else:
-            graph = create_directedgraph(self.nodes, self._collectives)
-            devices = tuple(networkx.topological_sort(graph))
+            graph = get_devicegraph(self.nodes, self._collectives)
+            devices = graph.get_topologicalorder()
             names = set(self.nodes.names)
             names.update(self._collectives.names)
             self._deviceorder = tuple(d for d in devices if d.name in names)
@@ -3338,10 +3505,422 @@ method `simulate` instead.
         self.nodes.load_obsseries()
 
 
+class SpinupCache:
+    """Cache for the conditions at the end of the warm-up period.
+
+    Many workflows, like parameter calibration, repeatedly simulate the same period,
+    of which only the evaluation period (|Timegrids.eval_|) is of interest.  The
+    preceding part of the simulation period serves as a warm-up period.  Whenever the
+    relevant parameter values and initial conditions do not differ from a previous
+    run, |SpinupCache| restores the conditions at the end of the warm-up period
+    available from this run and simulates the evaluation period only.
+
+    We prepare the :ref:`HydPy-H-Lahn` example project for the first three months of
+    1996 and select March as the evaluation period:
+
+    >>> from hydpy.core.testtools import prepare_full_example_1
+    >>> prepare_full_example_1()
+    >>> from hydpy import HydPy, pub, TestIO, print_vector
+    >>> with TestIO():
+    ...     hp = HydPy("HydPy-H-Lahn")
+    ...     pub.timegrids = "1996-01-01", "1996-04-01", "1d"
+    ...     hp.prepare_everything()
+    >>> pub.timegrids.eval_.firstdate = "1996-03-01"
+
+    First, we perform an ordinary simulation run for reference purposes:
+
+    >>> conditions = hp.conditions
+    >>> hp.simulate()
+    >>> series = hp.nodes.lahn_kalk.sequences.sim.series
+    >>> reference = series.copy()
+    >>> print_vector(reference[58:62])
+    32.998051, 33.335612, 32.112347, 29.720608
+
+    The first call to method |SpinupCache.simulate| performs a complete simulation
+    run but memorises the conditions at the end of February:
+
+    >>> from hydpy.core.hydpytools import SpinupCache
+    >>> cache = SpinupCache(hp)
+    >>> hp.conditions = conditions
+    >>> series[:] = 0.0
+    >>> cache.simulate()
+    >>> print_vector(series[58:62])
+    32.998051, 33.335612, 32.112347, 29.720608
+    >>> len(cache), cache.nmbhits
+    (1, 0)
+
+    The second call restores these conditions and only simulates March:
+
+    >>> hp.conditions = conditions
+    >>> series[:] = 0.0
+    >>> cache.simulate()
+    >>> print_vector(series[58:62])
+    0.0, 0.0, 32.112347, 29.720608
+    >>> len(cache), cache.nmbhits
+    (1, 1)
+
+    Afterwards, the simulation period is the same as before:
+
+    >>> pub.timegrids.sim
+    Timegrid("1996-01-01 00:00:00",
+             "1996-04-01 00:00:00",
+             "1d")
+
+    By default, |SpinupCache| identifies identical warm-up periods by calculating
+    a hash value of the values of all control parameters and all condition sequences
+    (see method |SpinupCache.calc_key|).  Hence, changing a parameter value results
+    in an additional complete simulation run:
+
+    >>> fc = hp.elements.land_lahn_marb.model.parameters.control.fc
+    >>> fc *= 0.5
+    >>> hp.conditions = conditions
+    >>> cache.simulate()
+    >>> len(cache), cache.nmbhits
+    (2, 1)
+
+    Calculating hash values requires some effort.  If you know the relevant
+    parameters, you can pass an alternative key.  |SpinupCache| combines it with the
+    hash value of the warm-up period and its input data (see method
+    |SpinupCache.calc_inputkey|), so it never reuses conditions of a different
+    warm-up period or different forcing.  If, for example, you want to fix the
+    warm-up period for the current input data, you can pass a constant key:
+
+    >>> hp.conditions = conditions
+    >>> cache.simulate(key="fixed")
+    >>> hp.conditions = conditions
+    >>> cache.simulate(key="fixed")
+    >>> len(cache), cache.nmbhits
+    (3, 2)
+
+    |SpinupCache| discards the least recently used conditions if the number of
+    cached conditions exceeds the given maximum size:
+
+    >>> cache.maxsize = 2
+    >>> hp.conditions = conditions
+    >>> cache.simulate(key="other")
+    >>> len(cache)
+    2
+
+    Modifying the input data of the warm-up period invalidates constant keys, too:
+
+    >>> p = hp.elements.land_lahn_marb.model.sequences.inputs.p
+    >>> p.series[:59] *= 1.1
+    >>> hp.conditions = conditions
+    >>> cache.simulate(key="other")
+    >>> len(cache), cache.nmbhits
+    (2, 2)
+    >>> p.series[:59] /= 1.1
+
+    Use method |SpinupCache.clear| to remove all cached conditions:
+
+    >>> cache.clear()
+    >>> len(cache), cache.nmbhits
+    (0, 0)
+
+    If the evaluation period starts with the simulation period, there is nothing to
+    cache:
+
+    >>> pub.timegrids.eval_.firstdate = "1996-01-01"
+    >>> hp.conditions = conditions
+    >>> cache.simulate()
+    >>> len(cache)
+    0
+    """
+
+    maxsize: int
+    """The maximum number of cached conditions."""
+    nmbhits: int
+    """The number of simulation runs that restored cached conditions."""
+    _hp: HydPy
+    _key2conditions: collections.OrderedDict[Hashable, Conditions]
+
+    def __init__(self, hp: HydPy, maxsize: int = 100) -> None:
+        self._hp = hp
+        self.maxsize = maxsize
+        self.nmbhits = 0
+        self._key2conditions = collections.OrderedDict()
+
+    def calc_key(self) -> str:
+        """Calculate a hash value of the values of all control parameters and
+        condition sequences of all handled models, combined with the hash value of
+        method |SpinupCache.calc_inputkey|.
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> hp, pub, TestIO = prepare_full_example_2()
+        >>> from hydpy.core.hydpytools import SpinupCache
+        >>> cache = SpinupCache(hp)
+        >>> key = cache.calc_key()
+        >>> key == cache.calc_key()
+        True
+        >>> hp.elements.land_dill_assl.model.parameters.control.beta *= 2.0
+        >>> key == cache.calc_key()
+        False
+        """
+        hasher = hashlib.sha256()
+        hasher.update(self.calc_inputkey().encode())
+        for element in self._hp.elements:
+            hasher.update(element.name.encode())
+            model = element.model
+            for submodel in model.find_submodels(include_mainmodel=True).values():
+                for parameter in submodel.parameters.control:
+                    values = getattr(parameter, "values", None)
+                    if values is None:
+                        hasher.update(repr(parameter).encode())
+                    else:
+                        hasher.update(numpy.asarray(values).tobytes())
+            for name2seqs in model.conditions.values():
+                for name2values in name2seqs.values():
+                    for values in name2values.values():
+                        hasher.update(numpy.asarray(values).tobytes())
+        return hasher.hexdigest()
+
+    def calc_inputkey(self) -> str:
+        """Calculate a hash value of the relevant warm-up period and the input time
+        series data of the warm-up period.
+
+        The considered input data are the series of all input sequences of all
+        handled models and the observed or previously simulated series of all nodes
+        that pass these series to the models, according to their
+        |Node.deploymode|.  |SpinupCache| cannot check sequences that do not handle
+        their time series in RAM but read them from disk "just in time".
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> hp, pub, TestIO = prepare_full_example_2()
+        >>> from hydpy.core.hydpytools import SpinupCache
+        >>> cache = SpinupCache(hp)
+        >>> pub.timegrids.eval_.firstdate = "1996-01-03"
+        >>> key = cache.calc_inputkey()
+        >>> key == cache.calc_inputkey()
+        True
+
+        Changing the input data of the warm-up period changes the key:
+
+        >>> t = hp.elements.land_dill_assl.model.sequences.inputs.t
+        >>> t.series[1] += 1.0
+        >>> key == cache.calc_inputkey()
+        False
+        >>> t.series[1] -= 1.0
+        >>> key == cache.calc_inputkey()
+        True
+
+        Changing the input data of the evaluation period does not:
+
+        >>> t.series[2] += 1.0
+        >>> key == cache.calc_inputkey()
+        True
+
+        Shifting the evaluation period changes the key:
+
+        >>> pub.timegrids.eval_.firstdate = "1996-01-02"
+        >>> key == cache.calc_inputkey()
+        False
+        """
+        hasher = hashlib.sha256()
+        timegrids = hydpy.pub.timegrids
+        firstdate, evaldate = timegrids.sim.firstdate, timegrids.eval_.firstdate
+        hasher.update(f"{firstdate}{evaldate}{timegrids.stepsize}".encode())
+        idx0, idx1 = timegrids.init[firstdate], timegrids.init[evaldate]
+
+        def _update(sequence: sequencetools.IOSequence) -> None:
+            if sequence.ramflag:
+                hasher.update(sequence.series[idx0:idx1].tobytes())
+
+        for node in self._hp.nodes:
+            if "obs" in node.deploymode:
+                _update(node.sequences.obs)
+            if "oldsim" in node.deploymode:
+                _update(node.sequences.sim)
+        for element in self._hp.elements:
+            model = element.model
+            for submodel in model.find_submodels(include_mainmodel=True).values():
+                for sequence in submodel.sequences.inputs:
+                    _update(sequence)
+        return hasher.hexdigest()
+
+    def simulate(self, key: Hashable | None = None) -> None:
+        """Perform a simulation run over the actual simulation period, eventually
+        based on the cached conditions at the start of the evaluation period.
+
+        See the main documentation on class |SpinupCache| for further information.
+        """
+        sim = hydpy.pub.timegrids.sim
+        firstdate, lastdate = sim.dates
+        evaldate = hydpy.pub.timegrids.eval_.firstdate
+        if not firstdate < evaldate < lastdate:
+            self._hp.simulate()
+            return
+        if key is None:
+            key = self.calc_key()
+        else:
+            key = key, self.calc_inputkey()
+        try:
+            if (conditions := self._key2conditions.get(key)) is None:
+                sim.dates = firstdate, evaldate
+                self._hp.simulate()
+                self._key2conditions[key] = self._hp.conditions
+                while len(self._key2conditions) > self.maxsize:
+                    self._key2conditions.popitem(last=False)
+            else:
+                self._hp.conditions = conditions
+                self._key2conditions.move_to_end(key)
+                self.nmbhits += 1
+            sim.dates = evaldate, lastdate
+            self._hp.simulate()
+        finally:
+            sim.dates = firstdate, lastdate
+
+    def clear(self) -> None:
+        """Remove all cached conditions and reset the number of hits.
+
+        See the main documentation on class |SpinupCache| for further information.
+        """
+        self._key2conditions.clear()
+        self.nmbhits = 0
+
+    def __len__(self) -> int:
+        return len(self._key2conditions)
+
+
+class ConditionSlot(NamedTuple):
+    """Metadata on the position of the values of a single condition sequence within
+    the vector defined by a |ConditionLayout| object."""
+
+    element: str
+    """The name of the sequence's |Element| object."""
+    submodel: str
+    """The position of the sequence's (sub)model within the element's model."""
+    group: str
+    """The name of the sequence's subgroup (`states` or `logs`)."""
+    sequence: str
+    """The name of the sequence."""
+    shape: tuple[int, ...]
+    """The shape of the sequence's values."""
+    start: int
+    """The index of the sequence's first value within the condition vector."""
+    stop: int
+    """The index following the sequence's last value within the condition vector."""
+
+
+class ConditionLayout:
+    """Mapping of the values of all condition sequences of the given elements to a
+    single flat vector.
+
+    Property |HydPy.conditions| returns a nested dictionary, which is convenient but
+    expensive to create and to apply.  Ensemble-based data assimilation methods
+    require to get and set the conditions of all ensemble members at each
+    assimilation step.  For such purposes, |ConditionLayout| determines the positions
+    of all |StateSequence| and |LogSequence| values within a contiguous |numpy| vector
+    once and then copies the values from and to this vector without creating any
+    intermediate data structures.
+
+    See the documentation on property |HydPy.conditionlayout| for further
+    information.
+    """
+
+    slots: tuple[ConditionSlot, ...]
+    """The metadata on the positions of all condition sequences' values."""
+    size: int
+    """The total number of condition values."""
+    _entries: tuple[tuple[sequencetools.ConditionSequence, int, int], ...]
+
+    def __init__(self, elements: devicetools.Elements) -> None:
+        slots, entries = [], []
+        start = 0
+        for element in elements:
+            model = element.model
+            for name, submodel in model.find_submodels(include_mainmodel=True).items():
+                for seq in submodel.sequences.conditionsequences:
+                    shape = tuple(seq.shape) if seq.NDIM else ()
+                    stop = start + int(numpy.prod(shape))
+                    slots.append(
+                        ConditionSlot(
+                            element=element.name,
+                            submodel=name,
+                            group=seq.subseqs.name,
+                            sequence=seq.name,
+                            shape=shape,
+                            start=start,
+                            stop=stop,
+                        )
+                    )
+                    entries.append((seq, start, stop))
+                    start = stop
+        self.slots = tuple(slots)
+        self.size = start
+        self._entries = tuple(entries)
+
+    def select(
+        self,
+        *,
+        element: str | None = None,
+        submodel: str | None = None,
+        group: str | None = None,
+        sequence: str | None = None,
+    ) -> VectorInt:
+        """Return the vector indices of all values of the condition sequences that
+        match all the given criteria.
+
+        See the main documentation on class |ConditionLayout| for further information.
+        """
+        ranges = [
+            numpy.arange(slot.start, slot.stop)
+            for slot in self.slots
+            if ((element is None) or (slot.element == element))
+            and ((submodel is None) or (slot.submodel == submodel))
+            and ((group is None) or (slot.group == group))
+            and ((sequence is None) or (slot.sequence == sequence))
+        ]
+        if ranges:
+            return numpy.concatenate(ranges)
+        return numpy.empty(0, dtype=config.NP_INT)
+
+    def _check_size(self, vector: VectorFloat) -> None:
+        if len(vector) != self.size:
+            raise ValueError(
+                f"The given condition vector has {len(vector)} entries, but the "
+                f"condition layout requires {self.size} entries."
+            )
+
+    def get_vector(self, out: VectorFloat | None = None) -> VectorFloat:
+        """Copy the values of all condition sequences into a new or the given vector
+        and return it.
+
+        See the main documentation on class |ConditionLayout| for further information.
+        """
+        if out is None:
+            out = numpy.empty(self.size, dtype=config.NP_FLOAT)
+        else:
+            self._check_size(out)
+        for seq, start, stop in self._entries:
+            out[start:stop] = numpy.ravel(seq.value)
+        return out
+
+    def set_vector(self, vector: VectorInputFloat) -> None:
+        """Copy the values of the given vector into all condition sequences and trim
+        them afterwards.
+
+        See the main documentation on class |ConditionLayout| for further information.
+        """
+        vector = numpy.asarray(vector, dtype=config.NP_FLOAT)
+        self._check_size(vector)
+        with hydpy.pub.options.trimvariables(False):
+            for seq, start, stop in self._entries:
+                if seq.NDIM:
+                    seq.value = vector[start:stop].reshape(seq.shape)
+                else:
+                    seq.value = vector[start]
+        for seq, _, _ in reversed(self._entries):
+            seq.trim()
+
+
 def create_directedgraph(
     nodes: devicetools.Nodes, elements: devicetools.Elements
 ) -> networkx.DiGraph:
     """Create a directed graph based on the given devices."""
+    # pylint: disable=import-outside-toplevel
+    # networkx takes a noticeable amount of time to import:
+    import networkx
+
     digraph = networkx.DiGraph()
     digraph.add_nodes_from(elements)
     digraph.add_nodes_from(nodes)
@@ -3351,3 +3930,315 @@ def create_directedgraph(
         for node in itertools.chain(element.outlets, element.senders, element.outputs):
             digraph.add_edge(element, node)
     return digraph
+
+
+class DeviceGraph:
+    """A compact, integer-indexed representation of the directed graph defined by the
+    given nodes and elements.
+
+    |DeviceGraph| assigns an index to each device (first to all elements, then to all
+    nodes, and finally to all other nodes connected to one of the elements) and
+    stores the edges as compressed sparse row (CSR) adjacency arrays.  Hence, all
+    queries of topological order, ancestors, and descendants work on |numpy| arrays
+    instead of graphs of Python objects.  We demonstrate this based on the
+    :ref:`HydPy-H-Lahn` example project:
+
+    >>> from hydpy.core.testtools import prepare_full_example_1
+    >>> prepare_full_example_1()
+    >>> from hydpy import HydPy, TestIO
+    >>> with TestIO():
+    ...     hp = HydPy("HydPy-H-Lahn")
+    ...     hp.prepare_network()
+    >>> from hydpy.core.hydpytools import DeviceGraph
+    >>> graph = DeviceGraph(hp.nodes, hp.elements)
+    >>> len(graph.devices)
+    11
+    >>> graph.successors_indptr
+    array([ 0,  1,  2,  3,  4,  5,  6,  7,  8,  8,  9, 10])
+    >>> graph.successors_indices
+    array([ 7,  8,  9, 10,  9,  8,  9,  4,  5,  6])
+
+    Method |DeviceGraph.get_topologicalorder| returns all devices in the same order
+    as function `topological_sort` of |networkx| applied to the graph created by
+    function |create_directedgraph|:
+
+    >>> for device in graph.get_topologicalorder():
+    ...     print(device)
+    land_dill_assl
+    land_lahn_kalk
+    land_lahn_leun
+    land_lahn_marb
+    dill_assl
+    lahn_marb
+    stream_dill_assl_lahn_leun
+    stream_lahn_marb_lahn_leun
+    lahn_leun
+    stream_lahn_leun_lahn_kalk
+    lahn_kalk
+
+    Methods |DeviceGraph.get_ancestors| and |DeviceGraph.get_descendants| return all
+    upstream and downstream devices of the given device:
+
+    >>> from hydpy import Elements, Nodes
+    >>> upstream = graph.get_ancestors(hp.nodes.lahn_leun)
+    >>> Nodes(d for d in upstream if d in hp.nodes)
+    Nodes("dill_assl", "lahn_marb")
+    >>> Elements(d for d in upstream if d in hp.elements)
+    Elements("land_dill_assl", "land_lahn_leun", "land_lahn_marb",
+             "stream_dill_assl_lahn_leun", "stream_lahn_marb_lahn_leun")
+    >>> downstream = graph.get_descendants(hp.nodes.lahn_leun)
+    >>> Nodes(d for d in downstream if d in hp.nodes)
+    Nodes("lahn_kalk")
+    >>> Elements(d for d in downstream if d in hp.elements)
+    Elements("stream_lahn_leun_lahn_kalk")
+
+    Method |DeviceGraph.get_downstreamdepths| returns the lengths of the longest
+    downstream paths of all devices:
+
+    >>> from hydpy import print_vector
+    >>> depths = graph.get_downstreamdepths()
+    >>> print_vector(depths)
+    5, 1, 3, 5, 3, 1, 3, 4, 0, 2, 4
+    >>> for device in (hp.elements.land_dill_assl, hp.nodes.lahn_kalk):
+    ...     print(device, depths[graph.device2index[device]])
+    land_dill_assl 5
+    lahn_kalk 0
+
+    Usually, one should not create |DeviceGraph| instances directly but call function
+    |get_devicegraph|, which reuses them as long as the network does not change.
+
+    |DeviceGraph| raises the following error for cyclic networks:
+
+    >>> from hydpy import Element, Node
+    >>> a, b = Node("a"), Node("b")
+    >>> e1 = Element("e1", inlets=a, outlets=b)
+    >>> e2 = Element("e2", inlets=b, outlets=a)
+    >>> DeviceGraph(Nodes(a, b), Elements(e1, e2)).get_topologicalorder()
+    Traceback (most recent call last):
+    ...
+    RuntimeError: The network defined by the given nodes and elements contains at \
+least one cycle.
+    """
+
+    devices: tuple[devicetools.NodeOrElement, ...]
+    """All devices in the order of their indices."""
+    device2index: dict[devicetools.NodeOrElement, int]
+    """A mapping from the devices to their indices."""
+    successors_indptr: VectorInt
+    """The CSR index pointers of the successor adjacency."""
+    successors_indices: VectorInt
+    """The CSR column indices of the successor adjacency."""
+    predecessors_indptr: VectorInt
+    """The CSR index pointers of the predecessor adjacency."""
+    predecessors_indices: VectorInt
+    """The CSR column indices of the predecessor adjacency."""
+
+    _generations: list[VectorInt] | None
+
+    def __init__(
+        self, nodes: devicetools.Nodes, elements: devicetools.Elements
+    ) -> None:
+        devices: list[devicetools.NodeOrElement] = list(elements)
+        devices.extend(nodes)
+        device2index = {device: idx for idx, device in enumerate(devices)}
+
+        def _get_index(node: devicetools.Node) -> int:
+            if (idx := device2index.get(node)) is None:
+                idx = len(devices)
+                devices.append(node)
+                device2index[node] = idx
+            return idx
+
+        sources: list[int] = []
+        targets: list[int] = []
+        for element in elements:
+            idx = device2index[element]
+            for node in itertools.chain(
+                element.inlets, element.observers, element.inputs
+            ):
+                sources.append(_get_index(node))
+                targets.append(idx)
+            for node in itertools.chain(
+                element.outlets, element.senders, element.outputs
+            ):
+                sources.append(idx)
+                targets.append(_get_index(node))
+
+        self.devices = tuple(devices)
+        self.device2index = device2index
+        nmb = len(devices)
+        source = numpy.array(sources, dtype=config.NP_INT)
+        target = numpy.array(targets, dtype=config.NP_INT)
+        _, first = numpy.unique(source * nmb + target, return_index=True)
+        first.sort()
+        source, target = source[first], target[first]
+        self.successors_indptr, self.successors_indices = self._make_csr(
+            source, target, nmb
+        )
+        self.predecessors_indptr, self.predecessors_indices = self._make_csr(
+            target, source, nmb
+        )
+        self._generations = None
+
+    @staticmethod
+    def _make_csr(
+        rows: VectorInt, columns: VectorInt, nmb: int
+    ) -> tuple[VectorInt, VectorInt]:
+        indptr = numpy.zeros(nmb + 1, dtype=config.NP_INT)
+        numpy.cumsum(numpy.bincount(rows, minlength=nmb), out=indptr[1:])
+        return indptr, columns[numpy.argsort(rows, kind="stable")]
+
+    @staticmethod
+    def _gather(indptr: VectorInt, indices: VectorInt, idxs: VectorInt) -> VectorInt:
+        starts = indptr[idxs]
+        counts = indptr[idxs + 1] - starts
+        offsets = numpy.repeat(starts - numpy.cumsum(counts) + counts, counts)
+        return indices[offsets + numpy.arange(len(offsets))]
+
+    def _get_reachable(
+        self, device: devicetools.NodeOrElement, indptr: VectorInt, indices: VectorInt
+    ) -> VectorInt:
+        idx = self.device2index[device]
+        visited = numpy.zeros(len(self.devices), dtype=config.NP_BOOL)
+        visited[idx] = True
+        frontier = numpy.array([idx], dtype=config.NP_INT)
+        while len(frontier):
+            neighbours = self._gather(indptr, indices, frontier)
+            frontier = numpy.unique(neighbours[~visited[neighbours]])
+            visited[frontier] = True
+        visited[idx] = False
+        return numpy.flatnonzero(visited)
+
+    def _get_generations(self) -> list[VectorInt]:
+        if self._generations is None:
+            indptr, indices = self.successors_indptr, self.successors_indices
+            indegrees = numpy.bincount(indices, minlength=len(self.devices))
+            frontier = numpy.flatnonzero(indegrees == 0)
+            generations: list[VectorInt] = []
+            while len(frontier):
+                generations.append(frontier)
+                successors = self._gather(indptr, indices, frontier)
+                numpy.subtract.at(indegrees, successors, 1)
+                released = successors[indegrees[successors] == 0][::-1]
+                frontier, idxs = numpy.unique(released, return_index=True)
+                frontier = frontier[numpy.argsort(-idxs)]
+            if sum(len(g) for g in generations) < len(self.devices):
+                raise RuntimeError(
+                    "The network defined by the given nodes and elements contains at "
+                    "least one cycle."
+                )
+            self._generations = generations
+        return self._generations
+
+    def get_topologicalorder(self) -> tuple[devicetools.NodeOrElement, ...]:
+        """Return all devices in topological order.
+
+        The devices of each "generation" follow in the order in which their last
+        dependency is resolved, as in function `topological_sort` of |networkx|.
+        """
+        devices = self.devices
+        return tuple(devices[idx] for g in self._get_generations() for idx in g)
+
+    def get_downstreamdepths(self) -> VectorInt:
+        """Return the number of devices along the longest downstream path of each
+        device.
+
+        The depth of a device agrees with the number of its descendants only if all
+        of them lie on a single path, as in a plain chain of nodes and elements.  As
+        soon as a device's descendants branch, the depth becomes smaller.
+        |DeviceGraph| calculates the depths of all devices at once by traversing the
+        topological generations in reverse order.
+        """
+        indptr, indices = self.successors_indptr, self.successors_indices
+        depths = numpy.zeros(len(self.devices), dtype=config.NP_INT)
+        for generation in reversed(self._get_generations()):
+            counts = indptr[generation + 1] - indptr[generation]
+            successors = self._gather(indptr, indices, generation)
+            owners = numpy.repeat(generation, counts)
+            numpy.maximum.at(depths, owners, depths[successors] + 1)
+        return depths
+
+    def get_ancestors(
+        self, device: devicetools.NodeOrElement
+    ) -> set[devicetools.NodeOrElement]:
+        """Return all devices upstream of the given device."""
+        idxs = self._get_reachable(
+            device, self.predecessors_indptr, self.predecessors_indices
+        )
+        devices = self.devices
+        return set(devices[idx] for idx in idxs)
+
+    def get_descendants(
+        self, device: devicetools.NodeOrElement
+    ) -> set[devicetools.NodeOrElement]:
+        """Return all devices downstream of the given device."""
+        idxs = self._get_reachable(
+            device, self.successors_indptr, self.successors_indices
+        )
+        devices = self.devices
+        return set(devices[idx] for idx in idxs)
+
+
+_devicegraphs: dict[
+    tuple[int, tuple[devicetools.Node, ...], tuple[devicetools.Element, ...]],
+    DeviceGraph,
+] = {}
+
+
+def clear_devicegraphs() -> None:
+    """Remove all graphs cached by function |get_devicegraph|.
+
+    Methods like |Device.clear_all| call |clear_devicegraphs| automatically.
+    """
+    _devicegraphs.clear()
+
+
+def get_devicegraph(
+    nodes: devicetools.Nodes, elements: devicetools.Elements
+) -> DeviceGraph:
+    """Return a |DeviceGraph| instance for the given devices.
+
+    |get_devicegraph| keeps the graphs of the last few device combinations and reuses
+    them as long as no connection between any nodes and elements changes:
+
+    >>> from hydpy.core.testtools import prepare_full_example_1
+    >>> prepare_full_example_1()
+    >>> from hydpy import HydPy, TestIO
+    >>> with TestIO():
+    ...     hp = HydPy("HydPy-H-Lahn")
+    ...     hp.prepare_network()
+    >>> from hydpy.core.hydpytools import get_devicegraph
+    >>> graph = get_devicegraph(hp.nodes, hp.elements)
+    >>> get_devicegraph(hp.nodes, hp.elements) is graph
+    True
+    >>> get_devicegraph(hp.nodes, hp.elements - "land_dill_assl") is graph
+    False
+
+    >>> stream = hp.elements.stream_lahn_leun_lahn_kalk
+    >>> stream.receivers.add_device(stream.inlets.lahn_leun, force=True)
+    >>> get_devicegraph(hp.nodes, hp.elements) is graph
+    False
+
+    Graphs that became outdated due to a connection change are removed at the next
+    call, and clearing the device registries (for example, via |Device.clear_all|)
+    calls function |clear_devicegraphs|, so the cache never keeps otherwise unused
+    devices alive:
+
+    >>> from hydpy.core import hydpytools
+    >>> len(hydpytools._devicegraphs)
+    1
+    >>> from hydpy import Node
+    >>> Node.clear_all()
+    >>> len(hydpytools._devicegraphs)
+    0
+    """
+    version = devicetools.Devices.__hydpy__connectionversion__
+    key = (version, tuple(nodes), tuple(elements))
+    if (graph := _devicegraphs.get(key)) is None:
+        for outdated in [k for k in _devicegraphs if k[0] != version]:
+            del _devicegraphs[outdated]
+        graph = DeviceGraph(nodes, elements)
+        if len(_devicegraphs) >= 4:
+            del _devicegraphs[next(iter(_devicegraphs))]
+        _devicegraphs[key] = graph
+    return graph
@@ -1,7 +1,6 @@
 """This module implements tools to determine time-related indices."""
 
 from __future__ import annotations
-import copy
 
 import numpy
 
@@ -13,13 +12,13 @@ from hydpy.core import propertytools
 from hydpy.core import timetools
 from hydpy.core.typingtools import *
 
-Date2Float: TypeAlias = Callable[[timetools.Date], float]
+IndexArray: TypeAlias = VectorFloat | VectorInt
+"""The type of the (integer or float) arrays handled by |IndexerProperty|."""
 
 
-def _get_timegrids(func: Date2Float) -> timetools.Timegrids:
+def _get_timegrid(name: str) -> timetools.Timegrid:
     timegrids = exceptiontools.getattr_(hydpy.pub, "timegrids", None)
     if timegrids is None:
-        name = func.__name__[1:]
         raise exceptiontools.AttributeNotReady(
             f"An Indexer object has been asked for an `{name}` array.  Such an array "
             f"has neither been determined yet nor can it be determined automatically "
@@ -27,7 +26,37 @@ def _get_timegrids(func: Date2Float) -> timetools.Timegrids:
             f"the Indexer object, or make a proper Timegrids object available within "
             f"the pub module."
         )
-    return timegrids
+    return timegrids.init
+
+
+def _get_key() -> Hashable:
+    timegrids = exceptiontools.getattr_(hydpy.pub, "timegrids", None)
+    if timegrids is None:
+        return None
+    init = timegrids.init
+    return init.firstdate.datetime, init.lastdate.datetime, init.stepsize.timedelta
+
+
+def _get_datetimes(name: str) -> NDArray[numpy.datetime64]:
+    """Return the left-stamped dates of the initialisation period as a
+    |numpy.datetime64| array."""
+    timegrid = _get_timegrid(name)
+    firstdate = numpy.datetime64(timegrid.firstdate.datetime, "s")
+    stepsize = numpy.timedelta64(int(timegrid.stepsize.seconds), "s")
+    return firstdate + stepsize * numpy.arange(len(timegrid))
+
+
+def _get_monthindices(datetimes: NDArray[numpy.datetime64]) -> VectorInt:
+    return datetimes.astype("datetime64[M]").astype(config.NP_INT) % 12
+
+
+def _get_leapdayshifts(datetimes: NDArray[numpy.datetime64]) -> VectorInt:
+    """Return one for all dates after February of non-leap years and zero for all
+    other dates."""
+    years = datetimes.astype("datetime64[Y]").astype(config.NP_INT) + 1970
+    leapyears = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    afterfebruary = _get_monthindices(datetimes) > 1
+    return (afterfebruary & ~leapyears).astype(config.NP_INT)
 
 
 class IndexerProperty(propertytools.BaseProperty[Any, Any]):
@@ -73,6 +102,23 @@ available within the pub module.
     >>> pub.indexer.monthofyear is monthofyear
     False
 
+    |IndexerProperty| keeps the index arrays of the last few initialisation periods
+    (see attribute `maxcachesize`).  Hence, returning to the original period
+    does not require any recalculations:
+
+    >>> pub.timegrids.init.firstdate -= "1d"
+    >>> pub.indexer.monthofyear is monthofyear
+    True
+
+    The same holds for modifications of the simulation or evaluation period, which do
+    not affect any index values:
+
+    >>> pub.timegrids.sim.lastdate -= "1d"
+    >>> pub.indexer.monthofyear is monthofyear
+    True
+    >>> pub.timegrids.sim.lastdate += "1d"
+    >>> pub.timegrids.init.firstdate += "1d"
+
     When in doubt, you can manually delete the cached |numpy| |numpy.ndarray| and
     receive a freshly calculated index array afterwards:
 
@@ -118,23 +164,36 @@ value has been interpreted to be of length `4` and the length of the Timegrid ob
 representing the actual initialisation period is `5`.
     """
 
-    timegrids: timetools.Timegrids | None
-    values: VectorFloat | None
+    maxcachesize: int = 4
+    """The maximum number of index arrays cached for different initialisation
+    periods."""
+
+    key: Hashable
+    values: IndexArray | None
+    _cache: dict[Hashable, IndexArray]
 
-    def __init__(self, fget: Callable[[Indexer], Date2Float]) -> None:
+    def __init__(self, fget: Callable[[Indexer], IndexArray]) -> None:
         super().__init__()
         self.fget = fget
         self.fset = self._fset
         self.fdel = self._fdel
         self.__doc__ = fget.__doc__
         self.values = None
-        self.timegrids = None
-
-    def call_fget(self, obj: Indexer) -> NDArrayFloat:
-        timegrids = exceptiontools.getattr_(hydpy.pub, "timegrids", None)
-        if (self.values is None) or (self.timegrids != timegrids):
-            self.values = self._calcidxs(self.fget(obj))
-            self.timegrids = copy.deepcopy(timegrids)
+        self.key = None
+        self._cache = {}
+
+    def call_fget(self, obj: Indexer) -> IndexArray:
+        key = _get_key()
+        if (self.values is None) or (self.key != key):
+            values = self._cache.get(key)
+            if values is None:
+                values = self.fget(obj)
+                if key is not None:
+                    if len(self._cache) >= self.maxcachesize:
+                        del self._cache[next(iter(self._cache))]
+                    self._cache[key] = values
+            self.values = values
+            self.key = key
         return self.values
 
     def call_fset(self, obj: Indexer, value: VectorInputFloat) -> None:
@@ -144,20 +203,21 @@ representing the actual initialisation period is `5`.
         self, obj: Indexer, values: VectorInputFloat
     ) -> None:
         self.values = self._convertandtest(values, self.name)
-        self.timegrids = copy.deepcopy(exceptiontools.getattr_(hydpy.pub, "timegrids"))
+        self.key = _get_key()
 
     def call_fdel(self, obj: Indexer) -> None:
         self.fdel(obj)
 
     def _fdel(self, obj: Indexer) -> None:  # pylint: disable=unused-argument
         self.values = None
-        self.timegrids = None
+        self.key = None
+        self._cache.clear()
 
     @staticmethod
-    def _convertandtest(values: VectorInputFloat, name: str) -> VectorFloat:
+    def _convertandtest(values: VectorInputFloat, name: str) -> IndexArray:
         try:
             type_ = type(values[0])
-            array: NDArrayFloat = numpy.asarray(
+            array: IndexArray = numpy.asarray(
                 values, dtype=config.TYPES_PY2NP.get(type_, type_)
             )
         except BaseException:
@@ -184,17 +244,15 @@ representing the actual initialisation period is `5`.
                 )
         return array
 
-    @staticmethod
-    def _calcidxs(func: Date2Float) -> VectorFloat:
-        timegrids = _get_timegrids(func)
-        type_ = type(func(timegrids.init[0]))
-        idxs: VectorFloat = numpy.empty(
-            len(timegrids.init), dtype=config.TYPES_PY2NP.get(type_, type_)
-        )
-        with hydpy.pub.options.timestampleft(True):
-            for jdx, date in enumerate(hydpy.pub.timegrids.init):
-                idxs[jdx] = func(date)
-        return idxs
+
+class SolarTables(NamedTuple):
+    """Location-dependent astronomical values covering the initialisation period
+    (see method |Indexer.get_solartables|)."""
+
+    sunsethourangle: VectorFloat
+    """Sunset hour angle [rad]."""
+    extraterrestrialradiation: VectorFloat
+    """Extraterrestrial radiation [W/m²]."""
 
 
 class Indexer:
@@ -204,7 +262,12 @@ class Indexer:
     automatically based on the |Timegrids| object made available through module |pub|.
     """
 
+    _solartables: dict[tuple[float, float, float], SolarTables]
+    _solartables_key: Hashable
+
     def __init__(self) -> None:
+        self._solartables = {}
+        self._solartables_key = None
         self._monthofyear = None
         self._monthofyear_timegrids = hash(None)
         self._dayofyear = None
@@ -213,7 +276,7 @@ class Indexer:
         self._timeofyear_hash = hash(None)
 
     @IndexerProperty
-    def monthofyear(self) -> Date2Float:
+    def monthofyear(self) -> VectorInt:
         """Index values, representing the month of the year.
 
         The following example shows the month indices of the last days of February and
@@ -226,13 +289,10 @@ class Indexer:
         1, 1, 1, 2, 2
         """
 
-        def _monthofyear(date: timetools.Date) -> int:
-            return date.month - 1
-
-        return _monthofyear
+        return _get_monthindices(_get_datetimes("monthofyear"))
 
     @IndexerProperty
-    def dayofyear(self) -> Date2Float:
+    def dayofyear(self) -> VectorInt:
         """Index values, representing the month of the year.
 
         For reasons of consistency between leap years and non-leap years, assuming a
@@ -249,13 +309,12 @@ class Indexer:
         57, 58, 60, 61
         """
 
-        def _dayofyear(date: timetools.Date) -> int:
-            return date.dayofyear - 1 + ((date.month > 2) and (not date.leapyear))
-
-        return _dayofyear
+        datetimes = _get_datetimes("dayofyear")
+        days = datetimes.astype("datetime64[D]") - datetimes.astype("datetime64[Y]")
+        return days.astype(config.NP_INT) + _get_leapdayshifts(datetimes)
 
     @IndexerProperty
-    def timeofyear(self) -> Date2Float:
+    def timeofyear(self) -> VectorInt:
         """Index values, representing the time of the year.
 
         Let us reconsider one of the examples of the documentation on property
@@ -291,20 +350,13 @@ class Indexer:
         Note the gap in the returned index array due to 2005 being not a leap year.
         """
 
-        def _timeofyear(date: timetools.Date) -> float:
-            date = copy.deepcopy(date)
-            date.year = 2000
-            return refgrid[date]
-
-        refgrid = timetools.Timegrid(
-            timetools.Date("2000.01.01"),
-            timetools.Date("2001.01.01"),
-            _get_timegrids(_timeofyear).stepsize,
-        )
-        return _timeofyear
+        datetimes = _get_datetimes("timeofyear")
+        seconds = (datetimes - datetimes.astype("datetime64[Y]")).astype(config.NP_INT)
+        seconds += 24 * 60 * 60 * _get_leapdayshifts(datetimes)
+        return seconds // int(_get_timegrid("timeofyear").stepsize.seconds)
 
     @IndexerProperty
-    def standardclocktime(self) -> Date2Float:
+    def standardclocktime(self) -> VectorFloat:
         """Standard clock time at the midpoints of the initialisation time steps in
         hours.
 
@@ -334,8 +386,224 @@ class Indexer:
         23.999306, 23.999583, 23.999861, 0.000139, 0.000417, 0.000694
         """
 
-        def _standardclocktime(date: timetools.Date) -> float:
-            t0 = date.hour + (date.minute + date.second / 60.0) / 60.0
-            return t0 + hydpy.pub.timegrids.stepsize.hours / 2.0
+        datetimes = _get_datetimes("standardclocktime")
+        seconds = (datetimes - datetimes.astype("datetime64[D]")).astype(config.NP_INT)
+        stepsize = _get_timegrid("standardclocktime").stepsize
+        return seconds / 3600.0 + stepsize.hours / 2.0
+
+    @IndexerProperty
+    def earthsundistance(self) -> VectorFloat:
+        r"""Relative inverse distance between the Earth and the sun according to
+        :cite:t:`ref-Allen1998`.
+
+        Basic equation (:cite:t:`ref-Allen1998`, equation 23):
+          :math:`1 + 0.033 \cdot cos(2 \cdot \pi / 366 \cdot (DOY + 1))`
+
+        Property |Indexer.earthsundistance| relies on the day of the year index array
+        (|Indexer.dayofyear|), which, as explained in the documentation on method
+        |Calc_EarthSunDistance_V1|, results in identical values for the same day in
+        leap years and non-leap years.  It calculates all values of the
+        initialisation period at once, and all models referencing this array share
+        it:
+
+        >>> from hydpy import print_vector, pub
+        >>> pub.timegrids = "2000-09-02", "2000-09-05", "1d"
+        >>> print_vector(pub.indexer.earthsundistance)
+        0.984491, 0.984993, 0.9855
+        """
+        doy = self.dayofyear
+        return 1.0 + 0.033 * numpy.cos(2.0 * numpy.pi / 366.0 * (doy + 1))
+
+    @IndexerProperty
+    def solardeclination(self) -> VectorFloat:
+        r"""Solar declination according to :cite:t:`ref-Allen1998`.
+
+        Basic equation (:cite:t:`ref-Allen1998`, equation 24):
+          :math:`0.409 \cdot sin(2 \cdot \pi / 366 \cdot (DOY + 1) - 1.39)`
+
+        See the documentation on method |Calc_SolarDeclination_V1| for further
+        information:
+
+        >>> from hydpy import print_vector, pub
+        >>> pub.timegrids = "2000-09-02", "2000-09-05", "1d"
+        >>> print_vector(pub.indexer.solardeclination)
+        0.124172, 0.117464, 0.110722
+        """
+        doy = self.dayofyear
+        return 0.409 * numpy.sin(2.0 * numpy.pi / 366.0 * (doy + 1) - 1.39)
+
+    @IndexerProperty
+    def solartimecorrection(self) -> VectorFloat:
+        r"""Seasonal correction for solar time in hours according to
+        :cite:t:`ref-Allen1998`.
+
+        Basic equations (:cite:t:`ref-Allen1998`, equations 32 and 33):
+          :math:`0.1645 \cdot sin(2 \cdot b) - 0.1255 \cdot cos(b) -
+          0.025 \cdot sin(b)`
+
+          :math:`b = (2 \cdot \pi \cdot (DOY - 80)) / 365`
 
-        return _standardclocktime
+        See the documentation on method |Calc_SolarTimeAngle_V1| for further
+        information:
+
+        >>> from hydpy import print_vector, pub
+        >>> pub.timegrids = "2000-09-02", "2000-09-05", "1d"
+        >>> print_vector(pub.indexer.solartimecorrection)
+        0.019208, 0.024964, 0.030791
+        """
+        b = 2.0 * numpy.pi * (self.dayofyear - 80.0) / 365.0
+        return (
+            0.1645 * numpy.sin(2.0 * b) - 0.1255 * numpy.cos(b) - 0.025 * numpy.sin(b)
+        )
+
+    def get_solartables(
+        self, latitude: float, longitude: float, utclongitude: float
+    ) -> SolarTables:
+        r"""Return the sunset hour angles and extraterrestrial radiation values of
+        the initialisation period for the given location according to
+        :cite:t:`ref-Allen1998`.
+
+        Basic equation (:cite:t:`ref-Allen1998`, equation 25):
+          :math:`SunsetHourAngle = arccos(-tan(\phi) \cdot tan(\delta))`
+
+        Basic equation for daily simulation steps (:cite:t:`ref-Allen1998`, equation
+        21):
+          :math:`ExtraterrestrialRadiation = \frac{G_{sc}}{\pi} \cdot d_r \cdot
+          (\omega_s \cdot sin(\phi) \cdot sin(\delta) + cos(\phi) \cdot
+          cos(\delta) \cdot sin(\omega_s))`
+
+        Basic equations for subdaily simulation steps (:cite:t:`ref-Allen1998`,
+        equations 28 to 33):
+          :math:`ExtraterrestrialRadiation = \frac{12 \cdot G_{sc}}{\pi \cdot H}
+          \cdot d_r \cdot \big( (\omega_2 - \omega_1) \cdot sin(\phi) \cdot
+          sin(\delta) + cos(\phi) \cdot cos(\delta) \cdot (sin(\omega_2) -
+          sin(\omega_1)) \big)`
+
+          :math:`\omega_{1, 2} = \omega \mp \pi \cdot H / 24`
+
+          :math:`\omega = \pi / 12 \cdot ((SCT + (Longitude - UTCLongitude) / 15 +
+          S_c) - 12)`
+
+        :math:`\phi` is the latitude in radians, :math:`\delta` the solar
+        declination (|Indexer.solardeclination|), :math:`d_r` the relative inverse
+        Earth-sun distance (|Indexer.earthsundistance|), :math:`S_c` the seasonal
+        correction for solar time (|Indexer.solartimecorrection|), :math:`SCT` the
+        standard clock time (|Indexer.standardclocktime|), :math:`H` the step size in
+        hours, and :math:`G_{sc}` the solar constant (1367 W/m²).  For subdaily steps,
+        :math:`\omega_1` and :math:`\omega_2` are limited to the interval
+        :math:`[-\omega_s, \omega_s]`, and the radiation is zero for steps lying
+        completely before sunrise or after sunset.
+
+        The following calculation agrees with example 8 of :cite:t:`ref-Allen1998`:
+
+        >>> from hydpy import print_vector, pub
+        >>> pub.timegrids = "2000-09-02", "2000-09-05", "1d"
+        >>> tables = pub.indexer.get_solartables(
+        ...     latitude=-20.0, longitude=15.0, utclongitude=15.0
+        ... )
+        >>> print_vector(tables.sunsethourangle)
+        1.525352, 1.527832, 1.53032
+        >>> print_vector(tables.extraterrestrialradiation)
+        371.35517, 373.360113, 375.363501
+
+        For daily (or longer) steps, the longitude does not matter, so models at the
+        same latitude share the same arrays:
+
+        >>> pub.indexer.get_solartables(
+        ...     latitude=-20.0, longitude=10.0, utclongitude=15.0
+        ... ) is tables
+        True
+
+        For subdaily steps, the extraterrestrial radiation depends on the longitude,
+        and averaging the hourly values yields the daily one:
+
+        >>> pub.timegrids = "2000-09-03", "2000-09-04", "1h"
+        >>> tables = pub.indexer.get_solartables(
+        ...     latitude=-20.0, longitude=15.0, utclongitude=15.0
+        ... )
+        >>> print_vector(tables.extraterrestrialradiation)
+        0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 120.873957, 433.078284, 715.274149,
+        945.047233, 1106.738881, 1189.330075, 1187.19236, 1100.471419,
+        935.077141, 702.280872, 417.947293, 107.331056, 0.0, 0.0, 0.0, 0.0,
+        0.0, 0.0
+        >>> from hydpy import round_
+        >>> round_(sum(tables.extraterrestrialradiation) / 24.0)
+        373.360113
+
+        |Indexer.get_solartables| calculates the values for all steps of the
+        initialisation period at once and caches them for each location.  Hence,
+        all models at identical coordinates share the same arrays:
+
+        >>> pub.indexer.get_solartables(
+        ...     latitude=-20.0, longitude=15.0, utclongitude=15.0
+        ... ) is tables
+        True
+        >>> pub.indexer.get_solartables(
+        ...     latitude=-20.0, longitude=16.0, utclongitude=15.0
+        ... ) is tables
+        False
+
+        Changing the initialisation period invalidates all cached values:
+
+        >>> pub.timegrids = "2000-09-03", "2000-09-05", "1h"
+        >>> tables = pub.indexer.get_solartables(
+        ...     latitude=-20.0, longitude=15.0, utclongitude=15.0
+        ... )
+        >>> len(tables.extraterrestrialradiation)
+        48
+
+        .. testsetup::
+
+            >>> del pub.timegrids
+        """
+        if _get_timegrid("extraterrestrialradiation").stepsize.days >= 1.0:
+            longitude, utclongitude = 0.0, 0.0
+        key = _get_key()
+        if key != self._solartables_key:
+            self._solartables.clear()
+            self._solartables_key = key
+        location = (latitude, longitude, utclongitude)
+        tables = self._solartables.get(location)
+        if tables is None:
+            tables = self._calc_solartables(latitude, longitude, utclongitude)
+            if key is not None:
+                self._solartables[location] = tables
+        return tables
+
+    def _calc_solartables(
+        self, latitude: float, longitude: float, utclongitude: float
+    ) -> SolarTables:
+        stepsize = _get_timegrid("extraterrestrialradiation").stepsize
+        days, hours = stepsize.days, stepsize.hours
+        latituderad = numpy.pi / 180.0 * latitude
+        distance = self.earthsundistance
+        declination = self.solardeclination
+        with numpy.errstate(invalid="ignore"):
+            sunset = numpy.arccos(-numpy.tan(latituderad) * numpy.tan(declination))
+        sinlat, coslat = numpy.sin(latituderad), numpy.cos(latituderad)
+        if days < 1.0:
+            time = (
+                self.standardclocktime
+                + (longitude - utclongitude) / 15.0
+                + self.solartimecorrection
+            )
+            solartimeangle = numpy.pi / 12.0 * (time - 12.0)
+            delta = numpy.pi * days
+            omega1 = solartimeangle - delta
+            omega2 = solartimeangle + delta
+            night = (omega1 > sunset) | (omega2 < -sunset)
+            omega1 = numpy.maximum(omega1, -sunset)
+            omega2 = numpy.minimum(omega2, sunset)
+            radiation = (12.0 * 1367.0 / numpy.pi / hours * distance) * (
+                (omega2 - omega1) * sinlat * numpy.sin(declination)
+                + coslat
+                * numpy.cos(declination)
+                * (numpy.sin(omega2) - numpy.sin(omega1))
+            )
+            radiation[night] = 0.0
+        else:
+            radiation = (1367.0 / numpy.pi * distance) * (
+                sunset * sinlat * numpy.sin(declination)
+                + coslat * numpy.cos(declination) * numpy.sin(sunset)
+            )
+        return SolarTables(sunsethourangle=sunset, extraterrestrialradiation=radiation)
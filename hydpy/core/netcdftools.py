@@ -733,7 +733,7 @@ to the NetCDF file `test.nc`, the following error occurred: ...
 
     >>> ncfile.close()
     """
-    default = fillvalue if (datatype == "f8") else None
+    default = fillvalue if (datatype in ("f4", "f8")) else None
     try:
         ncfile.createVariable(name, datatype, dimensions=dimensions, fill_value=default)
         ncfile[name].long_name = name
@@ -1178,6 +1178,14 @@ class JITAccessInfo(NamedTuple):
     data: NDArrayFloat
     """Bridge to transfer data between the NetCDF file and the (cythonized) 
     hydrological models."""
+    buffer: NDArrayFloat | None = None
+    """Storage for accumulating the values of |JITAccessInfo.data| over multiple 
+    simulation steps (only required for writing temporally aggregated data)."""
+    blocksize: int = 1
+    """Number of simulation steps aggregated into a single row of the NetCDF file."""
+    mean: bool = False
+    """Flag that indicates whether to average (|True|) or to sum (|False|) the values 
+    accumulated in |JITAccessInfo.buffer|."""
 
 
 class JITAccessHandler(NamedTuple):
@@ -1204,13 +1212,32 @@ class JITAccessHandler(NamedTuple):
 
     def write_slices(self, idx: int) -> None:
         """Write the time slice of the current simulation step from each NetCDF file
-        selected for writing."""
+        selected for writing.
+
+        For writers that aggregate temporally, |JITAccessHandler.write_slices| only
+        accumulates the current values and writes the aggregated values at the end of
+        each aggregation step.
+        """
         for writer in self.writers:
-            jdx = idx + writer.timedelta
+            if (buffer := writer.buffer) is None:
+                jdx = idx + writer.timedelta
+                values = writer.data
+            else:
+                blocksize = writer.blocksize
+                if idx % blocksize:
+                    buffer += writer.data
+                else:
+                    buffer[:] = writer.data
+                if (idx + 1) % blocksize:
+                    continue
+                if writer.mean:
+                    buffer /= blocksize
+                jdx = idx // blocksize + writer.timedelta
+                values = buffer
             if writer.realisation:
-                writer.ncvariable[jdx, 0, writer.columns] = writer.data
+                writer.ncvariable[jdx, 0, writer.columns] = values
             else:
-                writer.ncvariable[jdx, writer.columns] = writer.data
+                writer.ncvariable[jdx, writer.columns] = values
 
 
 class Subdevice2Index:
@@ -1703,7 +1730,7 @@ handle a sequence for the (sub)device `element2` nor define a member named \
                         try:
                             if seq.NDIM:
                                 subshape = (array.shape[0],) + seq.shape
-                                subarray = numpy.empty(subshape)
+                                subarray = numpy.empty(subshape, dtype=array.dtype)
                                 temp = devicename + "_"
                                 for prod in self._product(seq.shape):
                                     station = temp + "_".join(str(idx) for idx in prod)
@@ -1867,6 +1894,13 @@ series data for the (sub)device `element2` nor define a member named `element2`.
     def array(self) -> NDArrayFloat:
         """A |numpy.ndarray| containing the values of all logged sequences."""
 
+    @property
+    def _dtype(self) -> type[numpy.floating[Any]]:
+        dtypes = {a.dtype for a in self._descr2array.values() if a is not None}
+        if dtypes == {numpy.dtype(numpy.float32)}:
+            return numpy.float32
+        return config.NP_FLOAT
+
     @classmethod
     def __hydpy_write_ncfile__(
         cls,
@@ -1874,7 +1908,7 @@ series data for the (sub)device `element2` nor define a member named `element2`.
         filepath: str,
         sequence: str,
         subdevicenames: Sequence[str],
-        seriesmatrix: MatrixFloat,
+        seriesmatrix: MatrixFloat | None,
         timegrid: timetools.Timegrid,
         timereference: Literal["current", "left", "right"] | None,
         cfunit: timetools.TypeUnit,
@@ -1922,8 +1956,12 @@ series data for the (sub)device `element2` nor define a member named `element2`.
             )
             cls.insert_subdevices(ncfile, subdevicenames=subdevicenames)
             dimensions = dimmapping["nmb_timepoints"], dimmapping["nmb_subdevices"]
-            create_variable(ncfile, sequence, "f8", dimensions)
-            ncfile[sequence][:] = seriesmatrix
+            single = (seriesmatrix is not None) and (
+                seriesmatrix.dtype == numpy.float32
+            )
+            create_variable(ncfile, sequence, "f4" if single else "f8", dimensions)
+            if seriesmatrix is not None:
+                ncfile[sequence][:] = seriesmatrix
 
     def write(self) -> None:
         """Write the logged data to a new NetCDF file.
@@ -1931,7 +1969,24 @@ series data for the (sub)device `element2` nor define a member named `element2`.
         See the general documentation on classes |NetCDFVariableFlatWriter| and
         |NetCDFVariableAggregated| for some examples.
         """
+        self._write(seriesmatrix=self.array, timegrid=hydpy.pub.timegrids.init)
+
+    def create(self, timegrid: timetools.Timegrid) -> None:
+        """Create a new NetCDF file that covers the given time grid but does not
+        contain any data yet.
+
+        Unlike |MixinVariableWriter.write|, |MixinVariableWriter.create| does not
+        require the logged sequences to handle any time series data.  Hence, it helps
+        to prepare NetCDF files for writing data "just in time" without allocating
+        memory for the complete time series.  All values of the new file are
+        |numpy.nan| initially.  See the documentation on method
+        |NetCDFInterfaceJIT.provide_jitaccess| for an example.
+        """
+        self._write(seriesmatrix=None, timegrid=timegrid)
 
+    def _write(
+        self, *, seriesmatrix: MatrixFloat | None, timegrid: timetools.Timegrid
+    ) -> None:
         timereference: Literal["current", "left", "right"]
         if _timereference_currenttime(self._anysequence):
             timereference = "current"
@@ -1942,12 +1997,12 @@ series data for the (sub)device `element2` nor define a member named `element2`.
             filepath=self.filepath,
             sequence=self.name,
             subdevicenames=self.subdevicenames,
-            seriesmatrix=self.array,
-            timegrid=hydpy.pub.timegrids.init,
+            seriesmatrix=seriesmatrix,
+            timegrid=timegrid,
             timereference=timereference,
             cfunit="hours",
             cfconvention="CF-1.8",
-            namingconvention=hydpy.pub.sequencemanager.convention,  # type: ignore[arg-type]  # pylint: disable=line-too-long
+            namingconvention=hydpy.pub.sequencemanager.convention,  # type: ignore[arg-type]
             history=None,
         )
 
@@ -2028,7 +2083,7 @@ class NetCDFVariableFlatWriter(MixinVariableWriter, NetCDFVariableFlat):
         | 80.0, 81.0, 82.0, 83.0, 84.0, 85.0 |
         | 86.0, 87.0, 88.0, 89.0, 90.0, 91.0 |
         """
-        array = numpy.full(self.shape, fillvalue, dtype=config.NP_FLOAT)
+        array = numpy.full(self.shape, fillvalue, dtype=self._dtype)
         idx0 = 0
         idxs: list[Any] = [slice(None)]
         for seq, subarray in zip(
@@ -2160,7 +2215,7 @@ class NetCDFVariableAggregated(MixinVariableWriter, NetCDFVariable):
         | 82.5 |
         | 88.5 |
         """
-        array = numpy.full(self.shape, fillvalue, dtype=config.NP_FLOAT)
+        array = numpy.full(self.shape, fillvalue, dtype=self._dtype)
         for idx, subarray in enumerate(self._descr2array.values()):
             if subarray is not None:
                 array[:, idx] = subarray
@@ -2468,6 +2523,55 @@ class NetCDFInterfaceWriter(
             variable.write()
 
 
+def _query_jitblock(writing: bool) -> tuple[timetools.Timegrid | None, int]:
+    """Return the time grid and the number of simulation steps of the aggregation
+    blocks for writing temporally aggregated data "just in time" (or |None| and one if
+    no aggregation is required)."""
+    tg_init = hydpy.pub.timegrids.init
+    tg_sim = hydpy.pub.timegrids.sim
+    stepsize = hydpy.pub.sequencemanager.jitstepsize
+    if not (stepsize and writing and (stepsize != tg_sim.stepsize)):
+        return None, 1
+    if (
+        (stepsize % tg_sim.stepsize)
+        or ((tg_init.lastdate - tg_init.firstdate) % stepsize)
+        or ((tg_sim.firstdate - tg_init.firstdate) % stepsize)
+        or ((tg_sim.lastdate - tg_init.firstdate) % stepsize)
+    ):
+        raise RuntimeError(
+            f"Writing temporally aggregated data requires that the aggregation step "
+            f"size ({stepsize}) is a multiple of the simulation step size "
+            f"({tg_sim.stepsize}) and that the initialisation period ({tg_init}) and "
+            f"the simulation period ({tg_sim}) consist of complete aggregation steps."
+        )
+    tg_block = timetools.Timegrid(tg_init.firstdate, tg_init.lastdate, stepsize)
+    return tg_block, int(stepsize / tg_sim.stepsize)
+
+
+def _query_jittimedelta(
+    filepath: str,
+    ncfile: netcdf4.Dataset,
+    sequence: sequencetools.IOSequence,
+    tg_block: timetools.Timegrid | None,
+) -> int:
+    """Check if the given NetCDF file covers the current simulation period (or its
+    aggregation blocks) and return the index of the start of the initialisation period
+    within the file's time dimension."""
+    tg_sim = hydpy.pub.timegrids.sim
+    tg_variable = query_timegrid(ncfile, sequence)
+    tg_required = tg_sim
+    if tg_block is not None:
+        tg_required = timetools.Timegrid(
+            tg_sim.firstdate, tg_sim.lastdate, tg_block.stepsize
+        )
+    if tg_required not in tg_variable:
+        raise RuntimeError(
+            f"The data of the NetCDF `{filepath}` ({tg_variable}) does not correctly "
+            f"cover the current simulation period ({tg_required})."
+        )
+    return tg_variable[hydpy.pub.timegrids.init.firstdate]
+
+
 class NetCDFInterfaceJIT(NetCDFInterfaceBase[FlatUnion]):
     """Interface between |SequenceManager| and multiple |NetCDFVariableFlatWriter|
     instances for reading or writing data just in time.
@@ -2771,6 +2875,71 @@ data for (sub)device `land_lahn_kalk_0` is available in NetCDF file \
         54.019332, 37.257552, 31.865302, 28.359538
         42.34647, 27.157463, 22.880985, 20.156832
         0.0, 0.0, 0.0, 0.0
+
+        Writing data "just in time" frees us from keeping complete time series in RAM,
+        but the written files still contain the values of all simulation steps.  If
+        only temporally aggregated values are of interest (for example, daily averages
+        of hourly simulation results), you can set the |SequenceManager.jitstepsize|
+        option.  Then, |JITAccessHandler.write_slices| accumulates the data of
+        subsequent simulation steps and writes only the aggregated values, so that
+        neither the memory requirements nor the file sizes increase with the length
+        of the simulation period at the original resolution.  We demonstrate this by
+        writing the 2-day averages of the runoff of both non-headwater catchments
+        without allocating RAM for the complete time series:
+
+        >>> import os
+        >>> with TestIO(), pub.options.threads(0):
+        ...     os.remove(filepath_qt)
+        ...     for element in nonheadwaters:
+        ...         qt = element.model.sequences.fluxes.qt
+        ...         qt.prepare_series(allocate_ram=False, write_jit=True)
+        ...     hp.load_conditions()
+        ...     with pub.sequencemanager.jitstepsize("2d"):
+        ...         hp.simulate()
+        >>> with TestIO(), netcdf4.Dataset(filepath_qt, "r") as ncfile:
+        ...     print(query_timegrid(ncfile, qt))
+        ...     for jdx in range(2):
+        ...         print_vector(ncfile["hland_96_flux_qt"][:, jdx])
+        Timegrid("1996-01-01 00:00:00", "1996-01-05 00:00:00", "2d")
+        10.886476, 8.593512
+        14.616836, 6.825269
+
+        Use the |SequenceManager.jitaggregator| option to sum instead of averaging the
+        values.  Writing into an existing file works as long as its time grid matches
+        the aggregation step size:
+
+        >>> with TestIO(), pub.options.threads(0):
+        ...     hp.load_conditions()
+        ...     with pub.sequencemanager.jitstepsize("2d"):
+        ...         with pub.sequencemanager.jitaggregator("sum"):
+        ...             hp.simulate()
+        >>> with TestIO(), netcdf4.Dataset(filepath_qt, "r") as ncfile:
+        ...     for jdx in range(2):
+        ...         print_vector(ncfile["hland_96_flux_qt"][:, jdx])
+        21.772951, 17.187023
+        29.233671, 13.650539
+
+        Each aggregation step must be a multiple of the simulation step size, and the
+        initialisation and simulation periods must consist of complete aggregation
+        steps:
+
+        >>> with TestIO(), pub.options.threads(0):
+        ...     pub.timegrids.sim.lastdate = "1996-01-04"
+        ...     with pub.sequencemanager.jitstepsize("2d"):
+        ...         hp.simulate()  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        RuntimeError: While trying to prepare NetCDF files for reading or writing \
+data "just in time" during the current simulation run, the following error occurred: \
+Writing temporally aggregated data requires that the aggregation step size (2d) is a \
+multiple of the simulation step size (1d) and that the initialisation period \
+(Timegrid("1996-01-01 00:00:00", "1996-01-05 00:00:00", "1d")) and the simulation \
+period (Timegrid("1996-01-01 00:00:00", "1996-01-04 00:00:00", "1d")) consist of \
+complete aggregation steps.
+
+        >>> pub.timegrids.sim.lastdate = "1996-01-05"
+        >>> for element in nonheadwaters:
+        ...     element.model.sequences.fluxes.qt.prepare_series(allocate_ram=False)
         """
 
         readers: list[JITAccessInfo] = []
@@ -2807,8 +2976,10 @@ data for (sub)device `land_lahn_kalk_0` is available in NetCDF file \
                 if variable2sequences:
                     # prepare NetCDF files:
                     variable2timedelta: dict[FlatUnion, int] = {}
-                    tg_init = hydpy.pub.timegrids.init
-                    tg_sim = hydpy.pub.timegrids.sim
+                    sm = hydpy.pub.sequencemanager
+                    tg_block, blocksize = _query_jitblock(
+                        writing=not all(variable2readmode.values())
+                    )
                     for variable in tuple(variable2readmode):
                         filepath = variable.filepath
                         if not os.path.exists(filepath):
@@ -2824,18 +2995,20 @@ data for (sub)device `land_lahn_kalk_0` is available in NetCDF file \
                                         sequence.prepare_series(read_jit=False)
                                         disabled[sequence] = sequence.seriesmode
                                 continue
-                            variable.write()
+                            if tg_block is None:
+                                variable.write()
+                            else:
+                                variable.create(tg_block)
                         ncfile = netcdf4.Dataset(filepath, "r+")
                         variable2ncfile[variable] = ncfile
-                        sequence = variable2sequences[variable][0]
-                        tg_variable = query_timegrid(ncfile, sequence)
-                        if tg_sim not in tg_variable:
-                            raise RuntimeError(
-                                f"The data of the NetCDF `{filepath}` ({tg_variable}) "
-                                f"does not correctly cover the current simulation "
-                                f"period ({tg_sim})."
-                            )
-                        variable2timedelta[variable] = tg_variable[tg_init.firstdate]
+                        variable2timedelta[variable] = _query_jittimedelta(
+                            filepath=filepath,
+                            ncfile=ncfile,
+                            sequence=variable2sequences[variable][0],
+                            tg_block=(
+                                None if variable2readmode[variable] else tg_block
+                            ),
+                        )
 
                     # make information for reading and writing temporarily available:
                     for variable, sequences in variable2sequences.items():
@@ -2846,6 +3019,9 @@ data for (sub)device `land_lahn_kalk_0` is available in NetCDF file \
                         data = numpy.full(
                             variable.shape[1], numpy.nan, dtype=config.NP_FLOAT
                         )
+                        aggregate = (tg_block is not None) and (
+                            not variable2readmode[variable]
+                        )
                         variable2infos[variable].append(
                             JITAccessInfo(
                                 ncvariable=(ncvariable := ncfile[variable.name]),
@@ -2853,6 +3029,9 @@ data for (sub)device `land_lahn_kalk_0` is available in NetCDF file \
                                 timedelta=variable2timedelta[variable],
                                 columns=tuple(get(n) for n in variable.subdevicenames),
                                 data=data,
+                                buffer=numpy.zeros_like(data) if aggregate else None,
+                                blocksize=blocksize if aggregate else 1,
+                                mean=sm.jitaggregator == "mean",
                             )
                         )
                         # the following algorithm relies on the iteration order defined
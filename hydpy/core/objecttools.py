@@ -12,7 +12,6 @@ import sys
 import textwrap
 import types
 
-import black
 import numpy
 import wrapt
 
@@ -1900,9 +1899,6 @@ def get_printtarget(file_: TextIO | str | None) -> Generator[TextIO, None, None]
         file_.flush()
 
 
-_black_filemode = black.FileMode()
-
-
 def apply_black(name: str, *args: object, **kwargs: object) -> str:
     """Return a string representation of an instance of a class based on the given
     name, positional arguments and keyword arguments.
@@ -1929,6 +1925,10 @@ string=f"a {10*'very '}long test"))
         string="a very very very very very very very very very very long test",
     )
     """
+    # Importing black takes a noticeable amount of time, so we defer it until the
+    # first string representation requires it:
+    import black  # pylint: disable=import-outside-toplevel
+
     with repr_.preserve_strings(True):
         arguments = ", ".join(
             itertools.chain(
@@ -1936,7 +1936,7 @@ string=f"a {10*'very '}long test"))
                 (f"{name}={repr_(value)}" for name, value in kwargs.items()),
             )
         )
-    return black.format_str(f"{name}({arguments})", mode=_black_filemode)[:-1]
+    return black.format_str(f"{name}({arguments})", mode=black.FileMode())[:-1]
 
 
 def value2bool(argument: str, value: str | int) -> bool:
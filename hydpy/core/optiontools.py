@@ -17,6 +17,7 @@ TypeOption = TypeVar(
     timetools.Period,
     SeriesFileType,
     SeriesAggregationType,
+    SeriesAggregatorType,
     SeriesConventionType,
 )
 TypeOptionContextBase = TypeVar("TypeOptionContextBase", bound="OptionContextBase[Any]")
@@ -636,6 +637,73 @@ one of the following modes: none and mean.
     _CONTEXT = OptionContextStr[SeriesAggregationType]
 
 
+def _check_seriesaggregatortype(value: SeriesAggregatorType) -> SeriesAggregatorType:
+    try:
+        if value == "mean":
+            return "mean"
+        if value == "sum":
+            return "sum"
+        assert_never(value)
+    except AssertionError:
+        raise ValueError(
+            f"The given aggregator `{value}` is not implemented.  Please choose one "
+            f"of the following aggregators: mean and sum."
+        ) from None
+    assert False
+
+
+class OptionPropertySeriesAggregator(
+    OptionPropertyBase[SeriesAggregatorType, OptionContextStr[SeriesAggregatorType]]
+):
+    """Descriptor for defining options of type |SeriesAggregatorType|.
+
+    In contrast to |OptionPropertySeriesAggregation|, which addresses the spatial
+    aggregation of time series, |OptionPropertySeriesAggregator| addresses temporal
+    aggregation.  Currently, one can either average (`mean`) or sum (`sum`) the values
+    of subsequent simulation steps.  Options based on |OptionPropertySeriesAggregator|
+    automatically check if the given string meets one of these aggregators and raise
+    errors if not:
+
+    >>> from hydpy.core.optiontools import OptionPropertySeriesAggregator
+    >>> class T:
+    ...     v = OptionPropertySeriesAggregator("mean", "x")
+    >>> T.v.__doc__
+    'x'
+
+    >>> t = T()
+    >>> assert t.v == "mean"
+    >>> t.v = "max"
+    Traceback (most recent call last):
+    ...
+    ValueError: The given aggregator `max` is not implemented.  Please choose one of \
+the following aggregators: mean and sum.
+    >>> assert t.v == "mean"
+    >>> t.v = "sum"
+    >>> assert t.v == "sum"
+    >>> t.v = "mean"
+    >>> assert t.v == "mean"
+
+    >>> with t.v("max"):
+    ...     pass
+    Traceback (most recent call last):
+    ...
+    ValueError: The given aggregator `max` is not implemented.  Please choose one of \
+the following aggregators: mean and sum.
+    >>> assert t.v == "mean"
+    >>> with t.v("sum"):
+    ...     assert t.v == "sum"
+    ...     with t.v():
+    ...         assert t.v == "sum"
+    ...     with t.v(None):
+    ...         assert t.v == "sum"
+    ...     assert t.v == "sum"
+    >>> assert t.v == "mean"
+    """
+
+    _CONVERTER = (_check_seriesaggregatortype,)
+    _CONTEXT = OptionContextStr[SeriesAggregatorType]
+
+
 def _check_seriesconventiontype(value: SeriesConventionType) -> SeriesConventionType:
     try:
         if value == "model-specific":
@@ -798,6 +866,21 @@ class Options:
         >>> assert pub.options.ellipsis == -999
         """,
     )
+    lazyvariables = OptionPropertyBool(
+        False,
+        """A bool-like flag for letting newly prepared parameter subgroups create the 
+        objects of simple parameters without special initialisation or updating 
+        procedures only when first accessed (see class |SubVariables| and method 
+        `__hydpy__prepare_deferredvariable__` of class |Parameter|) to reduce 
+        memory consumption.  Iterating over a subgroup still creates all of them.  
+        Sequence objects are never deferred.
+        
+        Defaults to false:
+        
+        >>> from hydpy import pub
+        >>> assert not pub.options.lazyvariables
+        """,
+    )
     parameterstep = OptionPropertyPeriod(
         timetools.Period("1d"),
         """The actual parameter time step size.  Change it by passing a |Period| object 
@@ -838,6 +921,24 @@ class Options:
         >>> assert pub.options.reprdigits == -1
         """,
     )
+    shareparameters = OptionPropertyBool(
+        False,
+        """A bool-like flag for letting parameters with identical values share the 
+        same value arrays to reduce memory consumption (see method |Parameter.share|).
+        
+        *HydPy* protects shared arrays against changes via the usual parameter 
+        interfaces and, in pure Python mode, also against in-place modifications via 
+        the fast access attributes.  The shared arrays of Cython models must remain 
+        writeable on the C level.  Also, enabling this option does not save the 
+        time required to calculate derived parameter values, which still happens 
+        for each model individually (see method |Parameters.share|).
+        
+        Defaults to false:
+        
+        >>> from hydpy import pub
+        >>> assert not pub.options.shareparameters
+        """,
+    )
     simulationstep = _OptionPropertySimulationstep(
         timetools.Period(),
         """The actual simulation time step size.  
@@ -5,12 +5,15 @@ from __future__ import annotations
 import builtins
 import contextlib
 import copy
+import functools
+import hashlib
 import inspect
 import itertools
 import math
 import textwrap
 import types
 import warnings
+import weakref
 
 import numpy
 
@@ -36,6 +39,24 @@ TypeSubParameters = TypeVar(
     "TypeSubParameters", bound="SubParameters[modeltools.Model]"
 )
 
+_sharedarrays: weakref.WeakValueDictionary[
+    tuple[bool, str, tuple[int, ...], bytes], NDArray[Any]
+] = weakref.WeakValueDictionary()
+"""Registry of the value arrays shared between |Parameter| objects (see method
+|Parameter.share|)."""
+
+
+def _unshare_first(method: Callable[..., T1]) -> Callable[..., T1]:
+    """Let the given method of a |Parameter| subclass call |Parameter.unshare| before
+    doing anything else."""
+
+    @functools.wraps(method)
+    def _wrapper(self: Parameter, *args: Any, **kwargs: Any) -> T1:
+        self.unshare()
+        return method(self, *args, **kwargs)
+
+    return _wrapper
+
 
 def trim_kwarg(
     parameter: Parameter,
@@ -277,13 +298,16 @@ class Parameters(Generic[TM_co]):
         >>> parameterstep("1d")
         >>> simulationstep("1d")
         >>> derived
-        doy(?)
         moy(?)
         hours(?)
         days(?)
         sct(?)
+        earthsundistances(?)
+        solardeclinations(?)
+        solartimecorrections(?)
+        sunsethourangles(?)
+        extraterrestrialradiations(?)
         utclongitude(?)
-        latituderad(?)
 
         Trying to update the values of the secondary parameters while the primary ones
         are still not defined raises errors like the following:
@@ -292,9 +316,9 @@ class Parameters(Generic[TM_co]):
         Traceback (most recent call last):
         ...
         hydpy.core.exceptiontools.AttributeNotReady: While trying to update parameter \
-`doy` of element `?`, the following error occurred: An Indexer object has been asked \
-for an `dayofyear` array.  Such an array has neither been determined yet nor can it \
-be determined automatically at the moment.  Either define an `dayofyear` array \
+`moy` of element `?`, the following error occurred: An Indexer object has been asked \
+for an `monthofyear` array.  Such an array has neither been determined yet nor can it \
+be determined automatically at the moment.  Either define an `monthofyear` array \
 manually and pass it to the Indexer object, or make a proper Timegrids object \
 available within the pub module.
 
@@ -304,9 +328,8 @@ available within the pub module.
         Traceback (most recent call last):
         ...
         hydpy.core.exceptiontools.AttributeNotReady: While trying to update parameter \
-`latituderad` of element `?`, the following error occurred: While trying to multiply \
-variable `latitude` and `float` instance `0.017453`, the following error occurred: \
-For variable `latitude`, no value has been defined so far.
+`sunsethourangles` of element `?`, the following error occurred: For variable \
+`latitude`, no value has been defined so far.
 
         With a defined |Timegrids| object and proper values both for parameters
         |meteo_control.Latitude| and |meteo_control.Longitude|, updating the derived
@@ -316,22 +339,27 @@ For variable `latitude`, no value has been defined so far.
         >>> longitude(10.0)
         >>> model.parameters.update()
         >>> derived
-        doy(29, 30, 31, 32, 33)
         moy(0, 0, 1, 1, 1)
         hours(24.0)
         days(1.0)
         sct(12.0, 12.0, 12.0, 12.0, 12.0)
+        earthsundistances(1.028719, 1.028436, 1.028145, 1.027845, 1.027536)
+        solardeclinations(-0.313921, -0.309375, -0.304737, -0.300009, -0.295193)
+        solartimecorrections(-0.222619, -0.225493, -0.228156, -0.230606,
+                             -0.232841)
+        sunsethourangles(1.173517, 1.179995, 1.186565, 1.193225, 1.199971)
+        extraterrestrialradiations(128.095678, 130.176536, 132.305686,
+                                   134.482757, 136.70735)
         utclongitude(15)
-        latituderad(0.872665)
 
         .. testsetup::
 
             >>> del pub.timegrids
         """
-        for par in self.control:
+        for par in self.control.iter_created():
             par.update()
         for subpars in self.secondary_subpars:
-            for par in subpars:
+            for par in subpars.iter_created():
                 try:
                     par.update()
                 except BaseException:
@@ -340,6 +368,57 @@ For variable `latitude`, no value has been defined so far.
                             f"While trying to update parameter "
                             f"{objecttools.elementphrase(par)}"
                         )
+        if hydpy.pub.options.shareparameters:
+            self.share()
+
+    def share(self) -> None:
+        """Call method |Parameter.share| of all |Parameter| objects handled by the
+        actual model.
+
+        Method |Parameters.update| calls method |Parameters.share| automatically if
+        option |Options.shareparameters| is enabled.  Then, models with identical
+        parameter values share the same value arrays, as the following example
+        based on the :ref:`HydPy-H-Lahn` project shows.  Note that sharing only
+        reduces memory consumption.  |Parameters.update| still calculates the values
+        of all derived parameters for each model individually (because many of their
+        `update` methods have side effects, like shaping log sequences) and shares
+        the results afterwards:
+
+        .. testsetup::
+
+            >>> from hydpy import pub
+            >>> del pub.options.usedefaultvalues
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> with pub.options.shareparameters(True):
+        ...     hp, pub, TestIO = prepare_full_example_2()
+        >>> from numpy import shares_memory
+        >>> dill = hp.elements.land_dill_assl.model.parameters
+        >>> kalk = hp.elements.land_lahn_kalk.model.parameters
+        >>> dill.control.sfdist.shared
+        True
+        >>> shares_memory(dill.control.sfdist.values, kalk.control.sfdist.values)
+        True
+        >>> shares_memory(dill.control.zonez.values, kalk.control.zonez.values)
+        False
+
+        Without this option, all models keep their own arrays:
+
+        >>> hp, pub, TestIO = prepare_full_example_2()
+        >>> dill = hp.elements.land_dill_assl.model.parameters
+        >>> kalk = hp.elements.land_lahn_kalk.model.parameters
+        >>> dill.control.sfdist.shared
+        False
+        >>> shares_memory(dill.control.sfdist.values, kalk.control.sfdist.values)
+        False
+
+        .. testsetup::
+
+            >>> del pub.timegrids
+        """
+        for subpars in self:
+            for par in subpars.iter_created():
+                par.share()
 
     def verify(self) -> None:
         """Call method |Variable.verify| of all |Parameter| objects handled by the
@@ -377,7 +456,7 @@ yet: longitude(?).
         Traceback (most recent call last):
         ...
         hydpy.core.exceptiontools.AttributeNotReady: Shape information for variable \
-`doy` can only be retrieved after it has been defined.
+`moy` can only be retrieved after it has been defined.
 
         After updating the derived parameters (which requires preparing a |Timegrids|
         object first), method |Parameters.verify| has no reason to complain anymore:
@@ -1274,12 +1353,175 @@ broadcast input array from shape (2,) into shape (2,3)
     _CLS_FASTACCESS_PYTHON = FastAccessParameter
 
     _keywordarguments: KeywordArguments[Any]
+    _sharedvalues: NDArray[Any] | None = None
 
     def __init__(self, subvars: SubParameters[modeltools.Model]) -> None:
         super().__init__(subvars)
         self.subpars = subvars
         self._keywordarguments = KeywordArguments(False)
 
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        for name in ("__call__", "trim", "update"):
+            if isinstance(method := vars(cls).get(name), types.FunctionType):
+                setattr(cls, name, _unshare_first(method))
+
+    def share(self) -> None:
+        """Let the parameter share its value array with all other parameters handling
+        identical values.
+
+        Large projects often contain many elements with identical parameter values.
+        Sharing saves the memory otherwise required for storing identical values
+        multiple times.  Usually, you activate sharing via option
+        |Options.shareparameters| instead of calling method |Parameter.share|
+        directly.
+
+        We prepare three instances of a 1-dimensional test parameter class, two
+        handling identical and one handling different values:
+
+        >>> from hydpy.core.parametertools import Parameter
+        >>> class Par(Parameter):
+        ...     NDIM = 1
+        ...     TYPE = float
+        ...     SPAN = 0.0, None
+        >>> par1, par2, par3 = Par(None), Par(None), Par(None)
+        >>> for par, value in ((par1, 1.0), (par2, 1.0), (par3, 2.0)):
+        ...     par.shape = 3
+        ...     par(value)
+        ...     par.share()
+
+        All three parameters now use shared arrays (see property |Parameter.shared|),
+        but only the first two parameters use the same one:
+
+        >>> par1.shared, par2.shared, par3.shared
+        (True, True, True)
+        >>> par1.fastaccess.par is par2.fastaccess.par
+        True
+        >>> par1.fastaccess.par is par3.fastaccess.par
+        False
+
+        To prevent that changing the values of one parameter affects the others
+        unexpectedly, property |Variable.values| returns read-only views of shared
+        arrays:
+
+        >>> par1.values[0] = 3.0
+        Traceback (most recent call last):
+        ...
+        ValueError: assignment destination is read-only
+
+        Assigning new values via item access, calling the parameter, or all similar
+        ways of changing values implemented by *HydPy* "unshares" the parameter by
+        copying the shared array first (see method |Parameter.unshare|):
+
+        >>> par1[0] = 3.0
+        >>> par1.shared, par2.shared
+        (False, True)
+        >>> par1
+        par(3.0, 1.0, 1.0)
+        >>> par2
+        par(1.0)
+
+        >>> par2(4.0)
+        >>> par2.shared
+        False
+        >>> par2
+        par(4.0)
+
+        In pure Python mode, the shared arrays themselves are read-only, so writing
+        into them via |Variable.fastaccess| fails, too:
+
+        >>> par5, par6 = Par(None), Par(None)
+        >>> for par in (par5, par6):
+        ...     par.shape = 3
+        ...     par(5.0)
+        ...     par.share()
+        >>> par5.fastaccess.par[0] = 6.0
+        Traceback (most recent call last):
+        ...
+        ValueError: assignment destination is read-only
+        >>> par6
+        par(5.0)
+
+        Cython's memoryviews do not accept read-only buffers.  Hence, the shared
+        arrays of cythonized models remain writeable on the C level, and
+        |Parameter.share| keeps them separate from the read-only ones.  Model methods
+        only read parameter values, so this difference does not affect simulations.
+        If someone modifies a shared array of a cythonized model nevertheless,
+        |Parameter.share| compares its content before reusing it, so that the
+        modification does not spread to parameters that start sharing later.
+
+        Method |Parameter.share| ignores parameters without any values:
+
+        >>> par4 = Par(None)
+        >>> par4.share()
+        >>> par4.shared
+        False
+        """
+        if not self.NDIM:
+            return
+        values = getattr(self.fastaccess, self.name, None)
+        if values is None:
+            return
+        values = numpy.asarray(values)
+        readonly = isinstance(self.fastaccess, variabletools.FastAccess)
+        key = (
+            readonly,
+            values.dtype.str,
+            values.shape,
+            hashlib.blake2b(values.tobytes(), digest_size=16).digest(),
+        )
+        shared = _sharedarrays.get(key)
+        if (shared is None) or (shared.tobytes() != values.tobytes()):
+            if readonly:
+                values.flags.writeable = False
+            _sharedarrays[key] = shared = values
+        elif shared is not values:
+            setattr(self.fastaccess, self.name, shared)
+        self._sharedvalues = shared
+
+    def unshare(self) -> None:
+        """Give the parameter its own copy of the currently shared value array.
+
+        See method |Parameter.share| for further information.
+        """
+        if self._sharedvalues is not None:
+            if self.shared:
+                setattr(self.fastaccess, self.name, numpy.array(self._sharedvalues))
+            self._sharedvalues = None
+
+    @property
+    def shared(self) -> bool:
+        """A flag telling whether the parameter currently shares its value array with
+        other parameters.
+
+        See method |Parameter.share| for further information.
+        """
+        return self._check_shared(getattr(self.fastaccess, self.name, None))
+
+    def _check_shared(self, values: Any) -> bool:
+        if (shared := self._sharedvalues) is None:
+            return False
+        if values is not None:
+            values = numpy.asarray(values)
+            if (values.shape == shared.shape) and (
+                values.__array_interface__["data"][0]
+                == shared.__array_interface__["data"][0]
+            ):
+                return True
+        self._sharedvalues = None
+        return False
+
+    def _prepare_getvalue(self, readyflag: bool, value: Any) -> Any:
+        value = super()._prepare_getvalue(readyflag, value)
+        if (self._sharedvalues is not None) and self._check_shared(value):
+            value = value.view()
+            value.flags.writeable = False
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.unshare()
+        super().__setitem__(key, value)
+
     def _raise_args_and_kwargs_error(self) -> NoReturn:
         raise ValueError(
             f"For parameter {objecttools.elementphrase(self)} both positional and "
@@ -1394,6 +1636,70 @@ broadcast input array from shape (2,) into shape (2,3)
         setattr(self.fastaccess, self.name, initvalue)
         return
 
+    @classmethod
+    def __hydpy__prepare_deferredvariable__(
+        cls, fastaccess: variabletools.FastAccess
+    ) -> bool:
+        """Prepare the given `fastaccess` object for a |Parameter| object created
+        later (see option |Options.lazyvariables|).
+
+        Deferring the creation of a |Parameter| object is only possible if its
+        subclass does not modify the initialisation, connection, or updating
+        procedure, if it does not rely on temporarily modified reference weights, and
+        if there is no default value to be applied (see option
+        |Options.usedefaultvalues|):
+
+        >>> from hydpy import pub
+        >>> from hydpy.core.parametertools import FastAccessParameter, Parameter
+        >>> class Par1(Parameter):
+        ...     NDIM = 0
+        ...     TYPE = float
+        ...     INIT = 1.0
+        >>> class Par2(Parameter):
+        ...     NDIM = 1
+        ...     TYPE = float
+        >>> class Par3(Par2):
+        ...     def update(self):
+        ...         self.shape = 2
+        >>> fastaccess = FastAccessParameter()
+        >>> Par1.__hydpy__prepare_deferredvariable__(fastaccess), fastaccess.par1
+        (True, nan)
+        >>> Par2.__hydpy__prepare_deferredvariable__(fastaccess), fastaccess.par2
+        (True, None)
+        >>> Par3.__hydpy__prepare_deferredvariable__(fastaccess)
+        False
+        >>> with pub.options.usedefaultvalues(True):
+        ...     Par1.__hydpy__prepare_deferredvariable__(fastaccess)
+        False
+        """
+        if not cls._has_standard_procedures():
+            return False
+        if (cls.INIT is not None) and hydpy.pub.options.usedefaultvalues:
+            return False
+        if int(getattr(cls, "NDIM")) > 0:
+            setattr(fastaccess, cls.name, None)
+        else:
+            type_: TypeTYPE = getattr(cls, "TYPE")
+            setattr(fastaccess, cls.name, variabletools.TYPE2MISSINGVALUE[type_])
+        return True
+
+    @classmethod
+    def _has_standard_procedures(cls) -> bool:
+        """Return |True| if the subclass neither overrides any initialisation,
+        connection, or updating procedure nor relies on reference weights."""
+        overridden = (
+            cls.__init__ is not Parameter.__init__,
+            (
+                cls.__hydpy__connect_variable2subgroup__
+                is not Parameter.__hydpy__connect_variable2subgroup__
+            ),
+            cls._finalise_connections is not Parameter._finalise_connections,
+            cls.initinfo is not Parameter.initinfo,
+            cls.update is not Parameter.update,
+            cls._refweights is not None,
+        )
+        return not any(overridden)
+
     @property
     def initinfo(self) -> tuple[float | int | bool, bool]:
         """A |tuple| containing the initial value and |True| or a missing
@@ -1530,6 +1836,7 @@ parameter and a simulation time step size first.
 
     def trim(self, lower: TrimHook = None, upper: TrimHook = None) -> bool:
         """Apply function |trim| of module |variabletools|."""
+        self.unshare()
         return variabletools.trim(self, lower, upper)
 
     @classmethod
@@ -2499,6 +2806,7 @@ index parameter.
     def __setattr__(self, name: str, value: float) -> None:
         name_ = name.upper()
         if name.islower() and (name_ in (constants := self.constants)):
+            self.unshare()
             try:
                 sel_constant = constants[name_]
                 used_constants = self.mask.refindices.values
@@ -2861,6 +3169,7 @@ broadcast input array from shape (2,) into shape (366,3)
 
             >>> del pub.timegrids
         """
+        self.unshare()
         toy2values = self._toy2values_unprotected
         if not toy2values:
             self.value = 0.0
@@ -3428,6 +3737,7 @@ for axis 0 with size 1
 
     def __setattr__(self, key: str, value: float) -> None:
         if key in self.entrynames:
+            self.unshare()
             try:
                 self.values[self.entrynames.index(key)] = value
             except BaseException:
@@ -3885,6 +4195,7 @@ attribute nor a row or column related attribute named `wrong`.
 
     def __setattr__(self, key: str, values: float | VectorFloat) -> None:
         if key in self.rownames:
+            self.unshare()
             try:
                 self.values[self.rownames.index(key), :] = values
             except BaseException:
@@ -3894,6 +4205,7 @@ attribute nor a row or column related attribute named `wrong`.
                     f"`{key}`"
                 )
         elif key in self.columnnames:
+            self.unshare()
             try:
                 self.values[:, self.columnnames.index(key)] = values
             except BaseException:
@@ -3904,6 +4216,7 @@ attribute nor a row or column related attribute named `wrong`.
                 )
         elif key in self._rowcolumnmappings:
             idx, jdx = self._rowcolumnmappings[key]
+            self.unshare()
             try:
                 self.values[idx, jdx] = values
             except BaseException:
@@ -4047,6 +4360,7 @@ given, but is not.
 
     @left.setter
     def left(self, value):
+        self.unshare()
         self.values[0] = value
 
     @property
@@ -4056,6 +4370,7 @@ given, but is not.
 
     @right.setter
     def right(self, value):
+        self.unshare()
         self.values[1] = value
 
     def __repr__(self) -> str:
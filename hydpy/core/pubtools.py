@@ -1,6 +1,8 @@
 """This module provides features for handling public (global) project data."""
 
 from __future__ import annotations
+import collections.abc
+import importlib
 import types
 
 import hydpy
@@ -165,6 +167,71 @@ class TimegridsProperty(
         super().call_fset(obj, timegrids)
 
 
+class ScriptFunctions(collections.abc.MutableMapping[str, Callable[..., int | None]]):
+    """Mapping of script function names to the script functions themselves.
+
+    |ScriptFunctions| allows registering a script function via the path of its
+    defining module so that importing this module is deferred until the function is
+    requested for the first time:
+
+    >>> from hydpy.core.pubtools import ScriptFunctions
+    >>> scriptfunctions = ScriptFunctions()
+    >>> scriptfunctions["xml_replace"] = "hydpy.exe.replacetools"
+    >>> scriptfunctions["print_latest_logfile"] = "hydpy.exe.commandtools"
+    >>> scriptfunctions
+    ScriptFunctions("print_latest_logfile", "xml_replace")
+    >>> func = scriptfunctions["xml_replace"]
+    >>> func.__module__, func.__name__
+    ('hydpy.exe.replacetools', 'xml_replace')
+
+    Alternatively, you can register the actual functions:
+
+    >>> def test_function() -> None:
+    ...     pass
+    >>> scriptfunctions["test_function"] = test_function
+    >>> scriptfunctions["test_function"] is test_function
+    True
+    >>> del scriptfunctions["test_function"]
+    >>> len(scriptfunctions)
+    2
+
+    Missing entries result in the usual |KeyError|:
+
+    >>> scriptfunctions["test_function"]
+    Traceback (most recent call last):
+    ...
+    KeyError: 'test_function'
+    """
+
+    _name2function: dict[str, Callable[..., int | None] | str]
+
+    def __init__(self) -> None:
+        self._name2function = {}
+
+    def __getitem__(self, name: str) -> Callable[..., int | None]:
+        function = self._name2function[name]
+        if isinstance(function, str):
+            function = getattr(importlib.import_module(function), name)
+            self._name2function[name] = function
+        return function
+
+    def __setitem__(self, name: str, value: Callable[..., int | None] | str) -> None:
+        self._name2function[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._name2function[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._name2function)
+
+    def __len__(self) -> int:
+        return len(self._name2function)
+
+    def __repr__(self) -> str:
+        names = ", ".join(f'"{name}"' for name in sorted(self._name2function))
+        return f"ScriptFunctions({names})"
+
+
 class Pub(types.ModuleType):
     """Base class of the singleton module instance |pub|.
 
@@ -212,10 +279,10 @@ is not defined at the moment.
 
     options: optiontools.Options
     config: configutils.Config
-    scriptfunctions: dict[str, Callable[..., int | None]]
+    scriptfunctions: ScriptFunctions
 
     projectname = _ProjectnameProperty()
-    indexer = _PubProperty[indextools.Indexer, indextools.Indexer]()
+    indexer: _PubProperty[indextools.Indexer, indextools.Indexer] = _PubProperty()
     networkmanager = _PubProperty[filetools.NetworkManager, filetools.NetworkManager]()
     controlmanager = _PubProperty[filetools.ControlManager, filetools.ControlManager]()
     conditionmanager = _PubProperty[
@@ -230,7 +297,7 @@ is not defined at the moment.
     def __init__(self, name: str, doc: str | None = None) -> None:
         super().__init__(name=name, doc=doc)
         self.options = optiontools.Options()
-        self.scriptfunctions = {}
+        self.scriptfunctions = ScriptFunctions()
 
     @property
     def filemanagers(self) -> Iterator[filetools.FileManager]:
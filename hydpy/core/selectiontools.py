@@ -7,9 +7,6 @@ import copy
 import itertools
 import types
 
-import black
-import networkx
-
 import hydpy
 from hydpy.core import devicetools
 from hydpy.core import hydpytools
@@ -820,8 +817,8 @@ the "outlet device", but the given `device` value is of type `int`.
         """
         try:
             device = self._check_device(device, "outlet")
-            graph = hydpytools.create_directedgraph(self.nodes, self.elements)
-            devices = networkx.ancestors(graph, source=device)
+            graph = hydpytools.get_devicegraph(self.nodes, self.elements)
+            devices = graph.get_ancestors(device)
             devices.add(device)
             selection = Selection(
                 name=name,
@@ -972,8 +969,8 @@ required as the "inlet device", but the given `device` value is of type `int`.
         """
         try:
             device = self._check_device(device, "inlet")
-            graph = hydpytools.create_directedgraph(self.nodes, self.elements)
-            devices = networkx.descendants(graph, source=device)
+            graph = hydpytools.get_devicegraph(self.nodes, self.elements)
+            devices = graph.get_descendants(device)
             devices.add(device)
             selection = Selection(
                 name=name,
@@ -1473,6 +1470,8 @@ following error occurred: 'in <string>' requires string as left operand, not lis
             else:
                 file_.write("from hydpy import Element, Node")
             if aliases:
+                import black  # pylint: disable=import-outside-toplevel
+
                 import_aliases = ", ".join(sorted(aliases))
                 import_aliases = f"from hydpy.aliases import {import_aliases}"
                 import_aliases = black.format_str(import_aliases, mode=black.FileMode())
@@ -1492,6 +1491,99 @@ following error occurred: 'in <string>' requires string as left operand, not lis
             for element in self.elements:
                 file_.write("\n" + repr(element) + "\n")
 
+    def save_networktable(
+        self, filepath: str | None = None, write_defaultnodes: bool = True
+    ) -> None:
+        """Save the selection as a tabular network file in CSV format.
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> _, pub, TestIO = prepare_full_example_2()
+
+        Method |Selection.save_networktable| is the tabular counterpart to method
+        |Selection.save_networkfile| and supports the same arguments.  Each row of the
+        written table describes a single |Node| or |Element| object (see function
+        |devicetools.save_networktable| for further information):
+
+        >>> with TestIO():
+        ...     pub.selections.headwaters.save_networktable()
+        ...     with open("headwaters.csv") as networkfile:
+        ...         print(networkfile.read())  # doctest: +NORMALIZE_WHITESPACE
+        device,name,variable,collective,keywords,inlets,outlets,observers,receivers,\
+senders,inputs,outputs
+        Node,dill_assl,Q,,gauge,,,,,,,
+        Node,lahn_marb,Q,,gauge,,,,,,,
+        Element,land_dill_assl,,,catchment,,dill_assl,,,,,
+        Element,land_lahn_marb,,,catchment,,lahn_marb,,,,,
+        <BLANKLINE>
+
+        Text-based variables are written as they are, sequences by their alias
+        prefixed with "alias:", and |FusedVariable| objects by their name followed by
+        the aliases of their sequences.  So, a text-based variable resembling an alias
+        remains a string:
+
+        >>> from hydpy import FusedVariable, Node
+        >>> from hydpy.aliases import hland_inputs_P, hland_inputs_T, lland_inputs_Nied
+        >>> Precip = FusedVariable("Precip", hland_inputs_P, lland_inputs_Nied)
+        >>> nodes = pub.selections.headwaters.nodes
+        >>> nodes.add_device(Node("test1", variable="X"))
+        >>> nodes.add_device(Node("test2", variable=hland_inputs_T))
+        >>> nodes.add_device(Node("test3", variable=Precip))
+        >>> nodes.add_device(Node("test4", variable="hland_inputs_T"))
+        >>> with TestIO():
+        ...     pub.selections.headwaters.save_networktable(
+        ...         "test.csv", write_defaultnodes=False)
+        ...     with open("test.csv") as networkfile:
+        ...         print(networkfile.read())  # doctest: +NORMALIZE_WHITESPACE
+        device,name,variable,collective,keywords,inlets,outlets,observers,receivers,\
+senders,inputs,outputs
+        Node,test1,X,,,,,,,,,
+        Node,test2,alias:hland_inputs_T,,,,,,,,,
+        Node,test3,Precip(hland_inputs_P lland_inputs_Nied),,,,,,,,,
+        Node,test4,hland_inputs_T,,,,,,,,,
+        Element,land_dill_assl,,,catchment,,dill_assl,,,,,
+        Element,land_lahn_marb,,,catchment,,lahn_marb,,,,,
+        <BLANKLINE>
+
+        Function |devicetools.load_networktable| restores the same devices:
+
+        >>> from hydpy import Element
+        >>> from hydpy.core.devicetools import clear_registries_temporarily
+        >>> from hydpy.core.devicetools import load_networktable
+        >>> with TestIO(), clear_registries_temporarily():
+        ...     load_networktable("test.csv")
+        ...     nodes, elements = Node.extract_new(), Element.extract_new()
+        ...     nodes
+        ...     nodes.test2.variable == hland_inputs_T
+        ...     nodes.test3.variable == Precip
+        ...     nodes.test4.variable
+        ...     elements.land_dill_assl.outlets
+        ...     elements.land_dill_assl.outlets.dill_assl.entries
+        Nodes("dill_assl", "lahn_marb", "test1", "test2", "test3", "test4")
+        True
+        True
+        'hland_inputs_T'
+        Nodes("dill_assl")
+        Elements("land_dill_assl")
+
+        Marked aliases must refer to existing sequences:
+
+        >>> with TestIO(), clear_registries_temporarily():
+        ...     with open("test.csv", "w") as networkfile:
+        ...         _ = networkfile.write("device,name,variable\\n"
+        ...                               "Node,test5,alias:hland_inputs_X\\n")
+        ...     load_networktable("test.csv")
+        Traceback (most recent call last):
+        ...
+        ValueError: The alias `hland_inputs_X` does not refer to an available input or \
+output sequence.
+        """
+        nodes = self.nodes
+        if not write_defaultnodes:
+            nodes = devicetools.Nodes(node for node in nodes if node.variable != "Q")
+        if filepath is None:
+            filepath = self.name + ".csv"
+        devicetools.save_networktable(filepath, nodes, self.elements)
+
     def __len__(self) -> int:
         return len(self.nodes) + len(self.elements)
 
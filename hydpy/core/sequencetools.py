@@ -135,6 +135,10 @@ class FastAccessIOSequence(variabletools.FastAccess):
       * _seq1_length_1 (|int|): Length in the second dimension.
       * _seq1_ramflag (|bool|): Handle time series data in RAM?
       * _seq1_array (|NDArrayFloat|): Time-series data (when handled in RAM).
+      * _seq1_singleflag (|bool|): Handle the time series data in RAM with single
+        instead of double precision (only for model sequences)?
+      * _seq1_singlearray (|NDArrayFloat|): Time-series data (when handled in RAM with
+        single precision).
       * _seq1_diskflag_reading (|bool|): Read data from a NetCDF file during simulation?
       * _seq1_diskflag_writing (|bool|): Write data to a NetCDF file during simulation?
       * _seq1_ncarray (|NDArrayFloat|): An array connected with the data slice of the
@@ -171,6 +175,8 @@ class FastAccessIOSequence(variabletools.FastAccess):
                     actual = self._get_attribute(name, "inputpointer")[0]
                 elif diskflag:
                     actual = self._get_attribute(name, "ncarray")[0]
+                elif self._get_attribute(name, "singleflag", False):
+                    actual = self._get_attribute(name, "singlearray")[idx]
                 else:
                     actual = self._get_attribute(name, "array")[idx]
                 if ndim == 0:
@@ -199,7 +205,10 @@ class FastAccessIOSequence(variabletools.FastAccess):
                 except AttributeError:
                     self._get_attribute(name, "ncarray")[:] = actual
             if self._get_attribute(name, "ramflag"):
-                self._get_attribute(name, "array")[idx] = actual
+                if self._get_attribute(name, "singleflag", False):
+                    self._get_attribute(name, "singlearray")[idx] = actual
+                else:
+                    self._get_attribute(name, "array")[idx] = actual
 
 
 class FastAccessInputSequence(FastAccessIOSequence):
@@ -1977,7 +1986,7 @@ during a simulation run is not supported but tried for sequence `t` of element \
             ramflag = self.ramflag
             if allocate_ram and not ramflag:
                 self.__set_array(
-                    numpy.full(self.seriesshape, numpy.nan, dtype=config.NP_FLOAT)
+                    numpy.full(self.seriesshape, numpy.nan, dtype=self._seriesdtype)
                 )
             if ramflag and not allocate_ram:
                 del self.series
@@ -2103,7 +2112,17 @@ during a simulation run is not supported but tried for sequence `t` of element \
         )
 
     def __set_array(self, values):
-        values = numpy.asarray(values, dtype=config.NP_FLOAT)
+        values = numpy.asarray(values, dtype=self._seriesdtype)
+        self._set_seriesarray(values)
+
+    @property
+    def _seriesdtype(self) -> type[numpy.floating[Any]]:
+        return config.NP_FLOAT
+
+    def _get_seriesarray(self) -> NDArrayFloat | None:
+        return self.__hydpy__get_fastaccessattribute__("array")
+
+    def _set_seriesarray(self, values: NDArrayFloat | None) -> None:
         self.__hydpy__set_fastaccessattribute__("array", values)
 
     @property
@@ -2123,7 +2142,7 @@ during a simulation run is not supported but tried for sequence `t` of element \
         proxy = super(__class__, type(self))  # type: ignore[name-defined]
         proxy.shape.fset(self, shape)  # type: ignore[attr-defined]
         if self.ramflag:
-            values = numpy.full(self.seriesshape, numpy.nan, dtype=config.NP_FLOAT)
+            values = numpy.full(self.seriesshape, numpy.nan, dtype=self._seriesdtype)
             self.__set_array(values)
         self.update_fastaccess()
 
@@ -2141,7 +2160,7 @@ during a simulation run is not supported but tried for sequence `t` of element \
         |Timegrids.init| |Timegrid| of the global |Timegrids| object available in
         module |pub|)."""
         if self.ramflag:
-            array = numpy.asarray(self.__hydpy__get_fastaccessattribute__("array"))
+            array = numpy.asarray(self._get_seriesarray())
             return InfoArray(array, aggregation="unmodified")
         raise exceptiontools.AttributeNotReady(
             f"Sequence {objecttools.devicephrase(self)} is not requested to make any "
@@ -2152,7 +2171,7 @@ during a simulation run is not supported but tried for sequence `t` of element \
     def series(self, values: Any) -> None:
         if self.ramflag:
             self.__set_array(
-                numpy.full(self.seriesshape, values, dtype=config.NP_FLOAT)
+                numpy.full(self.seriesshape, values, dtype=self._seriesdtype)
             )
             self.check_completeness()
         else:
@@ -2164,7 +2183,7 @@ during a simulation run is not supported but tried for sequence `t` of element \
     @series.deleter
     def series(self) -> None:
         if self.ramflag:
-            self.__hydpy__set_fastaccessattribute__("array", None)
+            self._set_seriesarray(None)
             self.__hydpy__set_fastaccessattribute__("ramflag", False)
 
     @property
@@ -2985,6 +3004,123 @@ class ModelIOSequence(ModelSequence, IOSequence):
         super().__init__(subvars)
         self.node2idx = {}
 
+    def _finalise_connections(self) -> None:
+        self.__hydpy__set_fastaccessattribute__("singleflag", False)
+        super()._finalise_connections()
+
+    @propertytools.DefaultPropertyBool
+    def singleprecision(self) -> bool:
+        """True/False flag indicating if the time series data handled in RAM should
+        have single instead of double precision.
+
+        Usually, |ModelIOSequence| objects query the current flag from the
+        |SequenceManager| object available in the global |pub| module, which selects
+        double precision by default:
+
+        >>> from hydpy.core.testtools import prepare_full_example_2
+        >>> hp, pub, TestIO = prepare_full_example_2()
+        >>> model = hp.elements.land_lahn_marb.model
+        >>> t = model.sequences.inputs.t
+        >>> t.singleprecision
+        False
+        >>> t.series.dtype
+        dtype('float64')
+        >>> hp.simulate()
+        >>> from hydpy import print_vector
+        >>> print_vector(model.sequences.fluxes.qt.series)
+        9.64767, 8.513649, 7.777628, 7.343314
+
+        Single precision halves the memory required for the time series data, which
+        can be decisive for long simulation periods with high temporal resolutions.
+        |ModelIOSequence| objects select the precision when (re)allocating their
+        time series arrays.  We set the flag for |hland_inputs.T| individually and
+        for all flux sequences via the |SequenceManager.singleprecision| option:
+
+        >>> t.singleprecision = True
+        >>> t.series = t.series
+        >>> t.series.dtype
+        dtype('float32')
+        >>> fluxes = model.sequences.fluxes
+        >>> with pub.sequencemanager.singleprecision(True):
+        ...     fluxes.prepare_series(allocate_ram=False)
+        ...     fluxes.prepare_series(allocate_ram=True)
+        >>> fluxes.qt.series.dtype
+        dtype('float32')
+
+        During simulation runs, the models still calculate with double precision and
+        only convert the values when reading from or writing to the time series
+        arrays.  Hence, the results agree with the original ones within the accuracy
+        of single precision:
+
+        >>> with TestIO():
+        ...     hp.load_conditions()
+        >>> hp.simulate()
+        >>> from hydpy import round_
+        >>> round_(model.sequences.fluxes.qt.series, 4)
+        9.6477, 8.5136, 7.7776, 7.3433
+
+        Writing such time series to NetCDF files results in data variables of type
+        `f4`, and reading them does not require intermediate arrays of double
+        precision:
+
+        >>> from hydpy.core.netcdftools import netcdf4
+        >>> sm = pub.sequencemanager
+        >>> with TestIO(), sm.filetype("nc"), sm.netcdfwriting():
+        ...     fluxes.qt.save_series()
+        >>> filepath = "HydPy-H-Lahn/series/default/hland_96_flux_qt.nc"
+        >>> with TestIO(), netcdf4.Dataset(filepath, "r") as ncfile:
+        ...     ncfile["hland_96_flux_qt"].dtype
+        dtype('float32')
+        >>> fluxes.qt.series = 0.0
+        >>> with TestIO(), sm.filetype("nc"), sm.netcdfreading():
+        ...     fluxes.qt.load_series()
+        >>> round_(fluxes.qt.series, 4)
+        9.6477, 8.5136, 7.7776, 7.3433
+
+        Use the `del` statement to reset the object-specific setting:
+
+        >>> del t.singleprecision
+        >>> t.singleprecision
+        False
+        >>> t.series = t.series
+        >>> t.series.dtype
+        dtype('float64')
+
+        If neither a specific definition nor a |SequenceManager| object is available,
+        |ModelIOSequence| objects fall back to double precision:
+
+        >>> del pub.sequencemanager
+        >>> t.series = t.series
+        >>> t.series.dtype
+        dtype('float64')
+        """
+        return bool(hydpy.pub.sequencemanager.singleprecision)
+
+    def _query_singleprecision(self) -> bool:
+        # |ModelIOSequence.singleprecision| is not ready if neither a specific
+        # definition nor a |SequenceManager| object is available
+        try:
+            return bool(self.singleprecision)
+        except exceptiontools.AttributeNotReady:
+            return False
+
+    @property
+    def _seriesdtype(self) -> type[numpy.floating[Any]]:
+        return numpy.float32 if self._query_singleprecision() else config.NP_FLOAT
+
+    def _get_seriesarray(self) -> NDArrayFloat | None:
+        if self.__hydpy__get_fastaccessattribute__("singleflag"):
+            return self.__hydpy__get_fastaccessattribute__("singlearray")
+        return self.__hydpy__get_fastaccessattribute__("array")
+
+    def _set_seriesarray(self, values: NDArrayFloat | None) -> None:
+        single = (values is not None) and (values.dtype == numpy.float32)
+        self.__hydpy__set_fastaccessattribute__("singleflag", single)
+        self.__hydpy__set_fastaccessattribute__("array", None if single else values)
+        self.__hydpy__set_fastaccessattribute__(
+            "singlearray", values if single else None
+        )
+
 
 class BaseLinkInputSequence(ModelIOSequence):
     """Base class for |LinkSequence| and |InputSequence|."""
@@ -3803,6 +3939,116 @@ changed, but this was attempted for element `?`.
         prop.fset(self, shape)  # type: ignore[attr-defined]
 
 
+class LogSequenceCircular(LogSequence):
+    """Base class for log sequences that handle their memory as a circular buffer.
+
+    Shifting all memorised values by one position in each simulation step can become
+    costly for long memories.  Hence, |LogSequenceCircular| handles its memory, which
+    must lie on the last axis, as a circular buffer.  Model methods do not shift any
+    values but move the buffer's "head", stored by the `fastaccess` attribute
+    `_[name]_head`, and access the logical position `jdx` via the physical position
+    `(head + jdx) % length` instead.  We take sequence |arma_logs.LogIn| of base model
+    |arma| as an example:
+
+    >>> from hydpy.models.arma import *
+    >>> parameterstep()
+    >>> logs.login.shape = 2, 3
+    >>> logs.login = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    >>> fastaccess = logs.fastaccess
+    >>> fastaccess._login_head
+    0
+
+    We move the head manually, as model methods would do it:
+
+    >>> fastaccess._login_head = 2
+    >>> from hydpy import print_matrix
+    >>> print_matrix(fastaccess.login)
+    | 1.0, 2.0, 3.0 |
+    | 4.0, 5.0, 6.0 |
+
+    The user does not need to care about the buffer's state, as querying the values
+    of a |LogSequenceCircular| object first rotates the buffer back into
+    chronological order and resets the head.  So, one can, for example, write and
+    read condition files as usual:
+
+    >>> logs.login
+    login([[3.0, 1.0, 2.0],
+           [6.0, 4.0, 5.0]])
+    >>> fastaccess._login_head
+    0
+    >>> print_matrix(fastaccess.login)
+    | 3.0, 1.0, 2.0 |
+    | 6.0, 4.0, 5.0 |
+
+    Model methods find the buffer's length in the `fastaccess` attribute
+    `_[name]_length_[ndim-1]`:
+
+    >>> fastaccess._login_length_1
+    3
+
+    Assigning new values or a new shape also resets the head:
+
+    >>> fastaccess._login_head = 1
+    >>> logs.login = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    >>> fastaccess._login_head
+    0
+    >>> fastaccess._login_head = 1
+    >>> logs.login.shape = 1, 2
+    >>> fastaccess._login_head
+    0
+    >>> fastaccess._login_length_1
+    2
+    """
+
+    def __hydpy__connect_variable2subgroup__(self) -> None:
+        super().__hydpy__connect_variable2subgroup__()
+        self.__hydpy__set_fastaccessattribute__("head", 0)
+
+    def _rotate(self) -> None:
+        head = self.__hydpy__get_fastaccessattribute__("head", 0)
+        if head:
+            values = numpy.asarray(getattr(self.fastaccess, self.name))
+            values[:] = numpy.roll(values, -head, axis=-1)
+            self.__hydpy__set_fastaccessattribute__("head", 0)
+
+    @property
+    def value(self) -> Any:
+        """The memorised values in chronological order.
+
+        See the main documentation on class |LogSequenceCircular| for further
+        information.
+        """
+        self._rotate()
+        prop = super(__class__, type(self)).value  # type: ignore[name-defined]
+        return prop.fget(self)  # type: ignore[attr-defined]
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        prop = super(__class__, type(self)).value  # type: ignore[name-defined]
+        prop.fset(self, value)  # type: ignore[attr-defined]
+        self.__hydpy__set_fastaccessattribute__("head", 0)
+
+    @property
+    def shape(self) -> ShapeHookGet:
+        """The shape of the buffer.
+
+        See the main documentation on class |LogSequenceCircular| for further
+        information.
+        """
+        return super().shape
+
+    @shape.setter
+    def shape(self, shape: ShapeHookSet) -> None:
+        prop = super(__class__, type(self)).shape  # type: ignore[name-defined]
+        prop.fset(self, shape)  # type: ignore[attr-defined]
+        length = 1
+        for idx in range(self.NDIM):
+            length *= self.shape[idx]
+            self.__hydpy__set_fastaccessattribute__(f"length_{idx}", self.shape[idx])
+        self.__hydpy__set_fastaccessattribute__("length", length)
+        self.__hydpy__set_fastaccessattribute__("head", 0)
+
+
 class AideSequence(ModelSequence):
     """Base class for aide sequences of |Model| objects.
 
@@ -7,7 +7,6 @@ import queue
 import sys
 import threading
 
-import networkx
 import numpy
 
 import hydpy
@@ -118,13 +117,13 @@ class Parallelisability:
         self, nodes: devicetools.Nodes, elements: devicetools.Elements
     ) -> None:
 
-        graph = hydpytools.create_directedgraph(nodes, elements)
+        graph = hydpytools.get_devicegraph(nodes, elements)
         sequential_elements: set[devicetools.Element] = set()
         for element in elements:
             if any(n.deploymode in ("newsim", "obs_newsim") for n in element.receivers):
                 if element not in sequential_elements:
                     sequential_elements.add(element)
-                    descendants = networkx.descendants(graph, element)
+                    descendants = graph.get_descendants(element)
                     sequential_elements.update(
                         e for e in descendants if isinstance(e, devicetools.Element)
                     )
@@ -220,7 +219,15 @@ class Queue(queue.LifoQueue[devicetools.NodeOrElement]):
         cls, *, nodes: devicetools.Nodes, elements: devicetools.Elements
     ) -> Self:
         """Create a new |Queue| instance and determine its members from the given
-        (parallelisable) devices."""
+        (parallelisable) devices.
+
+        |Queue.from_devices| sorts the |Queue.starters| by their downstream depth (the
+        number of devices along their longest downstream path, see
+        |DeviceGraph.get_downstreamdepths|) so that, due to the "Last In - First Out"
+        strategy, the threads start with the devices at the beginning of the longest
+        dependency chains.  Note that the downstream depth is smaller than the number of
+        all downstream devices if the network branches below the respective starter.
+        """
 
         upstream2downstream: dict[
             devicetools.NodeOrElement, list[devicetools.NodeOrElement]
@@ -228,8 +235,9 @@ class Queue(queue.LifoQueue[devicetools.NodeOrElement]):
         successors2starter: list[tuple[int, devicetools.NodeOrElement]] = []
         dependencies: dict[devicetools.NodeOrElement, int] = {}
 
-        graph = hydpytools.create_directedgraph(nodes, elements)
-        successors = networkx.dfs_successors
+        graph = hydpytools.get_devicegraph(nodes, elements)
+        depths = graph.get_downstreamdepths()
+        device2index = graph.device2index
 
         forwards_newsim = "newsim", "obs_newsim"
         receives_newsim = "newsim", "obs", "obs_newsim", "obs_bi"
@@ -244,7 +252,7 @@ class Queue(queue.LifoQueue[devicetools.NodeOrElement]):
             if nmb_in:
                 dependencies[e] = nmb_in
             else:
-                successors2starter.append((len(successors(graph, e)), e))
+                successors2starter.append((depths[device2index[e]], e))
             upstream2downstream[e] = [
                 n
                 for n in itertools.chain(e.outlets, e.senders, e.outputs)
@@ -256,7 +264,7 @@ class Queue(queue.LifoQueue[devicetools.NodeOrElement]):
                 if nmb_in := sum(e in elements for e in n.entries):
                     dependencies[n] = nmb_in
                 else:
-                    successors2starter.append((len(successors(graph, n)), n))
+                    successors2starter.append((depths[device2index[n]], n))
                 if n.deploymode in forwards_newsim:
                     upstream2downstream[n] = list(e for e in n.exits if e in elements)
 
@@ -2309,6 +2309,14 @@ required, but the given array consist of 12 entries/rows only.
         >>> round_(series[13, :])
         1.0, 0.0, 0.0, 0.0
 
+        Arrays of single precision keep their data type, while all others are
+        converted to double precision:
+
+        >>> timegrid.array2series(array.astype(numpy.float32)).dtype
+        dtype('float32')
+        >>> timegrid.array2series(array.astype(int)).dtype
+        dtype('float64')
+
         Inappropriate array objects result in error messages like the following:
 
         >>> timegrid.array2series([[1, 2], [3]])
@@ -2330,7 +2338,9 @@ timegrid and the given array must be equal, but the length of the timegrid objec
 `4` and the length of the array object is `2`.
         """
         try:
-            array = numpy.asarray(array, dtype=config.NP_FLOAT)
+            array = numpy.asarray(array)
+            if array.dtype != numpy.float32:
+                array = numpy.asarray(array, dtype=config.NP_FLOAT)
         except BaseException:
             objecttools.augment_excmessage(
                 "While trying to prefix timegrid information to the given array"
@@ -2344,7 +2354,7 @@ timegrid and the given array must be equal, but the length of the timegrid objec
             )
         shape = list(array.shape)
         shape[0] += 13
-        series = numpy.full(shape, numpy.nan)
+        series = numpy.full(shape, numpy.nan, dtype=array.dtype)
         slices = [slice(0, 13)]
         subshape = [13]
         for dummy in range(1, series.ndim):
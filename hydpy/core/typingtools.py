@@ -16,6 +16,7 @@ from collections.abc import (
 from contextlib import AbstractContextManager
 from typing import (
     Any,
+    BinaryIO,
     cast,
     ClassVar,
     Concatenate,
@@ -253,6 +254,7 @@ class CySubstepModelProtocol(CyModelProtocol):
 
 SeriesFileType = Literal["npy", "asc", "nc"]
 SeriesAggregationType = Literal["none", "mean"]
+SeriesAggregatorType = Literal["mean", "sum"]
 SeriesConventionType = Literal["model-specific", "HydPy"]
 
 l1: Literal[1] = 1
@@ -284,6 +286,7 @@ __all__ = [
     "ArrayFloat",
     "ArrayFloatFlex",
     "assert_never",
+    "BinaryIO",
     "Callable",
     "cast",
     "Concatenate",
@@ -349,6 +352,7 @@ __all__ = [
     "ShapeHookSet",
     "Self",
     "SeriesAggregationType",
+    "SeriesAggregatorType",
     "SeriesConventionType",
     "SeriesFileType",
     "Sequence",
@@ -1147,6 +1147,23 @@ var != [nan, nan, nan], var >= [nan, nan, nan], var > [nan, nan, nan]
         self.fastaccess = self.subvars.fastaccess
         self._finalise_connections()
 
+    @classmethod
+    def __hydpy__prepare_deferredvariable__(cls, fastaccess: FastAccess) -> bool:
+        """Prepare the given `fastaccess` object as method
+        `__hydpy__connect_variable2subgroup__` would do, but without creating a new
+        |Variable| object, and return |True|, or return |False| if the respective
+        subclass does not support this (see option |Options.lazyvariables|).
+
+        By default, |Variable| subclasses do not support deferred creation.  Only
+        |Parameter| overrides this method, so sequences are always created immediately
+        (they must allocate their series and connect to their devices right away):
+
+        >>> from hydpy.core.variabletools import FastAccess, Variable
+        >>> Variable.__hydpy__prepare_deferredvariable__(FastAccess())
+        False
+        """
+        return False
+
     def _finalise_connections(self) -> None:
         """A hook method, called at the end of method
         `__hydpy__connect_variable2subgroup__` for initialising
@@ -2468,11 +2485,67 @@ error occurred: 5 values are assigned to the scalar variable `testvar`.
     testvar
     >>> len(subvars)
     1
+
+    When preparing large projects, the |Variable| objects themselves can require much
+    memory, even if their data lives in the (possibly cythonized) `fastaccess` object.
+    After enabling option |Options.lazyvariables|, |SubVariables| objects still
+    initialise the `fastaccess` data of all variables but create the |Variable| objects
+    only when first accessed, as long as the individual |Variable| subclass can
+    prepare its `fastaccess` data based on its class attributes alone (see method
+    `__hydpy__prepare_deferredvariable__`).  Only simple |Parameter| subclasses
+    support this, so we demonstrate it with a parameter-like test class:
+
+    >>> from hydpy import pub
+    >>> class TestPar(TestVar):
+    ...     @classmethod
+    ...     def __hydpy__prepare_deferredvariable__(cls, fastaccess):
+    ...         setattr(fastaccess, cls.name, 0.0)
+    ...         return True
+    >>> class SubPars(SubVars):
+    ...     CLASSES = (TestPar,)
+    >>> with pub.options.lazyvariables(True):
+    ...     subpars = SubPars("test")
+    >>> subpars.fastaccess.testpar
+    0.0
+    >>> len(subpars), subpars.names
+    (1, frozenset({'testpar'}))
+    >>> subpars._name2variable
+    {}
+
+    Each first access to a variable by attribute or item access creates and memorises
+    it without modifying its `fastaccess` data:
+
+    >>> subpars.fastaccess.testpar = 2.0
+    >>> subpars.testpar.fastaccess is subpars.fastaccess
+    True
+    >>> list(subpars._name2variable)
+    ['testpar']
+    >>> subpars.testpar is subpars["testpar"]
+    True
+    >>> subpars.fastaccess.testpar
+    2.0
+    >>> subpars.testpar = 3.0
+    >>> subpars.testpar
+    testpar(3.0)
+
+    Iterating over a |SubVariables| object creates all deferred variables, too.
+    Method |SubVariables.iter_created| allows for bulk operations that should only
+    consider the already created ones:
+
+    >>> with pub.options.lazyvariables(True):
+    ...     subpars = SubPars("test")
+    >>> [par.name for par in subpars.iter_created()]
+    []
+    >>> [par.name for par in subpars]
+    ['testpar']
+    >>> [par.name for par in subpars.iter_created()]
+    ['testpar']
     """
 
     CLASSES: tuple[type[TypeVariable_co], ...] = ()
     vars: TypeGroup_co
     _name2variable: dict[str, TypeVariable_co] = {}
+    _name2deferred: dict[str, type[TypeVariable_co]] = {}
     fastaccess: TypeFastAccess_co
     _cls_fastaccess: type[TypeFastAccess_co] | None = None
     _CLS_FASTACCESS_PYTHON: ClassVar[type[TypeFastAccess_co]]
@@ -2487,10 +2560,16 @@ error occurred: 5 values are assigned to the scalar variable `testvar`.
             self._cls_fastaccess = cls_fastaccess
         self._init_fastaccess()
         self._name2variable = {}
+        self._name2deferred = {}
+        lazy = hydpy.pub.options.lazyvariables
         for cls in self.CLASSES:
-            variable = cls(self)
-            self._name2variable[variable.name] = variable
-            variable.__hydpy__connect_variable2subgroup__()
+            prepare = getattr(cls, "__hydpy__prepare_deferredvariable__", None)
+            if lazy and (prepare is not None) and prepare(self.fastaccess):
+                self._name2deferred[cls.name] = cls
+            else:
+                variable = cls(self)
+                self._name2variable[variable.name] = variable
+                variable.__hydpy__connect_variable2subgroup__()
 
     @property
     @abc.abstractmethod
@@ -2500,7 +2579,7 @@ error occurred: 5 values are assigned to the scalar variable `testvar`.
     @functools.cached_property
     def names(self) -> frozenset[str]:
         """The names of all handled variables."""
-        return frozenset(self._name2variable)
+        return frozenset(cls.name for cls in self.CLASSES)
 
     def _init_fastaccess(self) -> None:
         """Create a `fastaccess` attribute and build the required connections to the
@@ -2510,33 +2589,56 @@ error occurred: 5 values are assigned to the scalar variable `testvar`.
         else:
             self.fastaccess = self._cls_fastaccess()
 
+    def _get_variable(self, name: str) -> TypeVariable_co | None:
+        """Return the requested variable or |None| if not available.
+
+        Method |SubVariables._get_variable| creates deferred variables (see option
+        |Options.lazyvariables|) and connects them to the already prepared `fastaccess`
+        object.
+        """
+        variable = self._name2variable.get(name)
+        if (variable is None) and (name in self._name2deferred):
+            variable = self._name2deferred.pop(name)(self)
+            variable.fastaccess = self.fastaccess
+            self._name2variable[name] = variable
+        return variable
+
+    def iter_created(self) -> Iterator[TypeVariable_co]:
+        """Iterate through all variables, except those not created so far (see option
+        |Options.lazyvariables|).
+
+        See the main documentation on class |SubVariables| for an example.
+        """
+        for cls in self.CLASSES:
+            if (variable := self._name2variable.get(cls.name)) is not None:
+                yield variable
+
     def __getitem__(self, item: str) -> TypeVariable_co:
-        try:
-            return self._name2variable[item]
-        except KeyError:
+        if (variable := self._get_variable(item)) is None:
             raise AttributeError(
                 f"Collection object {objecttools.devicephrase(self)} does not handle "
                 f"a variable named `{item}`."
-            ) from None
+            )
+        return variable
 
     def __getattr__(self, name: str) -> TypeVariable_co:
-        try:
-            return self._name2variable[name]
-        except KeyError:
+        if (variable := self._get_variable(name)) is None:
             raise AttributeError(
                 f"Collection object {objecttools.devicephrase(self)} does neither "
                 f"handle a variable nor another attribute named {name}."
-            ) from None
+            )
+        return variable
 
     def __setattr__(self, name: str, value: object) -> None:
-        variable = self._name2variable.get(name)
+        variable = self._get_variable(name)
         if variable is None:
             super().__setattr__(name, value)
         else:
             variable.value = value
 
     def __iter__(self) -> Iterator[TypeVariable_co]:
-        yield from self._name2variable.values()
+        for cls in self.CLASSES:
+            yield self[cls.name]
 
     def __len__(self) -> int:
         return len(self.CLASSES)
@@ -2569,7 +2671,7 @@ error occurred: 5 values are assigned to the scalar variable `testvar`.
         >>> sorted(set(dir(testsubvars)) - set(object.__dir__(testsubvars)))
         ['testvar']
         """
-        return cast(list[str], super().__dir__()) + list(self._name2variable.keys())
+        return cast(list[str], super().__dir__()) + [c.name for c in self.CLASSES]
 
 
 def to_repr(self: Variable, values, brackets: bool = False) -> str:
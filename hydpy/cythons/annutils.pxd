@@ -16,6 +16,14 @@ cdef class ANN:
     cpdef inline void calculate_values(self) noexcept nogil
     cpdef inline void calculate_derivatives(self, int idx_input) noexcept nogil
 
+    # batch evaluation:
+
+    cpdef void calculate_values_batch(self, double[:, :] inputs, double[:, :] outputs)
+    cpdef void calculate_derivatives_batch(self, double[:, :] inputs, double[:, :, :] derivatives)
+    cdef void apply_lastrow(self, double[:, :] inputs) noexcept nogil
+    cdef void calculate_values_matrix(self, double[:, :] inputs, double[:, :] outputs, double[:, :, :] neurons) noexcept nogil
+    cdef void calculate_derivatives_matrix(self, double[:, :] inputs, double[:, :, :] derivatives, double[:, :, :] neurons, double[:, :, :, :] neuron_derivatives) noexcept nogil
+
     # algorithm-specific requirements:
 
     cdef public int nmb_layers
@@ -31,3 +39,4 @@ cdef class ANN:
 
     cdef inline void apply_activationfunction(self, int idx_layer, int idx_neuron, double input_) noexcept nogil
     cdef inline double apply_derivativefunction(self, int idx_layer, int idx_neuron, double inner) noexcept nogil
+    cdef inline double calculate_activation(self, int idx_layer, int idx_neuron, double inner, double input_) noexcept nogil
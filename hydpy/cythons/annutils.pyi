@@ -13,6 +13,13 @@ class ANN:
     def calculate_derivatives(  # pylint: disable=unused-argument
         self, idx: int, /
     ) -> None: ...
+    # batch evaluation:
+    def calculate_values_batch(  # pylint: disable=unused-argument
+        self, inputs: MatrixFloat, outputs: MatrixFloat
+    ) -> None: ...
+    def calculate_derivatives_batch(  # pylint: disable=unused-argument
+        self, inputs: MatrixFloat, derivatives: TensorFloat
+    ) -> None: ...
     # algorithm-specific requirements:
     nmb_layers: int
     nmb_neurons: VectorInt
@@ -3,6 +3,8 @@ Python module |anntools|.
 """
 
 # import...
+import numpy
+
 from hydpy.cythons.autogen cimport smoothutils
 # ...cimport
 cimport cython
@@ -118,3 +120,215 @@ cdef class ANN:
                     self.weights_output[idx_neuron2, idx_output] *
                     self.neuron_derivatives[self.nmb_layers-1, idx_neuron2])
             self.output_derivatives[idx_output] = der1 * der2
+
+    cdef inline double calculate_activation(self, int idx_layer, int idx_neuron, double inner, double input_) noexcept nogil:
+        if self.activation[idx_layer, idx_neuron] == 1:
+            return smoothutils.smooth_logistic1(inner, 1.0)
+        if self.activation[idx_layer, idx_neuron] == 2:
+            return input_ * smoothutils.smooth_logistic1(inner, 1.0)
+        return inner
+
+    cpdef void calculate_values_batch(self, double[:, :] inputs, double[:, :] outputs):
+        cdef double[:, :, :] neurons = numpy.empty(
+            (2, self.neurons.shape[1], inputs.shape[0]), dtype=float
+        )
+        with nogil:
+            self.calculate_values_matrix(inputs, outputs, neurons)
+            self.apply_lastrow(inputs)
+
+    cpdef void calculate_derivatives_batch(self, double[:, :] inputs, double[:, :, :] derivatives):
+        cdef double[:, :, :] neurons = numpy.empty(
+            (2, self.neurons.shape[1], inputs.shape[0]), dtype=float
+        )
+        cdef double[:, :, :, :] neuron_derivatives = numpy.empty(
+            (2, self.nmb_inputs, self.neurons.shape[1], inputs.shape[0]), dtype=float
+        )
+        with nogil:
+            self.calculate_derivatives_matrix(
+                inputs, derivatives, neurons, neuron_derivatives
+            )
+            self.apply_lastrow(inputs)
+
+    cdef void apply_lastrow(self, double[:, :] inputs) noexcept nogil:
+        cdef int idx_input
+        cdef int idx_point = inputs.shape[0] - 1
+        if idx_point >= 0:
+            for idx_input in range(self.nmb_inputs):
+                self.inputs[idx_input] = inputs[idx_point, idx_input]
+            self.calculate_values()
+
+    cdef void calculate_values_matrix(self, double[:, :] inputs, double[:, :] outputs, double[:, :, :] neurons) noexcept nogil:
+        # `neurons` stores the neuron values of all points (last axis) for the current
+        # (`idx_new`) and the previous (`idx_old`) layer.
+        cdef int nmb_points = inputs.shape[0]
+        cdef int idx_point, idx_input, idx_neuron1, idx_neuron2, idx_output, idx_layer
+        cdef int idx_new, idx_old
+        cdef double weight, input_
+
+        for idx_neuron1 in range(self.nmb_neurons[0]):
+            for idx_point in range(nmb_points):
+                neurons[0, idx_neuron1, idx_point] = \
+                    self.intercepts_hidden[0, idx_neuron1]
+        for idx_input in range(self.nmb_inputs):
+            for idx_neuron1 in range(self.nmb_neurons[0]):
+                weight = self.weights_input[idx_input, idx_neuron1]
+                for idx_point in range(nmb_points):
+                    neurons[0, idx_neuron1, idx_point] += \
+                        weight * inputs[idx_point, idx_input]
+        for idx_neuron1 in range(self.nmb_neurons[0]):
+            for idx_point in range(nmb_points):
+                if idx_neuron1 < self.nmb_inputs:
+                    input_ = inputs[idx_point, idx_neuron1]
+                else:
+                    input_ = nan
+                neurons[0, idx_neuron1, idx_point] = self.calculate_activation(
+                    0, idx_neuron1, neurons[0, idx_neuron1, idx_point], input_
+                )
+
+        for idx_layer in range(1, self.nmb_layers):
+            idx_new = idx_layer % 2
+            idx_old = 1 - idx_new
+            for idx_neuron1 in range(self.nmb_neurons[idx_layer]):
+                for idx_point in range(nmb_points):
+                    neurons[idx_new, idx_neuron1, idx_point] = \
+                        self.intercepts_hidden[idx_layer, idx_neuron1]
+            for idx_neuron2 in range(self.nmb_neurons[idx_layer-1]):
+                for idx_neuron1 in range(self.nmb_neurons[idx_layer]):
+                    weight = self.weights_hidden[idx_layer-1, idx_neuron2, idx_neuron1]
+                    for idx_point in range(nmb_points):
+                        neurons[idx_new, idx_neuron1, idx_point] += \
+                            weight * neurons[idx_old, idx_neuron2, idx_point]
+            for idx_neuron1 in range(self.nmb_neurons[idx_layer]):
+                for idx_point in range(nmb_points):
+                    if idx_neuron1 < self.nmb_neurons[idx_layer-1]:
+                        input_ = neurons[idx_old, idx_neuron1, idx_point]
+                    else:
+                        input_ = nan
+                    neurons[idx_new, idx_neuron1, idx_point] = \
+                        self.calculate_activation(
+                            idx_layer,
+                            idx_neuron1,
+                            neurons[idx_new, idx_neuron1, idx_point],
+                            input_,
+                        )
+
+        idx_new = (self.nmb_layers - 1) % 2
+        for idx_output in range(self.nmb_outputs):
+            for idx_point in range(nmb_points):
+                outputs[idx_point, idx_output] = self.intercepts_output[idx_output]
+        for idx_neuron2 in range(self.nmb_neurons[self.nmb_layers-1]):
+            for idx_output in range(self.nmb_outputs):
+                weight = self.weights_output[idx_neuron2, idx_output]
+                for idx_point in range(nmb_points):
+                    outputs[idx_point, idx_output] += \
+                        weight * neurons[idx_new, idx_neuron2, idx_point]
+
+    cdef void calculate_derivatives_matrix(self, double[:, :] inputs, double[:, :, :] derivatives, double[:, :, :] neurons, double[:, :, :, :] neuron_derivatives) noexcept nogil:
+        # `neuron_derivatives` stores the derivatives of the neuron values of all points
+        # (last axis) with respect to all inputs (second axis) for the current
+        # (`idx_new`) and the previous (`idx_old`) layer.
+        cdef int nmb_points = inputs.shape[0]
+        cdef int idx_point, idx_input, idx_neuron1, idx_neuron2, idx_output, idx_layer
+        cdef int idx_new, idx_old
+        cdef double weight, inner, input_, value
+        cdef double der1   # outer derivative
+        cdef double der2   # inner derivative
+
+        for idx_neuron1 in range(self.nmb_neurons[0]):
+            for idx_point in range(nmb_points):
+                neurons[0, idx_neuron1, idx_point] = \
+                    self.intercepts_hidden[0, idx_neuron1]
+        for idx_input in range(self.nmb_inputs):
+            for idx_neuron1 in range(self.nmb_neurons[0]):
+                weight = self.weights_input[idx_input, idx_neuron1]
+                for idx_point in range(nmb_points):
+                    neurons[0, idx_neuron1, idx_point] += \
+                        weight * inputs[idx_point, idx_input]
+        for idx_neuron1 in range(self.nmb_neurons[0]):
+            for idx_point in range(nmb_points):
+                inner = neurons[0, idx_neuron1, idx_point]
+                if idx_neuron1 < self.nmb_inputs:
+                    input_ = inputs[idx_point, idx_neuron1]
+                else:
+                    input_ = nan
+                value = self.calculate_activation(0, idx_neuron1, inner, input_)
+                neurons[0, idx_neuron1, idx_point] = value
+                der1 = self.apply_derivativefunction(0, idx_neuron1, inner)
+                for idx_input in range(self.nmb_inputs):
+                    der2 = self.weights_input[idx_input, idx_neuron1]
+                    neuron_derivatives[0, idx_input, idx_neuron1, idx_point] = \
+                        der1 * der2
+                    if self.activation[0, idx_neuron1] == 2:
+                        neuron_derivatives[0, idx_input, idx_neuron1, idx_point] *= \
+                            input_
+                        if idx_neuron1 == idx_input:
+                            neuron_derivatives[
+                                0, idx_input, idx_neuron1, idx_point
+                            ] += value / input_
+
+        for idx_layer in range(1, self.nmb_layers):
+            idx_new = idx_layer % 2
+            idx_old = 1 - idx_new
+            for idx_neuron1 in range(self.nmb_neurons[idx_layer]):
+                for idx_point in range(nmb_points):
+                    neurons[idx_new, idx_neuron1, idx_point] = \
+                        self.intercepts_hidden[idx_layer, idx_neuron1]
+                for idx_input in range(self.nmb_inputs):
+                    for idx_point in range(nmb_points):
+                        neuron_derivatives[
+                            idx_new, idx_input, idx_neuron1, idx_point
+                        ] = 0.0
+            for idx_neuron2 in range(self.nmb_neurons[idx_layer-1]):
+                for idx_neuron1 in range(self.nmb_neurons[idx_layer]):
+                    weight = self.weights_hidden[idx_layer-1, idx_neuron2, idx_neuron1]
+                    for idx_point in range(nmb_points):
+                        neurons[idx_new, idx_neuron1, idx_point] += \
+                            weight * neurons[idx_old, idx_neuron2, idx_point]
+                    for idx_input in range(self.nmb_inputs):
+                        for idx_point in range(nmb_points):
+                            neuron_derivatives[
+                                idx_new, idx_input, idx_neuron1, idx_point
+                            ] += weight * neuron_derivatives[
+                                idx_old, idx_input, idx_neuron2, idx_point
+                            ]
+            for idx_neuron1 in range(self.nmb_neurons[idx_layer]):
+                for idx_point in range(nmb_points):
+                    inner = neurons[idx_new, idx_neuron1, idx_point]
+                    if idx_neuron1 < self.nmb_neurons[idx_layer-1]:
+                        input_ = neurons[idx_old, idx_neuron1, idx_point]
+                    else:
+                        input_ = nan
+                    value = self.calculate_activation(
+                        idx_layer, idx_neuron1, inner, input_
+                    )
+                    neurons[idx_new, idx_neuron1, idx_point] = value
+                    der1 = self.apply_derivativefunction(idx_layer, idx_neuron1, inner)
+                    for idx_input in range(self.nmb_inputs):
+                        der2 = neuron_derivatives[
+                            idx_new, idx_input, idx_neuron1, idx_point
+                        ]
+                        neuron_derivatives[
+                            idx_new, idx_input, idx_neuron1, idx_point
+                        ] = der1 * der2
+                        if self.activation[idx_layer, idx_neuron1] == 2:
+                            neuron_derivatives[
+                                idx_new, idx_input, idx_neuron1, idx_point
+                            ] *= input_
+                            neuron_derivatives[
+                                idx_new, idx_input, idx_neuron1, idx_point
+                            ] += value / input_ * neuron_derivatives[
+                                idx_old, idx_input, idx_neuron1, idx_point
+                            ]
+
+        idx_new = (self.nmb_layers - 1) % 2
+        for idx_input in range(self.nmb_inputs):
+            for idx_output in range(self.nmb_outputs):
+                for idx_point in range(nmb_points):
+                    derivatives[idx_point, idx_input, idx_output] = 0.0
+                for idx_neuron2 in range(self.nmb_neurons[self.nmb_layers-1]):
+                    weight = self.weights_output[idx_neuron2, idx_output]
+                    for idx_point in range(nmb_points):
+                        derivatives[idx_point, idx_input, idx_output] += \
+                            weight * neuron_derivatives[
+                                idx_new, idx_input, idx_neuron2, idx_point
+                            ]